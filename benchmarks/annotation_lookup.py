@@ -0,0 +1,163 @@
+"""
+Compare parsing a synthetic hour-long two speaker TextGrid when super annotations and transcriptions are found by
+scanning windows of annotations against the sorted array index of annotation types.
+
+Usage: python annotation_lookup.py [duration in seconds]
+"""
+import sys
+import os
+import time
+import random
+import tempfile
+
+base = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, base)
+
+import polyglotdb.io.parsers.base as parser_base
+from polyglotdb.io import inspect_mfa
+from polyglotdb.io.types.standardized import PGAnnotationType
+
+
+class WindowedAnnotationType(PGAnnotationType):
+    def optimize_lookups(self):
+        if getattr(self, '_lookup_dict', None) is not None:
+            return
+        self._lookup_dict = None
+        self._list = sorted(self._list, key=lambda x: x.begin)
+        if len(self._list) > 1000:
+            self._lookup_dict = {}
+            cur = 0
+            while cur < len(self._list):
+                self._lookup_dict[cur] = self._list[cur].begin
+                cur += 1000
+
+    def add(self, annotation):
+        self._lookup_dict = None
+        super(WindowedAnnotationType, self).add(annotation)
+
+    def lookup(self, timepoint, speaker=None):
+        if getattr(self, '_lookup_dict', None) is not None:
+            prev = 0
+            for ind, t in sorted(self._lookup_dict.items()):
+                if timepoint < t:
+                    if prev != 0:
+                        prev -= 500
+                    lookup_list = self._list[prev:ind + 100]
+                    break
+                prev = ind
+            else:
+                if ind != 0:
+                    ind -= 500
+                lookup_list = self._list[ind:]
+        else:
+            lookup_list = self._list
+        return next((x for x in lookup_list
+                     if (speaker is None or x.speaker == speaker) and x.begin <= timepoint <= x.end), None)
+
+    def lookup_range(self, begin, end, speaker=None):
+        if getattr(self, '_lookup_dict', None) is not None:
+            prev = 0
+            mapping = sorted(self._lookup_dict.items())
+            for i, (ind, t) in enumerate(mapping):
+                if begin < t:
+                    if end < t:
+                        lookup_list = self._list[prev:ind]
+                    else:
+                        try:
+                            lookup_list = self._list[prev:mapping[i + 1][0]]
+                        except IndexError:
+                            lookup_list = self._list[prev:]
+                    break
+                prev = ind
+            else:
+                lookup_list = self._list[ind:]
+        else:
+            lookup_list = self._list
+        return sorted([x for x in lookup_list
+                       if (speaker is None or x.speaker == speaker) and begin <= x.midpoint <= end],
+                      key=lambda x: x.begin)
+
+
+def write_interval_tier(f, name, intervals, index, duration):
+    f.write('    item [{}]:\n'.format(index))
+    f.write('        class = "IntervalTier"\n')
+    f.write('        name = "{}"\n'.format(name))
+    f.write('        xmin = 0\n        xmax = {}\n'.format(duration))
+    f.write('        intervals: size = {}\n'.format(len(intervals)))
+    for i, (label, begin, end) in enumerate(intervals):
+        f.write('        intervals [{}]:\n'.format(i + 1))
+        f.write('            xmin = {}\n            xmax = {}\n'.format(begin, end))
+        f.write('            text = "{}"\n'.format(label))
+
+
+def generate_intervals(duration):
+    words = []
+    phones = []
+    begin = 0
+    while True:
+        num_phones = random.randint(2, 6)
+        lengths = [round(random.uniform(0.03, 0.15), 3) for _ in range(num_phones)]
+        if begin + sum(lengths) > duration:
+            break
+        labels = [random.choice(['aa', 'iy', 's', 't', 'n', 'k', 'eh']) for _ in range(num_phones)]
+        word_begin = begin
+        for label, length in zip(labels, lengths):
+            phones.append((label, begin, round(begin + length, 3)))
+            begin = round(begin + length, 3)
+        words.append((''.join(labels), word_begin, begin))
+    return words, phones
+
+
+def generate_textgrid(path, duration, speakers=('A', 'B')):
+    random.seed(1234)
+    tiers = []
+    for s in speakers:
+        words, phones = generate_intervals(duration)
+        tiers.append(('{} - words'.format(s), words))
+        tiers.append(('{} - phones'.format(s), phones))
+    end = max(x[1][-1][2] for x in tiers)
+    with open(path, 'w', encoding='utf8') as f:
+        f.write('File type = "ooTextFile"\nObject class = "TextGrid"\n\n')
+        f.write('xmin = 0\nxmax = {}\ntiers? <exists>\nsize = {}\nitem []:\n'.format(end, len(tiers)))
+        for i, (name, intervals) in enumerate(tiers):
+            write_interval_tier(f, name, intervals, i + 1, end)
+    return sum(len(x[1]) for x in tiers[::2]), sum(len(x[1]) for x in tiers[1::2])
+
+
+def parse(path):
+    parser = inspect_mfa(path)
+    data = parser.parse_discourse(path)
+    words = {a.id: i for i, a in enumerate(data['word'])}
+    output = []
+    for a in data['word']:
+        output.append((a.label, a.begin, a.end, a.speaker, tuple(a.type_properties['transcription'])))
+    for a in data['phone']:
+        output.append((a.label, a.begin, a.end, a.speaker, words.get(a.super_id)))
+    return output
+
+
+if __name__ == '__main__':
+    duration = 3600
+    if len(sys.argv) > 1:
+        duration = int(sys.argv[1])
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'synthetic.TextGrid')
+    num_words, num_phones = generate_textgrid(path, duration)
+    print('{} seconds, {} words, {} phones'.format(duration, num_words, num_phones))
+
+    parser_base.PGAnnotationType = WindowedAnnotationType
+    beg = time.time()
+    expected = parse(path)
+    windowed_time = time.time() - beg
+    print('Windowed scans: {:.3f} seconds'.format(windowed_time))
+
+    parser_base.PGAnnotationType = PGAnnotationType
+    beg = time.time()
+    output = parse(path)
+    index_time = time.time() - beg
+    print('Sorted array index: {:.3f} seconds'.format(index_time))
+
+    assert output == expected
+    os.remove(path)
+    os.rmdir(directory)
+    print('Speed up: {:.1f}x'.format(windowed_time / index_time))
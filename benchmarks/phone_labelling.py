@@ -0,0 +1,71 @@
+"""
+Compare labelling acoustic time points with phones by linear scan against the binary search
+lookup used when saving acoustic tracks.
+
+Usage: python phone_labelling.py [discourse duration in seconds]
+"""
+import sys
+import os
+import time
+import random
+
+base = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, base)
+
+from polyglotdb.acoustics.utils import IntervalLookup
+
+
+def linear_label(phones, time_point):
+    label = None
+    for i, p in enumerate(phones):
+        if p[1] > time_point:
+            break
+        label = p[0]
+        if i == len(phones) - 1:
+            break
+    else:
+        label = None
+    return label
+
+
+def generate_discourse(duration, time_step=0.01):
+    random.seed(1234)
+    phones = []
+    begin = 0
+    while begin < duration:
+        end = begin + random.uniform(0.03, 0.15)
+        phones.append((random.choice(['aa', 'iy', 's', 't', 'n']), begin, end))
+        begin = end
+    time_points = [x * time_step for x in range(int(duration / time_step))]
+    return phones, time_points
+
+
+if __name__ == '__main__':
+    duration = 120
+    if len(sys.argv) > 1:
+        duration = float(sys.argv[1])
+    phones, time_points = generate_discourse(duration)
+    print('{} phones, {} time points'.format(len(phones), len(time_points)))
+
+    beg = time.time()
+    expected = [linear_label(phones, t) for t in time_points]
+    linear_time = time.time() - beg
+    print('Linear scan: {:.3f} seconds'.format(linear_time))
+
+    beg = time.time()
+    lookup = IntervalLookup(phones, [x[1] for x in phones])
+    labels = []
+    for t in time_points:
+        phone = lookup.find(t)
+        labels.append(phone[0] if phone is not None else None)
+    lookup_time = time.time() - beg
+    print('Binary search: {:.3f} seconds'.format(lookup_time))
+
+    beg = time.time()
+    vectorized = [x[0] if x is not None else None for x in lookup.find_all(time_points)]
+    vectorized_time = time.time() - beg
+    print('Vectorized binary search: {:.3f} seconds'.format(vectorized_time))
+
+    assert labels == expected
+    assert vectorized == expected
+    print('Speed up: {:.1f}x'.format(linear_time / lookup_time))
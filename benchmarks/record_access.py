@@ -0,0 +1,68 @@
+"""
+Compare creating records for rows of query results and accessing their columns, between records that look up
+columns in a list of their own and records sharing a mapping of columns to positions.
+
+Usage: python record_access.py [number of rows]
+"""
+import sys
+import os
+import time
+
+from neo4j.v1 import Record
+
+base = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, base)
+
+from polyglotdb.query.base.results import BaseRecord, column_index
+
+COLUMNS = ['node_phone_label', 'node_phone_begin', 'node_phone_end', 'word', 'speaker', 'discourse',
+           'node_phone_following_label', 'utterance_begin']
+
+
+class ListRecord(object):
+    """
+    Record storing its own lists of columns and values
+    """
+
+    def __init__(self, result):
+        self.columns = result.keys()
+        self.values = result.values()
+
+    def __getitem__(self, key):
+        if key in self.columns:
+            return self.values[self.columns.index(key)]
+        raise KeyError('{} not in columns {}'.format(key, self.columns))
+
+
+def generate_rows(num_rows):
+    return [Record(zip(COLUMNS, ['aa', i * 0.01, i * 0.01 + 0.01, 'the', 'A', 'discourse', 'b', 0.0]))
+            for i in range(num_rows)]
+
+
+def access(records):
+    return [tuple(r[k] for k in COLUMNS) for r in records]
+
+
+if __name__ == '__main__':
+    num_rows = 1000000
+    if len(sys.argv) > 1:
+        num_rows = int(sys.argv[1])
+    rows = generate_rows(num_rows)
+    print('{} rows of {} columns'.format(num_rows, len(COLUMNS)))
+
+    beg = time.time()
+    records = [ListRecord(r) for r in rows]
+    expected = access(records)
+    list_time = time.time() - beg
+    print('Column lists: {:.3f} seconds'.format(list_time))
+    del records
+
+    beg = time.time()
+    index = column_index(rows[0].keys())
+    records = [BaseRecord(tuple(r), index) for r in rows]
+    values = access(records)
+    index_time = time.time() - beg
+    print('Shared column index: {:.3f} seconds'.format(index_time))
+
+    assert values == expected
+    print('Speed up: {:.1f}x'.format(list_time / index_time))
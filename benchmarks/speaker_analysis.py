@@ -0,0 +1,58 @@
+"""
+Compare analyzing the segments of each speaker on its own conch process pool against analyzing the
+segments of all speakers on one shared pool, for a corpus with many speakers with few segments.
+
+The analysis function sleeps for a fixed time per segment in place of running Praat or REAPER.
+
+Usage: python speaker_analysis.py [number of speakers]
+"""
+import sys
+import os
+import time
+from types import SimpleNamespace
+
+from conch import analyze_segments
+
+base = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, base)
+
+from polyglotdb.acoustics.utils import analyze_speakers
+
+SEGMENT_TIME = 0.01
+
+NUM_JOBS = 4
+
+
+class SleepFunction(object):
+    def __call__(self, segment):
+        time.sleep(SEGMENT_TIME)
+        return {segment: segment}
+
+
+def generate_mapping(num_speakers):
+    return {'speaker_{}'.format(i): list(range(i * 1000, i * 1000 + 5 + (i % 4) * 20)) for i in range(num_speakers)}
+
+
+if __name__ == '__main__':
+    num_speakers = 20
+    if len(sys.argv) > 1:
+        num_speakers = int(sys.argv[1])
+    mapping = generate_mapping(num_speakers)
+    print('{} speakers with {} segments, {} processes'.format(num_speakers, sum(len(v) for v in mapping.values()),
+                                                              NUM_JOBS))
+
+    beg = time.time()
+    expected = {k: analyze_segments(v, SleepFunction(), num_jobs=NUM_JOBS) for k, v in mapping.items()}
+    per_speaker_time = time.time() - beg
+    print('Pool per speaker: {:.3f} seconds'.format(per_speaker_time))
+
+    outputs = {}
+    corpus_context = SimpleNamespace(config=SimpleNamespace(num_jobs=NUM_JOBS))
+    beg = time.time()
+    analyze_speakers(corpus_context, mapping, lambda x: SleepFunction(),
+                     lambda output, speaker: outputs.update({speaker: output}))
+    shared_time = time.time() - beg
+    print('Shared pool: {:.3f} seconds'.format(shared_time))
+
+    assert outputs == expected
+    print('Speed up: {:.1f}x'.format(per_speaker_time / shared_time))
@@ -0,0 +1,48 @@
+"""
+Compare reading a synthetic hour-long TextGrid with the textgrid package against the built-in column
+reader used when parsing TextGrids.
+
+Usage: python textgrid_reading.py [duration in seconds]
+"""
+import sys
+import os
+import time
+import tempfile
+
+base = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, base)
+
+from textgrid import TextGrid
+
+from polyglotdb.io.textgrid import read_textgrid
+
+from annotation_lookup import generate_textgrid
+
+
+if __name__ == '__main__':
+    duration = 3600
+    if len(sys.argv) > 1:
+        duration = int(sys.argv[1])
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'synthetic.TextGrid')
+    num_words, num_phones = generate_textgrid(path, duration)
+    size = os.path.getsize(path) / 1000000
+    print('{} seconds, {} intervals, {:.1f} MB'.format(duration, num_words + num_phones, size))
+
+    beg = time.time()
+    tg = TextGrid()
+    tg.read(path)
+    expected = [[(x.mark.strip(), x.minTime, x.maxTime) for x in ti] for ti in tg.tiers]
+    package_time = time.time() - beg
+    print('textgrid package: {:.3f} seconds ({:.1f} MB/s)'.format(package_time, size / package_time))
+
+    beg = time.time()
+    tg = read_textgrid(path)
+    output = [list(ti.annotations()) for ti in tg.tiers]
+    reader_time = time.time() - beg
+    print('Column reader: {:.3f} seconds ({:.1f} MB/s)'.format(reader_time, size / reader_time))
+
+    assert output == expected
+    os.remove(path)
+    os.rmdir(directory)
+    print('Speed up: {:.1f}x'.format(package_time / reader_time))
@@ -0,0 +1,48 @@
+"""
+Compare parsing RFC3339 timestamps returned by InfluxDB into Decimal seconds against converting
+epoch millisecond timestamps with integer arithmetic, as done when querying acoustic tracks.
+
+Usage: python time_conversion.py [number of points]
+"""
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+
+base = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, base)
+
+from polyglotdb.corpus.audio import to_seconds, track_from_points
+
+
+def generate_points(num_points, time_step=10):
+    epoch = datetime(1970, 1, 1)
+    ms = [x * time_step for x in range(num_points)]
+    strings = [(epoch + timedelta(milliseconds=x)).strftime('%Y-%m-%dT%H:%M:%S.%fZ') for x in ms]
+    return ([{'time': x, 'F0': 100.0} for x in strings],
+            [{'time': x, 'F0': 100.0} for x in ms])
+
+
+if __name__ == '__main__':
+    num_points = 1000000
+    if len(sys.argv) > 1:
+        num_points = int(sys.argv[1])
+    string_points, epoch_points = generate_points(num_points)
+    print('{} points'.format(num_points))
+
+    beg = time.time()
+    expected = [to_seconds(x['time']) for x in string_points]
+    string_time = time.time() - beg
+    print('Parsing timestamps: {:.3f} seconds'.format(string_time))
+
+    beg = time.time()
+    track = track_from_points(epoch_points, ['F0'], Decimal('0.000'), Decimal('0.000'))
+    epoch_time = time.time() - beg
+    print('Epoch milliseconds: {:.3f} seconds'.format(epoch_time))
+
+    assert np.array_equal(track.times, np.array([float(x) for x in expected]))
+    assert track[expected[-1]]['time'] == expected[-1]
+    print('Speed up: {:.1f}x'.format(string_time / epoch_time))
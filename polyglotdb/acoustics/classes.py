@@ -1,34 +1,224 @@
+from decimal import Decimal
+
+import numpy as np
+
+
 class Track(object):
+    """
+    Acoustic track stored column-wise, as a sorted array of times and one float array per measure,
+    with NaN marking missing values
+
+    Iterating over a track or looking up a time returns :class:`TimePoint` views onto the underlying arrays,
+    so the dictionary-like API of individual points is preserved.
+    """
+
     def __init__(self):
-        self.points = []
+        self._times = np.empty(0)
+        self._columns = {}
+        self._pending = []
+        self._decimal_times = False
+        self._version = 0
+
+    @classmethod
+    def from_columns(cls, times, columns, decimal_times=False):
+        """
+        Construct a track directly from arrays
+
+        Parameters
+        ----------
+        times : iterable
+            Time of each point
+        columns : dict
+            Measure names mapped to an iterable of values, one per time point, with None or NaN for missing values
+        decimal_times : bool
+            Flag for returning times of points as Decimals
+
+        Returns
+        -------
+        :class:`Track`
+            Track containing the points
+        """
+        track = cls()
+        times = np.asarray(times, dtype=float)
+        order = np.argsort(times, kind='mergesort')
+        track._times = times[order]
+        track._columns = {k: np.asarray(v, dtype=float)[order] for k, v in columns.items()}
+        track._decimal_times = decimal_times
+        return track
+
+    def _consolidate(self):
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = []
+        self._version += 1
+        times = np.array([float(x[0]) for x in pending])
+        names = set()
+        for _, values in pending:
+            names.update(values.keys())
+        new_columns = {}
+        for name in names:
+            new_columns[name] = np.array([values.get(name, np.nan) for _, values in pending], dtype=float)
+        # Points added later take precedence over earlier points at the same time
+        times = np.concatenate([self._times, times])
+        for name in set(self._columns) | names:
+            old = self._columns.get(name, np.full(len(self._times), np.nan))
+            new = new_columns.get(name, np.full(len(pending), np.nan))
+            self._columns[name] = np.concatenate([old, new])
+        order = np.argsort(times, kind='mergesort')
+        times = times[order]
+        for name, column in self._columns.items():
+            self._columns[name] = column[order]
+        last = np.ones(len(times), dtype=bool)
+        last[:-1] = times[1:] != times[:-1]
+        if not last.all():
+            for name, column in self._columns.items():
+                # Fill missing values of the surviving point from earlier duplicates
+                for i in np.nonzero(~last)[0]:
+                    if np.isnan(column[i + 1]):
+                        column[i + 1] = column[i]
+                self._columns[name] = column[last]
+            times = times[last]
+        self._times = times
+
+    def _index(self, time):
+        self._consolidate()
+        time = float(time)
+        i = np.searchsorted(self._times, time)
+        if i < len(self._times) and self._times[i] == time:
+            return i
+        return None
+
+    def _output_time(self, time):
+        if self._decimal_times:
+            return Decimal(repr(float(time)))
+        return float(time)
+
+    @property
+    def times(self):
+        """
+        Sorted array of the times of points in the track
+        """
+        self._consolidate()
+        return self._times
+
+    def column(self, name):
+        """
+        Get the array of values for a measure, with NaN for missing values
+        """
+        self._consolidate()
+        return self._columns[name]
 
     def keys(self):
-        keys = set()
-        for point in self:
-            keys.update(point.values.keys())
-        return sorted(keys)
+        self._consolidate()
+        return sorted(self._columns.keys())
 
     def __getitem__(self, time):
-        for point in self:
-            if point.time == time:
-                return point
-        return None
+        i = self._index(time)
+        if i is None:
+            return None
+        return TrackPoint(self, i)
 
     def __len__(self):
-        return len(self.points)
+        self._consolidate()
+        return len(self._times)
 
     def __contains__(self, time):
-        for point in self:
-            if point.time == time:
-                return True
-        return False
+        return self._index(time) is not None
 
     def add(self, point):
-        self.points.append(point)
+        if not len(self._times) and not self._pending:
+            self._decimal_times = isinstance(point.time, Decimal)
+        values = {k: np.nan if v is None else v for k, v in point.values.items()}
+        self._pending.append((point.time, values))
+
+    def slice(self, begin, end):
+        """
+        Get the points within a time range as a new track
+
+        Parameters
+        ----------
+        begin : float
+            Beginning of the time range (inclusive)
+        end : float
+            End of the time range (inclusive)
+
+        Returns
+        -------
+        :class:`Track`
+            Track containing the points in the range
+        """
+        self._consolidate()
+        left = np.searchsorted(self._times, float(begin), side='left')
+        right = np.searchsorted(self._times, float(end), side='right')
+        track = Track()
+        track._times = self._times[left:right].copy()
+        track._columns = {k: v[left:right].copy() for k, v in self._columns.items()}
+        track._decimal_times = self._decimal_times
+        return track
+
+    def update(self, track):
+        """
+        Merge the points of another track into this one, with values from the other track taking precedence
+        """
+        self._consolidate()
+        track._consolidate()
+        if not len(self._times) and not self._columns:
+            self._decimal_times = track._decimal_times
+        self._version += 1
+        times = np.union1d(self._times, track._times)
+        own_index = np.searchsorted(times, self._times)
+        other_index = np.searchsorted(times, track._times)
+        columns = {}
+        for name in set(self._columns) | set(track._columns):
+            column = np.full(len(times), np.nan)
+            if name in self._columns:
+                column[own_index] = self._columns[name]
+            if name in track._columns:
+                other = track._columns[name]
+                found = ~np.isnan(other)
+                column[other_index[found]] = other[found]
+            columns[name] = column
+        self._times = times
+        self._columns = columns
+
+    def to_numpy(self, columns=None):
+        """
+        Convert the track to a two-dimensional array with time as the first column
+
+        Parameters
+        ----------
+        columns : list, optional
+            Measures to include, defaults to all measures in sorted order
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array with one row per time point
+        """
+        if columns is None:
+            columns = self.keys()
+        self._consolidate()
+        return np.column_stack([self._times] + [self._columns[x] for x in columns])
+
+    def to_dataframe(self):
+        """
+        Convert the track to a :class:`pandas.DataFrame` with a ``time`` column and one column per measure
+        """
+        import pandas as pd
+        self._consolidate()
+        data = {'time': self._times}
+        data.update(self._columns)
+        return pd.DataFrame(data, copy=False)
 
     def __iter__(self):
-        for p in sorted(self.points, key=lambda x: x.time):
-            yield p
+        self._consolidate()
+        for i in range(len(self._times)):
+            yield TrackPoint(self, i)
+
+    def __str__(self):
+        return '<Track with {} points>'.format(len(self))
+
 
 class TimePoint(object):
     def __init__(self, time):
@@ -55,4 +245,68 @@ class TimePoint(object):
 
     def update(self, point):
         for k,v in point.values.items():
-            self.values[k] = v
\ No newline at end of file
+            self.values[k] = v
+
+
+class TrackPoint(TimePoint):
+    """
+    View of a single time point in a :class:`Track`, reading and writing values in the track's arrays
+    """
+
+    def __init__(self, track, index):
+        self._track = track
+        self._index = index
+        self._version = track._version
+        self._time = track._times[index]
+
+    def _position(self):
+        if self._version != self._track._version or self._track._pending:
+            self._index = self._track._index(self._time)
+            self._version = self._track._version
+        return self._index
+
+    @property
+    def time(self):
+        return self._track._output_time(self._time)
+
+    @property
+    def values(self):
+        i = self._position()
+        values = {}
+        for k, v in self._track._columns.items():
+            v = v[i]
+            if not np.isnan(v):
+                values[k] = float(v)
+        return values
+
+    def __contains__(self, item):
+        if item not in self._track._columns:
+            return False
+        return not np.isnan(self._track._columns[item][self._position()])
+
+    def __getitem__(self, item):
+        if item == 'time':
+            return self.time
+        v = self._track._columns[item][self._position()]
+        if np.isnan(v):
+            return None
+        return float(v)
+
+    def __setitem__(self, key, value):
+        i = self._position()
+        if key not in self._track._columns:
+            self._track._columns[key] = np.full(len(self._track._times), np.nan)
+        self._track._columns[key][i] = np.nan if value is None else value
+
+    def __getattr__(self, item):
+        if item.startswith('_'):
+            raise AttributeError(item)
+        if item in self._track._columns:
+            return self[item]
+
+    def add_value(self, name, value):
+        self[name] = value
+
+    def update(self, point):
+        for k, v in point.values.items():
+            self[k] = v
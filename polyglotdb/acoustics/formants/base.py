@@ -1,3 +1,5 @@
+from functools import partial
+
 from conch import analyze_segments
 
 from ..segments import generate_vowel_segments, generate_utterance_segments
@@ -6,7 +8,37 @@ from .helper import generate_formants_point_function, generate_base_formants_fun
 
 from ...exceptions import SpeakerAttributeError
 
-from ..utils import PADDING
+from ..utils import PADDING, analyze_speakers
+
+
+def generate_speaker_formants_function(corpus_context, speaker, source='praat'):
+    """
+    Generate a formant function using the gender of a speaker if it is available
+
+    Parameters
+    ----------
+    corpus_context : CorpusContext
+        corpus context to use
+    speaker : str
+        name of the speaker
+    source : str
+        program to use for the analysis
+
+    Returns
+    -------
+    function
+        formant function for the speaker
+    """
+    gender = None
+    try:
+        q = corpus_context.query_speakers().filter(corpus_context.speaker.name == speaker)
+        q = q.columns(corpus_context.speaker.gender.column_name('Gender'))
+        gender = q.all()[0]['Gender']
+    except SpeakerAttributeError:
+        pass
+    if gender is not None:
+        return generate_base_formants_function(corpus_context, gender=gender, source=source)
+    return generate_base_formants_function(corpus_context, source=source)
 
 
 def analyze_formant_points(corpus_context, call_back=None, stop_check=None, vowel_inventory=None,
@@ -44,7 +76,7 @@ def analyze_formant_points(corpus_context, call_back=None, stop_check=None, vowe
         call_back('Analyzing files...')
 
     formant_function = generate_formants_point_function(corpus_context)  # Make formant function
-    output = analyze_segments(segment_mapping, formant_function,
+    output = analyze_segments(segment_mapping, formant_function, num_jobs=corpus_context.config.num_jobs,
                               stop_check=stop_check)  # Analyze the phone
     return output
 
@@ -65,20 +97,9 @@ def analyze_formant_tracks(corpus_context, source='praat', call_back=None, stop_
     segment_mapping = generate_utterance_segments(corpus_context, padding=PADDING).grouped_mapping('speaker')
     if call_back is not None:
         call_back('Analyzing files...')
-    for i, (speaker, v) in enumerate(segment_mapping.items()):
-        gender = None
-        try:
-            q = corpus_context.query_speakers().filter(corpus_context.speaker.name == speaker)
-            q = q.columns(corpus_context.speaker.gender.column_name('Gender'))
-            gender = q.all()[0]['Gender']
-        except SpeakerAttributeError:
-            pass
-        if gender is not None:
-            formant_function = generate_base_formants_function(corpus_context, gender=gender, source=source)
-        else:
-            formant_function = generate_base_formants_function(corpus_context, source=source)
-        output = analyze_segments(v, formant_function, stop_check=stop_check)
-        corpus_context.save_formant_tracks(output, speaker)
+    analyze_speakers(corpus_context, segment_mapping, partial(generate_speaker_formants_function, corpus_context,
+                                                              source=source),
+                     corpus_context.save_formant_tracks, call_back=call_back, stop_check=stop_check)
 
 
 def analyze_vowel_formant_tracks(corpus_context, source='praat',
@@ -109,17 +130,6 @@ def analyze_vowel_formant_tracks(corpus_context, source='praat',
     if call_back is not None:
         call_back('Analyzing files...')
     # goes through each phone and: makes a formant function, analyzes the phone, and saves the tracks
-    for i, (speaker, v) in enumerate(segment_mapping.items()):
-        gender = None
-        try:
-            q = corpus_context.query_speakers().filter(corpus_context.speaker.name == speaker)
-            q = q.columns(corpus_context.speaker.gender.column_name('Gender'))
-            gender = q.all()[0]['Gender']
-        except SpeakerAttributeError:
-            pass
-        if gender is not None:
-            formant_function = generate_base_formants_function(corpus_context, gender=gender, source=source)
-        else:
-            formant_function = generate_base_formants_function(corpus_context, source=source)
-        output = analyze_segments(v, formant_function, stop_check=stop_check)
-        corpus_context.save_formant_tracks(output, speaker)
+    analyze_speakers(corpus_context, segment_mapping, partial(generate_speaker_formants_function, corpus_context,
+                                                              source=source),
+                     corpus_context.save_formant_tracks, call_back=call_back, stop_check=stop_check)
@@ -48,7 +48,8 @@ def analyze_formant_points_refinement(corpus_context, vowel_inventory, duration_
     # Pick the best track that is closest to the averages gotten from prototypes
     for i, (vowel, seg) in enumerate(segment_mapping.grouped_mapping('label').items()):
 
-        output = analyze_segments(seg, formant_function, stop_check=stop_check)  # Analyze the phone
+        output = analyze_segments(seg, formant_function, num_jobs=corpus_context.config.num_jobs,
+                                  stop_check=stop_check)  # Analyze the phone
 
         if len(seg) < 6:
             print("Not enough observations of vowel {}, at least 6 are needed, only found {}.".format(vowel, len(seg)))
@@ -1,10 +1,9 @@
-from conch import analyze_segments
 from conch.analysis.intensity import PraatSegmentIntensityTrackFunction
 
 from .segments import generate_utterance_segments
-from ..exceptions import AcousticError, SpeakerAttributeError
+from ..exceptions import AcousticError
 
-from .utils import PADDING
+from .utils import PADDING, analyze_speakers
 
 
 def analyze_intensity(corpus_context,
@@ -26,17 +25,9 @@ def analyze_intensity(corpus_context,
     segment_mapping = generate_utterance_segments(corpus_context, padding=PADDING).grouped_mapping('speaker')
     if call_back is not None:
         call_back('Analyzing files...')
-    for i, (speaker, v) in enumerate(segment_mapping.items()):
-        gender = None
-        try:
-            q = corpus_context.query_speakers().filter(corpus_context.speaker.name == speaker)
-            q = q.columns(corpus_context.speaker.gender.column_name('Gender'))
-            gender = q.all()[0]['Gender']
-        except SpeakerAttributeError:
-            pass
-        intensity_function = generate_base_intensity_function(corpus_context)
-        output = analyze_segments(v, intensity_function, stop_check=stop_check)
-        corpus_context.save_intensity_tracks(output, speaker)
+    intensity_function = generate_base_intensity_function(corpus_context)
+    analyze_speakers(corpus_context, segment_mapping, lambda speaker: intensity_function,
+                     corpus_context.save_intensity_tracks, call_back=call_back, stop_check=stop_check)
 
 
 def generate_base_intensity_function(corpus_context):
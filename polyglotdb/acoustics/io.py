@@ -1,13 +1,124 @@
 import os
+import time
+import logging
 import subprocess
 import shutil
 import csv
 import librosa
 import audioread
+from requests.exceptions import ConnectionError, Timeout
 
 from conch.utils import write_wav
+from influxdb.exceptions import InfluxDBServerError
+from influxdb.line_protocol import make_lines
 
 from ..io.importer.from_csv import make_path_safe
+from ..io.importer.to_csv import CSVWriterRegistry
+
+
+class AcousticWriter(object):
+    """
+    Buffered writer for saving acoustic measurements to InfluxDB
+
+    Points are added one at a time and written in batches of a fixed size, so that only one batch is held in
+    memory at a time.  Batches that fail with connection errors or server errors are retried.
+
+    Parameters
+    ----------
+    client : :class:`~influxdb.InfluxDBClient`
+        Client for the corpus's acoustic database
+    batch_size : int
+        Number of points to write per request, defaults to 1000
+    time_precision : str, optional
+        Precision of the times of points, defaults to nanoseconds
+    protocol : str
+        Either 'json' to buffer points as dictionaries or 'line' to buffer them as line protocol strings,
+        defaults to 'json'
+    retries : int
+        Number of times to retry a failed batch, defaults to 3
+    logger_name : str, optional
+        Name of the logger to report throughput to
+    """
+
+    def __init__(self, client, batch_size=1000, time_precision=None, protocol='json', retries=3, logger_name=None):
+        if protocol not in ['json', 'line']:
+            raise ValueError('Protocol must be either \'json\' or \'line\'.')
+        self.client = client
+        self.batch_size = batch_size
+        self.time_precision = time_precision
+        self.protocol = protocol
+        self.retries = retries
+        self.logger_name = logger_name
+        self.points_written = 0
+        self.time_taken = 0
+        self._buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+
+    @property
+    def throughput(self):
+        """
+        Points written per second of time spent writing
+        """
+        if not self.time_taken:
+            return 0
+        return self.points_written / self.time_taken
+
+    def add(self, measurement, tags, time_point, fields):
+        """
+        Add a point, writing the buffered points if a full batch has accumulated
+
+        Parameters
+        ----------
+        measurement : str
+            Measurement to save the point to
+        tags : dict
+            Tags of the point
+        time_point : int or str
+            Time of the point, in the writer's time precision
+        fields : dict
+            Field values of the point
+        """
+        point = {'measurement': measurement, 'tags': tags, 'time': time_point, 'fields': fields}
+        if self.protocol == 'line':
+            point = make_lines({'points': [point]}, precision=self.time_precision).rstrip('\n')
+        self._buffer.append(point)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write all buffered points
+        """
+        if not self._buffer:
+            return
+        begin = time.time()
+        for attempt in range(self.retries + 1):
+            try:
+                self.client.write_points(self._buffer, time_precision=self.time_precision, protocol=self.protocol)
+                break
+            except (ConnectionError, Timeout, InfluxDBServerError):
+                if attempt == self.retries:
+                    raise
+                time.sleep(2 ** attempt)
+        self.time_taken += time.time() - begin
+        self.points_written += len(self._buffer)
+        self._buffer = []
+
+    def close(self):
+        """
+        Write any remaining points and report the throughput
+        """
+        self.flush()
+        if self.logger_name is not None and self.points_written:
+            log = logging.getLogger(self.logger_name)
+            log.info('Wrote {} acoustic points ({:.0f} points per second)'.format(self.points_written,
+                                                                                self.throughput))
 
 
 def resample_audio(filepath, new_filepath, new_sr):
@@ -75,6 +186,22 @@ def setup_audio(corpus_context, data):
     add_discourse_sound_info(corpus_context, data.name, data.wav_path)
 
 
+def delete_discourse_acoustics(corpus_context, discourse):
+    """
+    Delete all acoustic measurements of a discourse, such as pitch, formant and intensity tracks, from the
+    corpus's acoustic database
+
+    Parameters
+    ----------
+    corpus_context : :class:`~polyglotdb.corpus.AudioContext`
+        Context of the corpus
+    discourse : str
+        Name of the discourse
+    """
+    client = corpus_context.acoustic_client()
+    client.query('''DELETE FROM /.*/ WHERE "discourse" = '{}';'''.format(discourse))
+
+
 def point_measures_to_csv(corpus_context, data, header):
     if header[0] != 'id':
         header.insert(0, 'id')
@@ -84,13 +211,13 @@ def point_measures_to_csv(corpus_context, data, header):
         with open(path, 'w', newline='', encoding='utf8') as f:
             writer = csv.DictWriter(f, header, delimiter=',')
             writer.writeheader()
+    writers = CSVWriterRegistry()
     for seg, seg_data in data.items():
         path = os.path.join(corpus_context.config.temporary_directory('csv'),
                             '{}_point_measures.csv'.format(seg['speaker']))
-        with open(path, 'a', newline='', encoding='utf8') as f:
-            writer = csv.DictWriter(f, header, delimiter=',')
-            row = dict(id=seg['id'], **{k: v for k, v in seg_data.items() if k in header and k != 'id'})
-            writer.writerow(row)
+        row = dict(id=seg['id'], **{k: v for k, v in seg_data.items() if k in header and k != 'id'})
+        writers.writer(path, header).writerow(row)
+    writers.close()
 
 
 def point_measures_from_csv(corpus_context, header_info):
@@ -128,7 +255,8 @@ def point_measures_from_csv(corpus_context, header_info):
     for h in header_info.keys():
         if h == 'id':
             continue
-        corpus_context.execute_cypher('CREATE INDEX ON :%s(%s)' % (corpus_context.phone_name, h))
+        corpus_context.index_manager.add_index(corpus_context.phone_name, h)
+    corpus_context.index_manager.create()
     corpus_context.hierarchy.add_token_properties(corpus_context, corpus_context.phone_name,
                                                   [(h, t) for h, t in header_info.items() if h != 'id'])
     corpus_context.encode_hierarchy()
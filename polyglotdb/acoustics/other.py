@@ -80,7 +80,8 @@ def analyze_script(corpus_context,
     praat_path = corpus_context.config.praat_path
     script_function = generate_praat_script_function(praat_path, script_path, arguments=arguments)
     time_section = time.time()
-    output = analyze_segments(segment_mapping.segments, script_function, stop_check=stop_check)
+    output = analyze_segments(segment_mapping.segments, script_function, num_jobs=corpus_context.config.num_jobs,
+                              stop_check=stop_check)
     if call_back is not None:
         call_back("time analyzing segments: " + str(time.time() - time_section))
     header = sorted(list(output.values())[0].keys())
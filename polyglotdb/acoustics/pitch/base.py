@@ -1,7 +1,6 @@
 import math
 from datetime import datetime
 
-from conch import analyze_segments
 from conch.analysis.segments import SegmentMapping
 
 from .helper import generate_pitch_function
@@ -9,7 +8,7 @@ from ..segments import generate_utterance_segments
 from ...exceptions import SpeakerAttributeError
 from ..classes import Track, TimePoint
 
-from ..utils import PADDING
+from ..utils import PADDING, IntervalLookup, analyze_speakers
 
 
 def analyze_utterance_pitch(corpus_context, utterance, source='praat', min_pitch=50, max_pitch=500,
@@ -86,20 +85,16 @@ def update_utterance_pitch_track(corpus_context, utterance, new_track):
                     and "time" <= {};'''.format(discourse, speaker, to_nano(u['begin']), to_nano(u['end']))
     client = corpus_context.acoustic_client()
     result = client.query(query)
-    data = []
+    writer = corpus_context.acoustic_writer(time_precision='ms')
+    phone_lookup = IntervalLookup(phones, [x['begin'] for x in phones])
     for data_point in new_track:
         speaker, discourse, channel = speaker, discourse, channel
         time_point, value = data_point['time'], data_point['F0']
         t_dict = {'speaker': speaker, 'discourse': discourse, 'channel': channel}
-        label = None
-        for i, p in enumerate(sorted(phones, key=lambda x: x['begin'])):
-            if p['begin'] > time_point:
-                break
-            label = p['label']
-            if i == len(phones) - 1:
-                break
-        else:
-            label = None
+        phone = phone_lookup.find(time_point)
+        if phone is None:
+            continue
+        label = phone['label']
         if label is None:
             continue
         fields = {'phone': label}
@@ -112,13 +107,8 @@ def update_utterance_pitch_track(corpus_context, utterance, new_track):
         if value <= 0:
             continue
         fields['F0'] = value
-        d = {'measurement': 'pitch',
-             'tags': t_dict,
-             'time': s_to_ms(time_point),
-             'fields': fields
-             }
-        data.append(d)
-    client.write_points(data, batch_size=1000, time_precision='ms')
+        writer.add('pitch', t_dict, s_to_ms(time_point), fields)
+    writer.close()
 
 
 def analyze_pitch(corpus_context,
@@ -143,7 +133,6 @@ def analyze_pitch(corpus_context,
     if not 'utterance' in corpus_context.hierarchy:
         raise (Exception('Must encode utterances before pitch can be analyzed'))
     segment_mapping = generate_utterance_segments(corpus_context, padding=PADDING).grouped_mapping('speaker')
-    num_speakers = len(segment_mapping)
     algorithm = corpus_context.config.pitch_algorithm
     path = None
     if source == 'praat':
@@ -160,11 +149,8 @@ def analyze_pitch(corpus_context,
         speaker_data = {}
         if call_back is not None:
             call_back('Getting original speaker means and SDs...')
-        for i, (k, v) in enumerate(segment_mapping.items()):
-            if call_back is not None:
-                call_back('Analyzing speaker {} ({} of {})'.format(k, i, num_speakers))
-            output = analyze_segments(v, pitch_function, stop_check=stop_check)
 
+        def speaker_statistics(output, k):
             sum_pitch = 0
             sum_square_pitch = 0
             n = 0
@@ -179,9 +165,11 @@ def analyze_pitch(corpus_context,
                         sum_square_pitch += v * v
             speaker_data[k] = [sum_pitch / n, math.sqrt((n * sum_square_pitch - sum_pitch * sum_pitch) / (n * (n - 1)))]
 
-    for i, (speaker, v) in enumerate(segment_mapping.items()):
-        if call_back is not None:
-            call_back('Analyzing speaker {} ({} of {})'.format(speaker, i, num_speakers))
+        if analyze_speakers(corpus_context, segment_mapping, lambda k: pitch_function, speaker_statistics,
+                            call_back=call_back, stop_check=stop_check):
+            return
+
+    def generate_speaker_function(speaker):
         if algorithm == 'gendered':
             min_pitch = absolute_min_pitch
             max_pitch = absolute_max_pitch
@@ -196,8 +184,7 @@ def analyze_pitch(corpus_context,
                         max_pitch = 400
             except SpeakerAttributeError:
                 pass
-            pitch_function = generate_pitch_function(source, min_pitch, max_pitch,
-                                                     path=path)
+            return generate_pitch_function(source, min_pitch, max_pitch, path=path)
         elif algorithm == 'speaker_adjusted':
             mean_pitch, sd_pitch = speaker_data[speaker]
             min_pitch = int(mean_pitch - 3 * sd_pitch)
@@ -206,11 +193,13 @@ def analyze_pitch(corpus_context,
                 min_pitch = absolute_min_pitch
             if max_pitch > absolute_max_pitch:
                 max_pitch = absolute_max_pitch
-            pitch_function = generate_pitch_function(source, min_pitch, max_pitch,
-                                                     path=path)
-        output = analyze_segments(v, pitch_function, stop_check=stop_check)
-        corpus_context.save_pitch_tracks(output, speaker)
-        corpus_context.hierarchy.add_token_properties(corpus_context, 'utterance', [('pitch_last_edited', int)])
-        corpus_context.encode_hierarchy()
-        today = datetime.utcnow()
-        corpus_context.query_graph(corpus_context.utterance).set_properties(pitch_last_edited=today.timestamp())
+            return generate_pitch_function(source, min_pitch, max_pitch, path=path)
+        return pitch_function
+
+    if analyze_speakers(corpus_context, segment_mapping, generate_speaker_function,
+                        corpus_context.save_pitch_tracks, call_back=call_back, stop_check=stop_check):
+        return
+    corpus_context.hierarchy.add_token_properties(corpus_context, 'utterance', [('pitch_last_edited', int)])
+    corpus_context.encode_hierarchy()
+    today = datetime.utcnow()
+    corpus_context.query_graph(corpus_context.utterance).set_properties(pitch_last_edited=today.timestamp())
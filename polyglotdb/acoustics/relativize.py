@@ -0,0 +1,170 @@
+import os
+import json
+from collections import defaultdict
+
+import numpy as np
+
+from .utils import GroupedSummary
+
+
+def phone_statistics(summaries):
+    """
+    Collect the mean and sample standard deviation of each phone from running summaries of measures
+
+    Parameters
+    ----------
+    summaries : list
+        :class:`~polyglotdb.acoustics.utils.GroupedSummary` of each measure, grouped by phone
+
+    Returns
+    -------
+    dict
+        Phone labels mapped to arrays of the means and standard deviations of the measures, with NaN for missing
+        values
+    """
+    means = [x.statistic('mean') for x in summaries]
+    sds = [x.statistic('stddev') for x in summaries]
+    phones = set()
+    for x in means:
+        phones.update(x)
+    return {p: (np.array([np.nan if x.get(p) is None else x[p] for x in means], dtype=float),
+                np.array([np.nan if x.get(p) is None else x[p] for x in sds], dtype=float))
+            for p in phones}
+
+
+def _phone_summaries(corpus_context, measurement, measures, speakers):
+    summaries = [GroupedSummary() for _ in measures]
+    for speaker, discourses in speakers:
+        for tags, times, phones, values in _speaker_points(corpus_context, measurement, measures, speaker,
+                                                           discourses):
+            for j, summary in enumerate(summaries):
+                summary.add(values[:, j], phones)
+    return phone_statistics(summaries)
+
+
+def _summary_statistics(client, measurement, measures, where, group_by=None):
+    fields = ', '.join('mean("{0}") as "mean_{0}", stddev("{0}") as "sd_{0}"'.format(x) for x in measures)
+    query = '''select {} from "{}" where {}'''.format(fields, measurement, where)
+    if group_by is not None:
+        query += ' group by "{}"'.format(group_by)
+    result = client.query(query)
+    summary = {}
+    for (_, tags), points in result.items():
+        for p in points:
+            key = tags[group_by] if group_by is not None else None
+            summary[key] = (np.array([np.nan if p['mean_' + x] is None else p['mean_' + x] for x in measures]),
+                            np.array([np.nan if p['sd_' + x] is None else p['sd_' + x] for x in measures]))
+    return summary
+
+
+def _speaker_points(corpus_context, measurement, measures, speaker, discourses):
+    client = corpus_context.acoustic_client()
+    fields = ', '.join('"{}"'.format(x) for x in measures + ['phone'])
+    for discourse in discourses:
+        query = '''select {} from "{}"
+                    where "phone" != '' and "speaker" = '{}' and "discourse" = '{}'
+                    group by *'''.format(fields, measurement, speaker, discourse)
+        result = client.query(query, epoch='ns')
+        for (_, tags), points in result.items():
+            points = list(points)
+            if not points:
+                continue
+            times = np.array([p['time'] for p in points], dtype=np.int64)
+            phones = np.array([p['phone'] for p in points], dtype=object)
+            values = np.array([[np.nan if p[x] is None else p[x] for x in measures] for p in points],
+                              dtype=float)
+            yield tags, times, phones, values
+
+
+def relativize_acoustic_measure(corpus_context, measurement, measures, by_speaker=True, by_phone=False,
+                                call_back=None, stop_check=None):
+    """
+    Save z-scored versions of acoustic measures, relative to each speaker, each phone, or each phone
+    of each speaker
+
+    Points are read one speaker at a time, and statistics by phone are kept as running sums over a first pass
+    through the points, so that points are not held in memory.  Only the relativized fields (named with a
+    "_relativized" suffix) are written back.  Speakers that have been completed are recorded in the corpus's data directory, so that
+    a relativization that was stopped or failed resumes from the next speaker when it is run again.
+
+    Parameters
+    ----------
+    corpus_context : :class:`~polyglotdb.corpus.AudioContext`
+        The CorpusContext object of the corpus
+    measurement : str
+        Acoustic measurement, such as 'pitch'
+    measures : list
+        Fields of the measurement to relativize, such as ['F0']
+    by_speaker : bool
+        Flag for relativizing by speaker
+    by_phone : bool
+        Flag for relativizing by phone
+    call_back : callable
+        call back function, optional
+    stop_check : callable
+        stop check function, optional
+    """
+    if not by_speaker and not by_phone:
+        raise Exception('Relativization must be by phone, speaker, or both.')
+    client = corpus_context.acoustic_client()
+    progress_path = os.path.join(corpus_context.config.data_dir, '{}_relativization.json'.format(measurement))
+    progress = {'measures': measures, 'by_speaker': by_speaker, 'by_phone': by_phone, 'completed': []}
+    if os.path.exists(progress_path):
+        with open(progress_path, 'r', encoding='utf8') as f:
+            previous = json.load(f)
+        if all(previous[k] == v for k, v in progress.items() if k != 'completed'):
+            progress['completed'] = previous['completed']
+
+    statement = '''MATCH (s:Speaker:{corpus_name})-[:speaks_in]->(d:Discourse:{corpus_name})
+                RETURN s.name as speaker, d.name as discourse'''.format(corpus_name=corpus_context.cypher_safe_name)
+    speaker_discourses = defaultdict(list)
+    for r in corpus_context.execute_cypher(statement):
+        speaker_discourses[r['speaker']].append(r['discourse'])
+
+    # Phones are fields rather than tags, so statistics for phones are computed from each speaker's points
+    if by_phone and not by_speaker:
+        summary = _phone_summaries(corpus_context, measurement, measures, sorted(speaker_discourses.items()))
+    elif by_speaker and not by_phone:
+        summary = _summary_statistics(client, measurement, measures, '''"phone" != '' ''', group_by='speaker')
+
+    num_speakers = len(speaker_discourses)
+    if call_back is not None:
+        call_back(0, num_speakers)
+    writer = corpus_context.acoustic_writer()
+    for i, (speaker, discourses) in enumerate(sorted(speaker_discourses.items())):
+        if stop_check is not None and stop_check():
+            break
+        if call_back is not None:
+            call_back('Relativizing {} for speaker {} ({} of {})'.format(measurement, speaker, i, num_speakers))
+            call_back(i)
+        if speaker in progress['completed']:
+            continue
+        if by_speaker and by_phone:
+            summary = _phone_summaries(corpus_context, measurement, measures, [(speaker, discourses)])
+        missing = (np.full(len(measures), np.nan), np.full(len(measures), np.nan))
+        for tags, times, phones, values in _speaker_points(corpus_context, measurement, measures, speaker,
+                                                           discourses):
+            if by_phone:
+                phone_labels, phone_index = np.unique(phones, return_inverse=True)
+                statistics = [summary.get(p, missing) for p in phone_labels]
+                means = np.array([x[0] for x in statistics])[phone_index]
+                sds = np.array([x[1] for x in statistics])[phone_index]
+            else:
+                means, sds = summary.get(speaker, missing)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                relativized = (values - means) / sds
+            found = np.isfinite(relativized)
+            for k in np.nonzero(found.any(axis=1))[0]:
+                fields = {'{}_relativized'.format(x): float(relativized[k, j])
+                          for j, x in enumerate(measures) if found[k, j]}
+                writer.add(measurement, tags, int(times[k]), fields)
+        writer.flush()
+        progress['completed'].append(speaker)
+        with open(progress_path, 'w', encoding='utf8') as f:
+            json.dump(progress, f)
+    else:
+        writer.close()
+        if os.path.exists(progress_path):
+            os.remove(progress_path)
+        if call_back is not None:
+            call_back(num_speakers)
@@ -1,8 +1,35 @@
+import os
+import json
+import pickle
+import hashlib
+
 from conch.analysis.segments import SegmentMapping
 
+from ..query.base.helper import key_for_cypher
+
+
+def _data_version(corpus_context, annotation_type, file_property):
+    statement = '''MATCH (d:Discourse:{corpus_name})
+                RETURN d.name as discourse, d.{file_property} as file_path
+                ORDER BY discourse'''.format(corpus_name=corpus_context.cypher_safe_name,
+                                             file_property=file_property)
+    discourses = [(r['discourse'], r['file_path']) for r in corpus_context.execute_cypher(statement)]
+    statement = '''MATCH (n:{a_type}:{corpus_name})
+                RETURN count(n) as count'''.format(corpus_name=corpus_context.cypher_safe_name,
+                                                   a_type=annotation_type)
+    return discourses, corpus_context.execute_cypher(statement).single()['count']
+
+
+def _segment_cache_path(corpus_context, *args):
+    m = hashlib.sha1()
+    m.update(json.dumps(corpus_context.hierarchy.to_json(), sort_keys=True).encode('utf8'))
+    m.update(repr(args).encode('utf8'))
+    os.makedirs(corpus_context.segment_cache_dir, exist_ok=True)
+    return os.path.join(corpus_context.segment_cache_dir, m.hexdigest() + '.pickle')
+
 
 def generate_segments(corpus_context, annotation_type='utterance', subset=None, file_type='vowel',
-                      duration_threshold=0.001, padding=0):
+                      duration_threshold=0.001, padding=0, cache=False):
     """
     Generate segment vectors for an annotation type, to be used as input to analyze_file_segments.
 
@@ -18,6 +45,11 @@ def generate_segments(corpus_context, annotation_type='utterance', subset=None,
         One of 'low_freq', 'vowel', or 'consonant', specifies the type of audio file to use
     duration_threshold: float, optional
         Segments with length shorter than this value (in milliseconds) will not be included
+    cache : bool, optional
+        Flag for saving the segments to disk and reusing them while the corpus is unchanged, defaults to False.
+        Saved segments are keyed on the hierarchy, the discourses and their sound files, and the number of
+        annotations, and are removed when the corpus is encoded or reset, a discourse is removed, or a query
+        sets properties or subsets of annotations or deletes them
 
     Returns
     -------
@@ -28,44 +60,51 @@ def generate_segments(corpus_context, annotation_type='utterance', subset=None,
         raise Exception()
     if subset is not None and not corpus_context.hierarchy.has_type_subset(annotation_type, subset):
         raise Exception()
-    speakers = corpus_context.speakers
+    if file_type == 'vowel':
+        file_property = 'vowel_file_path'
+    elif file_type == 'low_freq':
+        file_property = 'low_freq_file_path'
+    else:
+        file_property = 'consonant_file_path'
+    if cache:
+        data_version = _data_version(corpus_context, annotation_type, file_property)
+        cache_path = _segment_cache_path(corpus_context, data_version, annotation_type, subset, file_type,
+                                         duration_threshold, padding)
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+
+    statement = '''MATCH (d:Discourse:{corpus_name})
+                WHERE d.{file_property} IS NULL
+                RETURN d.name as discourse'''.format(corpus_name=corpus_context.cypher_safe_name,
+                                                    file_property=file_property)
+    for r in corpus_context.execute_cypher(statement):
+        print("Skipping discourse {} because no wav file exists.".format(r['discourse']))
+
+    subset_label = ''
+    if subset is not None:
+        subset_label = ':' + key_for_cypher(subset)
+    statement = '''MATCH (s:Speaker:{corpus_name})-[r:speaks_in]->(d:Discourse:{corpus_name})
+                WHERE d.{file_property} IS NOT NULL
+                MATCH (n:{a_type}:{corpus_name})-[:spoken_by]->(s),
+                (n)-[:spoken_in]->(d),
+                (n)-[:is_a]->(t:{a_type}_type{subset_label})
+                WHERE n.end - n.begin > 0
+                RETURN n.id as id, coalesce(n.label, t.label) as label, n.begin as begin, n.end as end,
+                d.name as discourse, s.name as speaker, r.channel as channel, d.{file_property} as file_path
+                ORDER BY speaker, discourse, begin'''.format(corpus_name=corpus_context.cypher_safe_name,
+                                                             a_type=annotation_type, subset_label=subset_label,
+                                                             file_property=file_property)
     segment_mapping = SegmentMapping()
-    for s in speakers:
-        statement = '''MATCH (s:Speaker:{corpus_name})-[r:speaks_in]->(d:Discourse:{corpus_name})
-                    WHERE s.name = {{speaker_name}}
-                    RETURN d, r'''.format(corpus_name=corpus_context.cypher_safe_name)
-        results = corpus_context.execute_cypher(statement, speaker_name=s)
-
-        for r in results:
-            channel = r['r']['channel']
-            discourse = r['d']['name']
-            if file_type == 'vowel':
-                file_path = r['d']['vowel_file_path']
-            elif file_type == 'low_freq':
-                file_path = r['d']['low_freq_file_path']
-            else:
-                file_path = r['d']['consonant_file_path']
-            if file_path is None:
-                print("Skipping discourse {} because no wav file exists.".format(discourse))
-                continue
-            at = getattr(corpus_context, annotation_type)
-            qr = corpus_context.query_graph(at)
-            if subset is not None:
-                qr = qr.filter(at.subset == subset)
-            qr = qr.filter(at.discourse.name == discourse)
-            qr = qr.filter(at.speaker.name == s)
-            if qr.count() == 0:
-                continue
-            annotations = qr.all()
-            if annotations is not None:
-                for a in annotations:
-                    if duration_threshold is not None and a.end - a.begin < duration_threshold:
-                        continue
-                    if a.begin == a.end: # Skip zero duration segments if they exist
-                        continue
-                    segment_mapping.add_file_segment(file_path, a.begin, a.end, label=a.label,
-                                                     id=a.id, discourse=discourse, channel=channel, speaker=s,
-                                                     annotation_type=annotation_type, padding=padding)
+    for r in corpus_context.stream_cypher(statement):
+        if duration_threshold is not None and r['end'] - r['begin'] < duration_threshold:
+            continue
+        segment_mapping.add_file_segment(r['file_path'], r['begin'], r['end'], label=r['label'],
+                                         id=r['id'], discourse=r['discourse'], channel=r['channel'],
+                                         speaker=r['speaker'], annotation_type=annotation_type, padding=padding)
+    if cache:
+        with open(cache_path, 'wb') as f:
+            pickle.dump(segment_mapping, f)
     return segment_mapping
 
 
@@ -1,4 +1,11 @@
+import math
+import queue
+import threading
+from collections import deque
+from multiprocessing import Pool
+
 import librosa
+from bisect import bisect_right
 from scipy.signal import lfilter
 
 from functools import partial
@@ -8,6 +15,8 @@ from librosa.core.spectrum import stft
 
 PADDING = 0.1
 
+SEGMENT_CHUNK_SIZE = 50
+
 
 def load_waveform(file_path, begin=None, end=None):
     if begin is None:
@@ -56,3 +65,350 @@ def generate_spectrogram(signal, sr, color_scale='log'):
 
 def make_path_safe(path):
     return path.replace('\\', '/').replace(' ', '%20')
+
+
+class IntervalLookup(object):
+    """
+    Lookup of the annotation that time points fall into, using binary search over sorted begin times
+
+    A time point is assigned to the last annotation that begins at or before it.
+
+    Parameters
+    ----------
+    annotations : list
+        Annotations to look up
+    begins : list
+        Begin time of each annotation, in the same order as ``annotations``
+    """
+
+    def __init__(self, annotations, begins):
+        order = sorted(range(len(begins)), key=lambda x: begins[x])
+        self.annotations = [annotations[i] for i in order]
+        self.begins = [float(begins[i]) for i in order]
+
+    def __len__(self):
+        return len(self.annotations)
+
+    def find(self, time):
+        """
+        Find the annotation for a time point
+
+        Parameters
+        ----------
+        time : float
+            Time point to look up
+
+        Returns
+        -------
+        object or None
+            Annotation that the time point falls into, or None if the time point is before all annotations
+        """
+        i = bisect_right(self.begins, float(time)) - 1
+        if i < 0:
+            return None
+        return self.annotations[i]
+
+    def find_all(self, times):
+        """
+        Find the annotations for an array of time points
+
+        Parameters
+        ----------
+        times : iterable
+            Time points to look up
+
+        Returns
+        -------
+        list
+            Annotation for each time point, or None if the time point is before all annotations
+        """
+        indices = np.searchsorted(self.begins, np.asarray(times, dtype=float), side='right') - 1
+        return [self.annotations[i] if i >= 0 else None for i in indices]
+
+
+def analyze_chunk(analysis_function, segments):
+    """
+    Analyze a chunk of segments, for use in a worker process
+
+    Parameters
+    ----------
+    analysis_function : callable
+        Analysis function for the speaker of the segments
+    segments : list
+        Segments to analyze
+
+    Returns
+    -------
+    list
+        Tuples of segment and analysis output
+    """
+    return [(s, analysis_function(s)) for s in segments]
+
+
+def speaker_chunks(segments, num_jobs):
+    """
+    Split the segments of a speaker into chunks, small enough for a speaker's segments to be spread over
+    all the worker processes
+
+    Parameters
+    ----------
+    segments : list
+        Segments of the speaker
+    num_jobs : int
+        Number of worker processes
+
+    Returns
+    -------
+    list
+        Lists of segments
+    """
+    size = max(1, min(SEGMENT_CHUNK_SIZE, int(math.ceil(len(segments) / num_jobs))))
+    return [segments[i:i + size] for i in range(0, len(segments), size)]
+
+
+def analyze_speakers(corpus_context, segment_mapping, generate_function, save_function, call_back=None,
+                     stop_check=None):
+    """
+    Analyze the segments of all speakers on one pool of ``corpus_context.config.num_jobs`` processes, and
+    save the results of each speaker on a separate thread once all of their segments have been analyzed
+
+    Segments are sent to the pool in chunks, and chunks of the next speakers are sent while the last chunks
+    of a speaker are being analyzed, so that speakers with few segments do not leave processes idle.  At most
+    twice as many chunks as processes are waiting to be analyzed at a time.
+
+    Parameters
+    ----------
+    corpus_context : :class:`~polyglotdb.corpus.CorpusContext`
+        corpus context to use
+    segment_mapping : dict
+        Speaker names mapped to the :class:`~conch.analysis.segments.SegmentMapping` of their segments
+    generate_function : callable
+        Function that takes a speaker name and returns the analysis function for their segments
+    save_function : callable
+        Function that takes the analysis output and speaker name and saves the output
+    call_back : callable
+        call back function, optional
+    stop_check : callable
+        stop check function, optional
+
+    Returns
+    -------
+    bool
+        True if the analysis was stopped before all speakers were analyzed
+    """
+    num_jobs = corpus_context.config.num_jobs
+    num_speakers = len(segment_mapping)
+    to_save = queue.Queue(maxsize=1)
+    errors = []
+
+    def save_worker():
+        while True:
+            item = to_save.get()
+            if item is None:
+                break
+            if errors:
+                continue
+            try:
+                save_function(*item)
+            except Exception as e:
+                errors.append(e)
+
+    pending = deque()
+    outputs = {}
+
+    def collect():
+        speaker, result, last = pending.popleft()
+        output = outputs.setdefault(speaker, {})
+        if result is not None:
+            output.update(result.get())
+        if last:
+            to_save.put((outputs.pop(speaker), speaker))
+
+    writer = threading.Thread(target=save_worker, daemon=True)
+    writer.start()
+    pool = Pool(num_jobs)
+    stopped = False
+    try:
+        for i, (speaker, v) in enumerate(segment_mapping.items()):
+            if errors or (stop_check is not None and stop_check()):
+                stopped = True
+                break
+            if call_back is not None:
+                call_back('Analyzing speaker {} ({} of {})'.format(speaker, i, num_speakers))
+            analysis_function = generate_function(speaker)
+            chunks = speaker_chunks(sorted(v), num_jobs)
+            if not chunks:
+                pending.append((speaker, None, True))
+            for j, chunk in enumerate(chunks):
+                while len(pending) >= 2 * num_jobs and not errors:
+                    collect()
+                if errors or (stop_check is not None and stop_check()):
+                    stopped = True
+                    break
+                result = pool.apply_async(analyze_chunk, (analysis_function, chunk))
+                pending.append((speaker, result, j == len(chunks) - 1))
+            if stopped:
+                break
+        while pending and not stopped and not errors:
+            if stop_check is not None and stop_check():
+                stopped = True
+                break
+            collect()
+        pool.close()
+    finally:
+        pool.terminate()
+        to_save.put(None)
+        writer.join()
+    if errors:
+        raise errors[0]
+    return stopped
+
+
+GROUPED_STATISTICS = {'count': len,
+                      'mean': np.mean,
+                      'median': np.median,
+                      'stddev': lambda x: np.std(x, ddof=1) if len(x) > 1 else None,
+                      'spread': np.ptp,
+                      'sum': np.sum,
+                      'min': np.min,
+                      'max': np.max}
+
+
+def grouped_statistic(values, groups, statistic):
+    """
+    Calculate a summary statistic of values within groups, ignoring missing values
+
+    Parameters
+    ----------
+    values : :class:`numpy.ndarray`
+        Values to summarize, with NaN for missing values
+    groups : :class:`numpy.ndarray`
+        Group label for each value
+    statistic : str
+        Name of the statistic, one of the InfluxDB aggregate functions count, mean, median, spread, stddev, sum,
+        min or max
+
+    Returns
+    -------
+    dict
+        Group labels mapped to the value of the statistic, or None for groups without values
+    """
+    try:
+        function = GROUPED_STATISTICS[statistic]
+    except KeyError:
+        raise ValueError('Statistic must be one of: {}.'.format(', '.join(sorted(GROUPED_STATISTICS))))
+    labels, index = np.unique(groups, return_inverse=True)
+    order = np.argsort(index, kind='mergesort')
+    boundaries = np.cumsum(np.bincount(index, minlength=len(labels)))[:-1]
+    output = {}
+    for label, group_values in zip(labels, np.split(values[order], boundaries)):
+        group_values = group_values[~np.isnan(group_values)]
+        if not len(group_values):
+            output[label] = None
+            continue
+        value = function(group_values)
+        if isinstance(value, np.generic):
+            value = value.item()
+        output[label] = value
+    return output
+
+
+class GroupedSummary(object):
+    """
+    Running summary of values within groups, ignoring missing values
+
+    Values are added a chunk at a time and only counts, sums, means, sums of squared deviations, minimums and
+    maximums are kept for each group, merging chunks with the pairwise update of Chan et al.  Medians need
+    every value, so values are only kept for each group when ``keep_values`` is set.
+
+    Parameters
+    ----------
+    keep_values : bool
+        Flag for keeping the values of each group, needed for medians, defaults to False
+    """
+
+    def __init__(self, keep_values=False):
+        self.groups = {}
+        self.values = {} if keep_values else None
+
+    def add(self, values, groups):
+        """
+        Add a chunk of values to the summary
+
+        Parameters
+        ----------
+        values : :class:`numpy.ndarray`
+            Values to summarize, with NaN for missing values
+        groups : :class:`numpy.ndarray`
+            Group label for each value
+        """
+        labels, index = np.unique(groups, return_inverse=True)
+        found = ~np.isnan(values)
+        values, index = values[found], index[found]
+        counts = np.bincount(index, minlength=len(labels))
+        sums = np.bincount(index, weights=values, minlength=len(labels))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        deviations = np.bincount(index, weights=(values - means[index]) ** 2, minlength=len(labels))
+        minimums = np.full(len(labels), np.inf)
+        np.minimum.at(minimums, index, values)
+        maximums = np.full(len(labels), -np.inf)
+        np.maximum.at(maximums, index, values)
+        if self.values is not None:
+            order = np.argsort(index, kind='mergesort')
+            group_values = np.split(values[order], np.cumsum(counts)[:-1])
+        for i, label in enumerate(labels.tolist()):
+            if self.values is not None:
+                self.values.setdefault(label, []).append(group_values[i])
+            if label not in self.groups or not self.groups[label][0]:
+                self.groups[label] = [int(counts[i]), sums[i], means[i], deviations[i], minimums[i], maximums[i]]
+                continue
+            if not counts[i]:
+                continue
+            count, total, mean, deviation, minimum, maximum = self.groups[label]
+            new_count = count + int(counts[i])
+            delta = means[i] - mean
+            self.groups[label] = [new_count, total + sums[i], mean + delta * counts[i] / new_count,
+                                  deviation + deviations[i] + delta ** 2 * count * counts[i] / new_count,
+                                  min(minimum, minimums[i]), max(maximum, maximums[i])]
+
+    def statistic(self, statistic):
+        """
+        Get a summary statistic for each group
+
+        Parameters
+        ----------
+        statistic : str
+            Name of the statistic, one of the InfluxDB aggregate functions count, mean, median, spread, stddev,
+            sum, min or max
+
+        Returns
+        -------
+        dict
+            Group labels mapped to the value of the statistic, or None for groups without values
+        """
+        if statistic not in GROUPED_STATISTICS:
+            raise ValueError('Statistic must be one of: {}.'.format(', '.join(sorted(GROUPED_STATISTICS))))
+        if statistic == 'median' and self.values is None:
+            raise ValueError('Medians need a summary that keeps values.')
+        output = {}
+        for label, (count, total, mean, deviation, minimum, maximum) in self.groups.items():
+            if not count:
+                output[label] = None
+            elif statistic == 'count':
+                output[label] = count
+            elif statistic == 'mean':
+                output[label] = float(mean)
+            elif statistic == 'median':
+                output[label] = float(np.median(np.concatenate(self.values[label])))
+            elif statistic == 'stddev':
+                output[label] = math.sqrt(deviation / (count - 1)) if count > 1 else None
+            elif statistic == 'spread':
+                output[label] = float(maximum - minimum)
+            elif statistic == 'sum':
+                output[label] = float(total)
+            elif statistic == 'min':
+                output[label] = float(minimum)
+            else:
+                output[label] = float(maximum)
+        return output
@@ -3,6 +3,7 @@ import sys
 import logging
 import socket
 import configparser
+from multiprocessing import cpu_count
 
 CONFIG_DIR = os.path.expanduser('~/.pgdb')
 
@@ -59,6 +60,25 @@ class CorpusConfig(object):
     base_dir : str
         Base directory to store information and temporary files for the corpus
         defaults to "Documents/SCT" under the current user's home directory
+    num_jobs : int
+        Number of processes to use for parsing and acoustic analysis, defaults to three quarters of the
+        available cores
+    acoustic_batch_size : int
+        Number of query results whose acoustic measurements are fetched together, set to 0 or None
+        to query acoustic measurements for each result separately
+    acoustic_write_batch_size : int
+        Number of acoustic measurements written to the acoustic database per request
+    acoustic_write_protocol : str
+        Format for writing acoustic measurements, either 'json' or 'line' (InfluxDB line protocol)
+    neo4j_admin_path : str
+        Path to the ``neo4j-admin`` executable of the local graph database, used by
+        :meth:`~polyglotdb.corpus.ImportContext.bulk_load_directory` to bulk import corpora into a new database
+    enrichment_transport : str
+        How enrichment data is sent to the graph database, either 'csv' (CSV files that the database
+        server reads from disk) or 'bolt' (batches of rows sent as query parameters)
+    query_jobs : int
+        Number of threads that run the speaker or discourse partitions of split queries concurrently, each in
+        its own graph database session, defaults to 1 (one partition at a time)
     """
 
     def __init__(self, corpus_name, data_dir=None, **kwargs):
@@ -95,6 +115,13 @@ class CorpusConfig(object):
         self.pitch_algorithm = 'speaker_adjusted'
         self.formant_algorithm = 'fave'
         self.time_sampling = 0.01
+        self.acoustic_batch_size = 1000
+        self.acoustic_write_batch_size = 1000
+        self.acoustic_write_protocol = 'json'
+        self.neo4j_admin_path = None
+        self.enrichment_transport = 'csv'
+        self.query_jobs = 1
+        self.num_jobs = max(1, int(3 * cpu_count() / 4))
 
         for k, v in kwargs.items():
             setattr(self, k, v)
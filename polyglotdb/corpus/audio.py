@@ -1,6 +1,7 @@
 import os
 import re
 import librosa
+import numpy as np
 from datetime import datetime
 from decimal import Decimal
 
@@ -9,10 +10,13 @@ from influxdb import InfluxDBClient
 from polyglotdb.query.discourse import DiscourseInspector
 from ..acoustics import analyze_pitch, analyze_formant_tracks, analyze_vowel_formant_tracks, analyze_intensity, \
     analyze_script, analyze_utterance_pitch, update_utterance_pitch_track
-from ..acoustics.classes import Track, TimePoint
+from ..acoustics.classes import Track
 from .syllabic import SyllabicContext
 
-from ..acoustics.utils import load_waveform, generate_spectrogram
+from ..acoustics.utils import load_waveform, generate_spectrogram, IntervalLookup, grouped_statistic, \
+    GroupedSummary, GROUPED_STATISTICS
+from ..acoustics.io import AcousticWriter, delete_discourse_acoustics
+from ..acoustics.relativize import relativize_acoustic_measure
 
 
 def sanitize_formants(value):
@@ -57,16 +61,65 @@ def generate_filter_string(discourse, begin, end, channel, num_points, kwargs):
     return filter_string
 
 
+MS_PER_DAY = 24 * 60 * 60 * 1000
+
+
 def to_nano(seconds):
-    if not isinstance(seconds, Decimal):
-        seconds = Decimal(seconds).quantize(Decimal('0.001'))
-    return int(seconds * Decimal('1e9'))
+    if isinstance(seconds, Decimal):
+        return int(seconds * Decimal('1e9'))
+    return s_to_ms(seconds) * 1000000
 
 
 def s_to_ms(seconds):
-    if not isinstance(seconds, Decimal):
-        seconds = Decimal(seconds).quantize(Decimal('0.001'))
-    return int(seconds * Decimal('1e3'))
+    if isinstance(seconds, Decimal):
+        return int(seconds * Decimal('1e3'))
+    ms = seconds * 1000
+    if abs(ms % 1 - 0.5) < 1e-6:
+        # Near a half millisecond, the float product can round differently from the exact value
+        return int(Decimal(seconds).quantize(Decimal('0.001')) * Decimal('1e3'))
+    return int(round(ms))
+
+
+def track_from_points(points, names, begin, end, relative_time=False, output_names=None):
+    """
+    Construct a track from InfluxDB points queried with ``epoch='ms'``
+
+    Times are taken as milliseconds into the day, as in :func:`to_seconds`, and converted with
+    integer arithmetic.
+
+    Parameters
+    ----------
+    points : iterable
+        Points returned by InfluxDB
+    names : list
+        Fields of the points to include in the track
+    begin : :class:`~decimal.Decimal`
+        Beginning of the queried time range
+    end : :class:`~decimal.Decimal`
+        End of the queried time range
+    relative_time : bool
+        Flag for converting times to proportions of the time range
+    output_names : list, optional
+        Names to use for the fields in the track, defaults to ``names``
+
+    Returns
+    -------
+    :class:`~polyglotdb.acoustics.classes.Track`
+        Track of the points
+    """
+    if output_names is None:
+        output_names = names
+    points = list(points)
+    if not points:
+        return Track()
+    times = np.array([r['time'] for r in points], dtype=np.int64) % MS_PER_DAY
+    if relative_time:
+        begin_ms = s_to_ms(begin)
+        times = (times - begin_ms) / (s_to_ms(end) - begin_ms)
+    else:
+        times = times / 1000
+    columns = {o: [r[n] for r in points] for n, o in zip(names, output_names)}
+    return Track.from_columns(times, columns, decimal_times=True)
 
 
 def to_seconds(time_string):
@@ -139,15 +192,61 @@ class AudioContext(SyllabicContext):
             genders.add(g)
         return sorted(genders)
 
+    def remove_discourse(self, name):
+        """
+        Remove a discourse from the graph database, along with its measurements in the acoustic database
+
+        Parameters
+        ----------
+        name : str
+            Name of the discourse to remove
+        """
+        super(AudioContext, self).remove_discourse(name)
+        delete_discourse_acoustics(self, name)
+
     def reset_acoustics(self, call_back=None, stop_check=None):
         self.acoustic_client().drop_database(self.corpus_name)
+        self._acoustic_client.close()
+        self._acoustic_client = None
 
     def acoustic_client(self):
-        client = InfluxDBClient(**self.config.acoustic_conncetion_kwargs)
-        databases = client.get_list_database()
-        if self.corpus_name not in databases:
-            client.create_database(self.corpus_name)
-        return client
+        """
+        Get the client for the corpus's acoustic database, creating the client and the database
+        on first use
+
+        The client is reused for the lifetime of the context, so that its HTTP connections are kept alive
+        between requests, and is closed when the context exits.
+
+        Returns
+        -------
+        :class:`~influxdb.InfluxDBClient`
+            Client for the acoustic database
+        """
+        if self._acoustic_client is None:
+            client = InfluxDBClient(**self.config.acoustic_conncetion_kwargs)
+            databases = [x['name'] for x in client.get_list_database()]
+            if self.corpus_name not in databases:
+                client.create_database(self.corpus_name)
+            self._acoustic_client = client
+        return self._acoustic_client
+
+    def acoustic_writer(self, time_precision=None):
+        """
+        Get a buffered writer for saving acoustic measurements to the corpus's acoustic database
+
+        Parameters
+        ----------
+        time_precision : str, optional
+            Precision of the times of points to be written, defaults to nanoseconds
+
+        Returns
+        -------
+        :class:`~polyglotdb.acoustics.io.AcousticWriter`
+            Writer for the acoustic database
+        """
+        return AcousticWriter(self.acoustic_client(), batch_size=self.config.acoustic_write_batch_size,
+                              time_precision=time_precision, protocol=self.config.acoustic_write_protocol,
+                              logger_name='{}_acoustics'.format(self.corpus_name))
 
     def inspect_discourse(self, discourse, begin=None, end=None):
         """
@@ -301,16 +400,8 @@ class AudioContext(SyllabicContext):
             columns = '"time", "{}"'.format(Intensity_name)
         query = '''select {} from "intensity"
                         {};'''.format(columns, filter_string)
-        result = client.query(query)
-        track = Track()
-        for r in result.get_points('intensity'):
-            s = to_seconds(r['time'])
-            if relative_time:
-                s = (s - begin) / (end - begin)
-            p = TimePoint(s)
-            p.add_value(Intensity_name, r[Intensity_name] )
-            track.add(p)
-        return track
+        result = client.query(query, epoch='ms')
+        return track_from_points(result.get_points('intensity'), [Intensity_name], begin, end, relative_time)
 
     def get_formants(self, discourse, begin, end, channel=0, relative=False, relative_time=False, **kwargs):
         """
@@ -350,17 +441,8 @@ class AudioContext(SyllabicContext):
         else:
             columns = '"time", {}'.format(', '.join('"{}"'.format(x) for x in formant_names))
         result = client.query('''select {} from "formants"
-                        {};'''.format(columns, filter_string))
-        track = Track()
-        for r in result.get_points('formants'):
-            s = to_seconds(r['time'])
-            if relative_time:
-                s = (s - begin) / (end - begin)
-            p = TimePoint(s)
-            for f in formant_names:
-                p.add_value(f, r[f] )
-            track.add(p)
-        return track
+                        {};'''.format(columns, filter_string), epoch='ms')
+        return track_from_points(result.get_points('formants'), formant_names, begin, end, relative_time)
 
     def get_pitch(self, discourse, begin, end, channel=0, relative=False, relative_time=False, **kwargs):
         """
@@ -403,21 +485,14 @@ class AudioContext(SyllabicContext):
             columns = '"time", "{}"'.format(F0_name)
         query = '''select {} from "pitch"
                         {};'''.format(columns, filter_string)
-        result = client.query(query)
-        track = Track()
-        for r in result.get_points('pitch'):
-            s = to_seconds(r['time'])
-            if relative_time:
-                s = (s - begin) / (end - begin)
-            p = TimePoint(s)
-            p.add_value('F0', r[F0_name] )
-            track.add(p)
-        return track
+        result = client.query(query, epoch='ms')
+        return track_from_points(result.get_points('pitch'), [F0_name], begin, end, relative_time,
+                                 output_names=['F0'])
 
     def _save_measurement_tracks(self, measurement, tracks, speaker):
         if measurement not in ['formants', 'pitch', 'intensity']:
             raise (NotImplementedError('Only pitch, formants, and intensity can be currently saved.'))
-        data = []
+        writer = self.acoustic_writer(time_precision='ms')
         for seg, track in tracks.items():
             if not len(track.keys()):
                 continue
@@ -440,17 +515,13 @@ class AudioContext(SyllabicContext):
                               phone_type.begin.column_name('begin'),
                               phone_type.end.column_name('end')).order_by(phone_type.begin)
                 phones = [(x['label'], x['begin'], x['end']) for x in q.all()]
+                phone_lookup = IntervalLookup(phones, [x[1] for x in phones])
             for time_point, value in track.items():
                 if set_label is None:
                     label = None
-                    for i, p in enumerate(phones):
-                        if p[1] > time_point:
-                            break
-                        label = p[0]
-                        if i == len(phones) - 1:
-                            break
-                    else:
-                        label = None
+                    phone = phone_lookup.find(time_point)
+                    if phone is not None:
+                        label = phone[0]
                 else:
                     label = set_label
                 if label is None:
@@ -495,13 +566,8 @@ class AudioContext(SyllabicContext):
                             except ValueError:
                                 continue
                     fields['Intensity'] = value
-                d = {'measurement': measurement,
-                     'tags': t_dict,
-                     'time': s_to_ms(time_point),
-                     'fields': fields
-                     }
-                data.append(d)
-        self.acoustic_client().write_points(data, batch_size=1000, time_precision='ms')
+                writer.add(measurement, t_dict, s_to_ms(time_point), fields)
+        writer.close()
 
     def _save_measurement(self, sound_file, track, measurement, **kwargs):
         if not len(track.keys()):
@@ -515,7 +581,6 @@ class AudioContext(SyllabicContext):
             raise (NotImplementedError('Only pitch, formants, and intensity can be currently saved.'))
         if kwargs.get('channel', None) is None:
             kwargs['channel'] = 0
-        data = []
         tag_dict = {}
         if isinstance(sound_file, str):
             kwargs['discourse'] = sound_file
@@ -532,19 +597,14 @@ class AudioContext(SyllabicContext):
                       phone_type.end.column_name('end'),
                       phone_type.speaker.name.column_name('speaker')).order_by(phone_type.begin)
         phones = [(x['label'], x['begin'], x['end'], x['speaker']) for x in q.all()]
+        phone_lookup = IntervalLookup(phones, [x[1] for x in phones])
+        writer = self.acoustic_writer()
         for time_point, value in track.items():
-            label = None
-            speaker = None
-            for i, p in enumerate(phones):
-                if p[1] > time_point:
-                    break
-                label = p[0]
-                speaker = p[-1]
-                if i == len(phones) - 1:
-                    break
-            else:
-                label = None
-                speaker = None
+            phone = phone_lookup.find(time_point)
+            if phone is None:
+                continue
+            label = phone[0]
+            speaker = phone[-1]
             if speaker is None:
                 continue
             t_dict = {'speaker': speaker}
@@ -584,13 +644,8 @@ class AudioContext(SyllabicContext):
                         except ValueError:
                             continue
                 fields['Intensity'] = value
-            d = {'measurement': measurement,
-                 'tags': t_dict,
-                 'time': to_nano(time_point),
-                 'fields': fields
-                 }
-            data.append(d)
-        self.acoustic_client().write_points(data, batch_size=1000)
+            writer.add(measurement, t_dict, to_nano(time_point), fields)
+        writer.close()
 
     def save_formants(self, sound_file, formant_track, **kwargs):
         """
@@ -679,125 +734,100 @@ class AudioContext(SyllabicContext):
         return True
 
     def encode_acoustic_statistic(self, acoustic_measure, statistic, by_phone=True, by_speaker=False):
+        """
+        Calculate a summary statistic of an acoustic measure and save it to phone types, speakers, or
+        the relationships between them
+
+        Statistics grouped by phone are calculated locally, since phone labels are fields in the acoustic
+        database and cannot be grouped on there.  Each speaker's points are summarized as they are fetched, so
+        only one speaker's points are held in memory at a time (along with every value for medians by phone).
+
+        Parameters
+        ----------
+        acoustic_measure : str
+            One of 'pitch', 'formants', or 'intensity'
+        statistic : str
+            Name of the statistic, such as 'mean'
+        by_phone : bool
+            Flag for calculating the statistic for each phone, defaults to True
+        by_speaker : bool
+            Flag for calculating the statistic for each speaker, defaults to False
+        """
         if not by_speaker and not by_phone:
             raise (Exception('Please specify either by_phone, by_speaker or both.'))
         client = self.acoustic_client()
         acoustic_measure = acoustic_measure.lower()
-        measures = []
-        template = statistic + '("{}")'
         if acoustic_measure == 'pitch':
-            measures.append(template.format('F0'))
+            fields = ['F0']
+            properties = [acoustic_measure]
         elif acoustic_measure == 'formants':
-            measures.append(template.format('F1'))
-            measures.append(template.format('F2'))
-            measures.append(template.format('F3'))
+            fields = ['F1', 'F2', 'F3']
+            properties = fields
         elif acoustic_measure == 'intensity':
-            measures.append(template.format('Intensity'))
+            fields = ['Intensity']
+            properties = [acoustic_measure]
         else:
             raise (ValueError('Acoustic measure must be one of: pitch, formants, or intensity.'))
-        if by_speaker and by_phone:
-            results = []
-            for p in self.phones:
+        set_template = '{{node}}.{statistic}_{property} = d.{property}'
+        set_string = ',\n'.join(set_template.format(statistic=statistic, property=x) for x in properties)
+        if by_phone:
+            if statistic not in GROUPED_STATISTICS:
+                raise (ValueError('Statistic must be one of: {}.'.format(', '.join(sorted(GROUPED_STATISTICS)))))
+            results = {}
+            summaries = [GroupedSummary(keep_values=statistic == 'median') for _ in properties]
+            for speaker in self.speakers:
                 query = '''select {} from "{}"
-                                where "phone" = '{}' group by "speaker";'''.format(
-                    ', '.join(measures), acoustic_measure, p)
-
-                result = client.query(query)
-                if acoustic_measure == 'formants':
-                    for k, v in result.items():
-                        data = [x[1] for x in sorted(list(v)[0].items()) if x[0] != 'time']
-                        results.append({'speaker': k[1]['speaker'], 'phone': p, 'F1': data[0], 'F2': data[1],
-                                        'F3': data[2]})
-                else:
-                    results.extend([{'speaker': k[1]['speaker'], 'phone': p, acoustic_measure: list(v)[0][statistic]}
-                                    for k, v in result.items()])
-            if acoustic_measure == 'formants':
-                statement = '''WITH {{data}} as data
-                            UNWIND data as d
-                            MERGE (s:Speaker:{corpus_name})<-[r:spoken_by]-(p:phone_type:{corpus_name})
-                            WHERE p.label = d.phone AND s.name = d.speaker
-                            SET r.{statistic}_F1 = d.F1
-                            AND r.{statistic}_F2 = d.F2
-                            AND r.{statistic}_F3 = d.F3'''.format(corpus_name=self.cypher_safe_name,
-                                                                  statistic=statistic)
-            else:
-                statement = '''WITH {{data}} as data
-                            UNWIND data as d
+                            where "phone" != '' and "speaker" = '{}';'''.format(
+                    ', '.join('"{}"'.format(x) for x in fields + ['phone']), acoustic_measure, speaker)
+                points = list(client.query(query).get_points(acoustic_measure))
+                if not points:
+                    continue
+                phones = np.array([x['phone'] for x in points], dtype=object)
+                speaker_values = np.array([[np.nan if x[f] is None else x[f] for f in fields] for x in points],
+                                          dtype=float)
+                for i, p in enumerate(properties):
+                    if by_speaker:
+                        for phone, v in grouped_statistic(speaker_values[:, i], phones, statistic).items():
+                            results.setdefault((speaker, phone), {'speaker': speaker, 'phone': phone})[p] = v
+                    else:
+                        summaries[i].add(speaker_values[:, i], phones)
+            if not by_speaker:
+                for i, p in enumerate(properties):
+                    for phone, v in summaries[i].statistic(statistic).items():
+                        results.setdefault(phone, {'phone': phone})[p] = v
+            results = list(results.values())
+            if by_speaker:
+                statement = '''UNWIND {{data}} as d
                             MATCH (s:Speaker:{corpus_name}), (p:phone_type:{corpus_name})
                             WHERE p.label = d.phone AND s.name = d.speaker
                             MERGE (s)<-[r:spoken_by]-(p)
-                            SET r.{statistic}_{measure} = d.{measure}'''.format(corpus_name=self.cypher_safe_name,
-                                                                                statistic=statistic,
-                                                                                measure=acoustic_measure)
-        elif by_phone:
-            results = []
-            for p in self.phones:
-                query = '''select {} from "{}"
-                                where "phone" = '{}';'''.format(', '.join(measures),
-                                                                acoustic_measure, p)
-
-                result = client.query(query)
-
-                if acoustic_measure == 'formants':
-                    results = []
-                    for k, v in result.items():
-                        data = [x[1] for x in sorted(list(v)[0].items()) if x[0] != 'time']
-                        results.append({'phone': p, 'F1': data[0], 'F2': data[1], 'F3': data[2]})
-                else:
-                    results.extend([{'phone': p, acoustic_measure: list(v)[0][statistic]} for k, v in result.items()])
-            if acoustic_measure == 'formants':
-                statement = '''WITH {{data}} as data
-                                UNWIND data as d
-                                MATCH (p:phone_type:{corpus_name})
-                                WHERE p.label = d.phone
-                                SET p.{statistic}_F1 = d.F1
-                                AND p.{statistic}_F2 = d.F2
-                                AND p.{statistic}_F3 = d.F3'''.format(corpus_name=self.cypher_safe_name,
-                                                                      statistic=statistic)
-                self.hierarchy.add_type_properties(self, 'phone', [('{}_F1'.format(statistic), float),
-                                                                   ('{}_F2'.format(statistic), float),
-                                                                   ('{}_F3'.format(statistic), float)])
-
+                            SET {set_string}'''.format(corpus_name=self.cypher_safe_name,
+                                                      set_string=set_string.format(node='r'))
             else:
-                statement = '''WITH {{data}} as data
-                                UNWIND data as d
-                                MATCH (p:phone_type:{corpus_name})
-                                WHERE p.label = d.phone
-                                SET p.{statistic}_{measure} = d.{measure}'''.format(corpus_name=self.cypher_safe_name,
-                                                                                    statistic=statistic,
-                                                                                    measure=acoustic_measure)
+                statement = '''UNWIND {{data}} as d
+                            MATCH (p:phone_type:{corpus_name})
+                            WHERE p.label = d.phone
+                            SET {set_string}'''.format(corpus_name=self.cypher_safe_name,
+                                                      set_string=set_string.format(node='p'))
                 self.hierarchy.add_type_properties(self, 'phone',
-                                                   [('{}_{}'.format(statistic, acoustic_measure), float)])
-        elif by_speaker:
-            query = '''select {} from "{}" group by "speaker";'''.format(', '.join(measures), acoustic_measure)
+                                                   [('{}_{}'.format(statistic, x), float) for x in properties])
+        else:
+            query = '''select {} from "{}" group by "speaker";'''.format(
+                ', '.join('{}("{}") as "{}"'.format(statistic, f, p) for f, p in zip(fields, properties)),
+                acoustic_measure)
             result = client.query(query)
-            if acoustic_measure == 'formants':
-                results = []
-                for k, v in result.items():
-                    data = [x[1] for x in sorted(list(v)[0].items()) if x[0] != 'time']
-                    results.append({'speaker': k[1]['speaker'], 'F1': data[0], 'F2': data[1], 'F3': data[2]})
-                statement = '''WITH {{data}} as data
-                                UNWIND data as d
-                                MATCH (s:Speaker:{corpus_name})
-                                WHERE s.name = d.speaker
-                                SET s.{statistic}_F1 = d.F1
-                                AND s.{statistic}_F2 = d.F2
-                                AND s.{statistic}_F3 = d.F3'''.format(corpus_name=self.cypher_safe_name,
-                                                                      statistic=statistic)
-                self.hierarchy.add_speaker_properties(self, [('{}_F1'.format(statistic), float),
-                                                             ('{}_F2'.format(statistic), float),
-                                                             ('{}_F3'.format(statistic), float)])
-            else:
-                results = [{'speaker': k[1]['speaker'], acoustic_measure: list(v)[0][statistic]} for k, v in
-                           result.items()]
-                statement = '''WITH {{data}} as data
-                                UNWIND data as d
-                                MATCH (s:Speaker:{corpus_name})
-                                WHERE s.name = d.speaker
-                                SET s.{statistic}_{measure} = d.{measure}'''.format(corpus_name=self.cypher_safe_name,
-                                                                                    statistic=statistic,
-                                                                                    measure=acoustic_measure)
-                self.hierarchy.add_speaker_properties(self, [('{}_{}'.format(statistic, acoustic_measure), float)])
+            results = []
+            for (_, tags), points in result.items():
+                for point in points:
+                    d = {'speaker': tags['speaker']}
+                    d.update({p: point[p] for p in properties})
+                    results.append(d)
+            statement = '''UNWIND {{data}} as d
+                            MATCH (s:Speaker:{corpus_name})
+                            WHERE s.name = d.speaker
+                            SET {set_string}'''.format(corpus_name=self.cypher_safe_name,
+                                                      set_string=set_string.format(node='s'))
+            self.hierarchy.add_speaker_properties(self, [('{}_{}'.format(statistic, x), float) for x in properties])
         self.execute_cypher(statement, data=results)
         self.encode_hierarchy()
 
@@ -859,167 +889,53 @@ class AudioContext(SyllabicContext):
                 results = {x['speaker']: [x[name]] for x in results}
         return results
 
-    def relativize_pitch(self, by_speaker=True, by_phone=False):
-        if not by_speaker and not by_phone:
-            raise Exception('Relativization must be by phone, speaker, or both.')
-        client = self.acoustic_client()
-        phone_type = getattr(self, self.phone_name)
-
-        summary_data = {}
-        if by_phone:
-            for p in self.phones:
-                if by_speaker:
-                    query = '''select mean("F0"), stddev("F0") from "pitch" where "phone" = '{}' group by "speaker";'''.format(
-                        p)
-                    result = client.query(query)
-                    for k, v in result.items():
-                        v = list(v)
-                        summary_data[(k[1]['speaker'], p)] = v[0]['mean'], v[0]['stddev']
+    def relativize_pitch(self, by_speaker=True, by_phone=False, call_back=None, stop_check=None):
+        """
+        Save pitch values z-scored by speaker, phone, or both, as "F0_relativized"
 
-                else:
-                    query = '''select mean("F0"), stddev("F0") from "pitch" where "phone" = '{}';'''.format(p)
-                    result = client.query(query)
-                    for k, v in result.items():
-                        v = list(v)
-                        summary_data[p] = v[0]['mean'], v[0]['stddev']
-        else:
-            query = '''select mean("F0"), stddev("F0") from "pitch" where "phone" != '' group by "speaker";'''
-            result = client.query(query)
-            for k, v in result.items():
-                v = list(v)
-                summary_data[k[1]['speaker']] = v[0]['mean'], v[0]['stddev']
-
-        all_query = '''select * from "pitch"
-                        where "phone" != '' and "speaker" != '';'''
-        all_results = client.query(all_query)
-        data = []
-        for _, r in all_results.items():
-            for t_dict in r:
-                phone = t_dict.pop('phone')
-                if by_speaker and by_phone:
-                    mean_f0, sd_f0 = summary_data[(t_dict['speaker'], phone)]
-                elif by_phone and not by_speaker:
-                    mean_f0, sd_f0 = summary_data[phone]
-                elif by_speaker:
-                    mean_f0, sd_f0 = summary_data[t_dict['speaker']]
-                if sd_f0 is None:
-                    continue
-                pitch = t_dict.pop('F0')
-                if pitch is None:
-                    continue
-                time_point = t_dict.pop('time')
-                new_pitch = (pitch - mean_f0) / sd_f0
-                d = {'measurement': 'pitch',
-                     'tags': t_dict,
-                     "time": time_point,
-                     "fields": {'F0_relativized': new_pitch}
-                     }
-                data.append(d)
-        client.write_points(data, batch_size=1000)
-
-    def relativize_intensity(self, by_speaker=True):
-        client = self.acoustic_client()
-        phone_type = getattr(self, self.phone_name)
+        Parameters
+        ----------
+        by_speaker : bool
+            Flag for relativizing by speaker, defaults to True
+        by_phone : bool
+            Flag for relativizing by phone, defaults to False
+        call_back : callable
+            call back function, optional
+        stop_check : callable
+            stop check function, optional
+        """
+        relativize_acoustic_measure(self, 'pitch', ['F0'], by_speaker=by_speaker, by_phone=by_phone,
+                                    call_back=call_back, stop_check=stop_check)
 
-        summary_data = {}
-        for p in self.phones:
-            if by_speaker:
-                query = '''select mean("Intensity"), stddev("Intensity") from "intensity" where "phone" = '{}' group by "speaker";'''.format(
-                    p)
-                result = client.query(query)
-                for k, v in result.items():
-                    v = list(v)
-                    summary_data[(k[1]['speaker'], p)] = v[0]['mean'], v[0]['stddev']
+    def relativize_intensity(self, by_speaker=True, call_back=None, stop_check=None):
+        """
+        Save intensity values z-scored by phone, or by phone within speaker, as "Intensity_relativized"
 
-            else:
-                query = '''select mean("Intensity"), stddev("Intensity") from "intensity" where "phone" = '{}' ;'''.format(
-                    p)
-                result = client.query(query)
-                for k, v in result.items():
-                    v = list(v)
-                    summary_data[p] = v[0]['mean'], v[0]['stddev']
-
-        all_query = '''select * from "intensity"
-                        where "phone" != '' and "speaker" != '';'''
-        all_results = client.query(all_query)
-        data = []
-        for _, r in all_results.items():
-            for t_dict in r:
-                phone = t_dict.pop('phone')
-                if by_speaker:
-                    mean_intensity, sd_intensity = summary_data[(t_dict['speaker'], phone)]
-                else:
-                    mean_intensity, sd_intensity = summary_data[phone]
-                if sd_intensity is None:
-                    continue
-                intensity = t_dict.pop('Intensity')
-                if intensity is None:
-                    continue
-                time_point = t_dict.pop('time')
-                new_intensity = (intensity - mean_intensity) / sd_intensity
-                d = {'measurement': 'intensity',
-                     'tags': t_dict,
-                     "time": time_point,
-                     "fields": {'Intensity_relativized': new_intensity}
-                     }
-                data.append(d)
-        client.write_points(data, batch_size=1000)
-
-    def relativize_formants(self, by_speaker=True):
-        client = self.acoustic_client()
-        phone_type = getattr(self, self.phone_name)
+        Parameters
+        ----------
+        by_speaker : bool
+            Flag for relativizing within speakers, defaults to True
+        call_back : callable
+            call back function, optional
+        stop_check : callable
+            stop check function, optional
+        """
+        relativize_acoustic_measure(self, 'intensity', ['Intensity'], by_speaker=by_speaker, by_phone=True,
+                                    call_back=call_back, stop_check=stop_check)
 
-        summary_data = {}
-        for p in self.phones:
-            if by_speaker:
-                query = '''select mean("F1"), stddev("F1"), mean("F2"), stddev("F2"), mean("F3"), stddev("F3") from "formants" where "phone" = '{}' group by "speaker";'''.format(
-                    p)
-                result = client.query(query)
-                for k, v in result.items():
-                    v = list(v)
-                    summary_data[(k[1]['speaker'], p)] = v[0]['mean'], v[0]['stddev'], v[0]['mean_1'], v[0]['stddev_1'], \
-                                                         v[0]['mean_2'], v[0]['stddev_2']
+    def relativize_formants(self, by_speaker=True, call_back=None, stop_check=None):
+        """
+        Save formant values z-scored by phone, or by phone within speaker, as "F1_relativized",
+        "F2_relativized" and "F3_relativized"
 
-            else:
-                query = '''select mean("F1"), stddev("F1"), mean("F2"), stddev("F2"), mean("F3"), stddev("F3") from "formants" where "phone" = '{}';'''.format(
-                    p)
-                result = client.query(query)
-                for k, v in result.items():
-                    v = list(v)
-                    summary_data[p] = v[0]['mean'], v[0]['stddev'], v[0]['mean_1'], v[0]['stddev_1'], v[0]['mean_2'], \
-                                      v[0]['stddev_2']
-
-        all_query = '''select * from "formants"
-                        where "phone" != '' and "speaker" != '';'''
-        all_results = client.query(all_query)
-        data = []
-        for _, r in all_results.items():
-            for t_dict in r:
-                phone = t_dict.pop('phone')
-                if by_speaker:
-                    mean_F1, sd_F1, mean_F2, sd_F2, mean_F3, sd_F3 = summary_data[(t_dict['speaker'], phone)]
-                else:
-                    mean_F1, sd_F1, mean_F2, sd_F2, mean_F3, sd_F3 = summary_data[phone]
-                F1 = t_dict.pop('F1')
-                F2 = t_dict.pop('F2')
-                F3 = t_dict.pop('F3')
-                time_point = t_dict.pop('time')
-                fields = {}
-                if sd_F1 is not None and F1 is not None:
-                    new_F1 = (F1 - mean_F1) / sd_F1
-                    fields['F1_relativized'] = new_F1
-                if sd_F2 is not None and F2 is not None:
-                    new_F2 = (F2 - mean_F2) / sd_F2
-                    fields['F2_relativized'] = new_F2
-                if sd_F3 is not None and F3 is not None:
-                    new_F3 = (F3 - mean_F3) / sd_F3
-                    fields['F3_relativized'] = new_F3
-                if not fields:
-                    continue
-                d = {'measurement': 'formants',
-                     'tags': t_dict,
-                     "time": time_point,
-                     "fields": fields
-                     }
-                data.append(d)
-        client.write_points(data, batch_size=1000)
+        Parameters
+        ----------
+        by_speaker : bool
+            Flag for relativizing within speakers, defaults to True
+        call_back : callable
+            call back function, optional
+        stop_check : callable
+            stop check function, optional
+        """
+        relativize_acoustic_measure(self, 'formants', ['F1', 'F2', 'F3'], by_speaker=by_speaker, by_phone=True,
+                                    call_back=call_back, stop_check=stop_check)
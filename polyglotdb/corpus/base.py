@@ -17,6 +17,30 @@ from ..exceptions import (CorpusConfigError, GraphQueryError,
                           ConnectionError, AuthorizationError, TemporaryConnectionError,
                           NetworkAddressError)
 from ..structure import Hierarchy
+from ..io.importer.indexes import IndexManager
+
+
+def stream_records(session, result):
+    """
+    Generate the records of a result as they are fetched, closing the session once they have all been read
+
+    Parameters
+    ----------
+    session : :class:`neo4j.v1.Session`
+        Session that the statement was run in
+    result : :class:`neo4j.v1.StatementResult`
+        Result of the statement
+
+    Yields
+    ------
+    :class:`neo4j.v1.Record`
+        Record of the result
+    """
+    try:
+        for r in result.records():
+            yield r
+    finally:
+        session.close()
 
 
 class BaseContext(object):
@@ -49,6 +73,9 @@ class BaseContext(object):
 
         self._has_sound_files = None
         self._has_all_sound_files = None
+        self._acoustic_client = None
+        self.csv_writers = None
+        self.index_manager = IndexManager(self)
         if getattr(sys, 'frozen', False):
             self.config.reaper_path = os.path.join(sys.path[-1], 'reaper')
         else:
@@ -100,6 +127,34 @@ class BaseContext(object):
         except Exception as e:
             raise
 
+    def stream_cypher(self, statement, **parameters):
+        """
+        Executes a cypher query, keeping its session open so that records are fetched from the graph database as
+        they are read rather than all being buffered when the session closes
+
+        Parameters
+        ----------
+        statement : str
+            the cypher statement
+        parameters : dict
+            keyword arguments to execute a cypher statement
+
+        Returns
+        -------
+        generator
+            Records of the result
+        """
+        for k, v in parameters.items():
+            if isinstance(v, Decimal):
+                parameters[k] = float(v)
+        session = self.graph_driver.session()
+        try:
+            result = session.run(statement, **parameters)
+        except Exception:
+            session.close()
+            raise
+        return stream_records(session, result)
+
     @property
     def cypher_safe_name(self):
         return '`{}`'.format(self.corpus_name)
@@ -145,6 +200,18 @@ class BaseContext(object):
         with open(self.hierarchy_path, 'w', encoding='utf8') as f:
             json.dump(self.hierarchy.to_json(), f)
 
+    @property
+    def segment_cache_dir(self):
+        return os.path.join(self.config.data_dir, 'segments')
+
+    def clear_segment_cache(self):
+        '''
+        Remove segments saved by :func:`~polyglotdb.acoustics.segments.generate_segments`, so that they are
+        generated again from the changed corpus
+        '''
+        if os.path.exists(self.segment_cache_dir):
+            shutil.rmtree(self.segment_cache_dir)
+
     def load_hierarchy(self):
         import json
         with open(self.hierarchy_path, 'r', encoding='utf8') as f:
@@ -153,6 +220,12 @@ class BaseContext(object):
 
     def __exit__(self, exc_type, exc, exc_tb):
         self.graph_driver.close()
+        if self._acoustic_client is not None:
+            self._acoustic_client.close()
+            self._acoustic_client = None
+        if self.csv_writers is not None:
+            self.csv_writers.close()
+            self.csv_writers = None
         if exc_type is None:
             # try:
             #    shutil.rmtree(self.config.temp_dir)
@@ -258,6 +331,7 @@ class BaseContext(object):
         self.execute_cypher('''MATCH (n:{}:Speaker) DETACH DELETE n '''.format(self.cypher_safe_name))
         self.execute_cypher('''MATCH (n:{}:Discourse) DETACH DELETE n '''.format(self.cypher_safe_name))
         self.reset_hierarchy()
+        self.clear_segment_cache()
         self.execute_cypher('''MATCH (n:Corpus) where n.name = {corpus_name} DELETE n ''', corpus_name=self.corpus_name)
         self.hierarchy = Hierarchy(corpus_name=self.corpus_name)
         self.cache_hierarchy()
@@ -361,14 +435,46 @@ class BaseContext(object):
     def remove_discourse(self, name):
         '''
         Remove the nodes and relationships associated with a single
-        discourse in the corpus.
+        discourse in the corpus, including pauses and other tokens
+        relabelled by enrichment, the types that no other discourse
+        has tokens of, and the speakers that speak in no other discourse.
 
         Parameters
         ----------
         name : str
             Name of the discourse to remove
         '''
-        self.execute_cypher('''MATCH (n:{}:{})-[r]->() DELETE n, r'''.format(self.cypher_safe_name, name))
+        statement = '''MATCH (d:Discourse:{corpus_name}) WHERE d.name = {{discourse_name}}
+        OPTIONAL MATCH (d)<-[:spoken_in]-(:{corpus_name})-[:is_a]->(t)
+        WITH d, collect(DISTINCT t) AS types
+        OPTIONAL MATCH (d)<-[:spoken_in]-(n:{corpus_name})
+        OPTIONAL MATCH (n)<-[:annotates]-(s)
+        DETACH DELETE s, n, d
+        WITH DISTINCT types
+        UNWIND types AS t
+        WITH t WHERE NOT (t)<-[:is_a]-()
+        DETACH DELETE t'''.format(corpus_name=self.cypher_safe_name)
+        self.execute_cypher(statement, discourse_name=name)
+        statement = '''MATCH (s:Speaker:{corpus_name}) WHERE NOT (s)-[:speaks_in]->()
+        DETACH DELETE s'''.format(corpus_name=self.cypher_safe_name)
+        self.execute_cypher(statement)
+        self.clear_segment_cache()
+
+    def rename_discourse(self, name, new_name):
+        '''
+        Change the name of a discourse in the corpus.
+
+        Parameters
+        ----------
+        name : str
+            Name of the discourse
+        new_name : str
+            New name of the discourse
+        '''
+        statement = '''MATCH (d:Discourse:{corpus_name}) WHERE d.name = {{discourse_name}}
+        SET d.name = {{new_name}}'''.format(corpus_name=self.cypher_safe_name)
+        self.execute_cypher(statement, discourse_name=name, new_name=new_name)
+        self.clear_segment_cache()
 
     def discourse_annotations(self, name, annotations=None):
         '''
@@ -1,5 +1,5 @@
 import re
-from ..io.importer import feature_data_to_csvs, import_feature_csvs
+from ..io.importer import feature_data_to_csvs, import_feature_csvs, import_feature_rows
 from .lexical import LexicalContext
 from ..exceptions import SubsetError
 from ..io.enrichment.features import enrich_features_from_csv
@@ -92,8 +92,11 @@ class FeaturedContext(LexicalContext):
             type_data = {k: type(v) for k, v in next(iter(feature_data.values())).items()}
         labels = set(self.phones)
         feature_data = {k: v for k, v in feature_data.items() if k in labels}
-        feature_data_to_csvs(self, feature_data)
-        import_feature_csvs(self, type_data)
+        if self.config.enrichment_transport == 'bolt':
+            import_feature_rows(self, feature_data, type_data)
+        else:
+            feature_data_to_csvs(self, feature_data)
+            import_feature_csvs(self, type_data)
         self.hierarchy.add_type_properties(self, self.phone_name, type_data.items())
         self.encode_hierarchy()
 
@@ -1,18 +1,233 @@
 import os
+import json
+import hashlib
 import logging
 import time
 import csv
-from collections import defaultdict
+from uuid import uuid1
+from collections import defaultdict, deque
+from multiprocessing import Pool
 
-from ..acoustics.io import setup_audio
+from ..acoustics.io import setup_audio, add_discourse_sound_info, delete_discourse_acoustics
 
 from ..io.importer import (data_to_graph_csvs, import_csvs,
-                           data_to_type_csvs, import_type_csvs)
+                           data_to_type_csvs, import_type_csvs, TypeCSVWriter, initialize_graph_csvs,
+                           CSVWriterRegistry, bulk_import_csvs, bulk_indexes)
 
-from ..exceptions import ParseError
+from ..exceptions import ParseError, CorpusIntegrityError
+from ..structure import Hierarchy
 from .structured import StructuredContext
 
 
+def file_hash(path):
+    """
+    Calculate the SHA-1 hash of a file's contents
+
+    Parameters
+    ----------
+    path : str
+        Path to the file
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the file
+    """
+    sha = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def manifest_entry(path, previous=None):
+    """
+    Describe a file for the import manifest, reusing the hash of its previous entry if the file's
+    size and modification time have not changed
+
+    Parameters
+    ----------
+    path : str
+        Path to the file
+    previous : dict
+        Entry for the file from the last import, optional
+
+    Returns
+    -------
+    dict
+        Size, modification time and hash of the file, and the discourse of the previous entry
+    """
+    stat = os.stat(path)
+    if previous is not None and previous['size'] == stat.st_size and previous['mtime'] == stat.st_mtime:
+        return dict(previous)
+    entry = {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha1': file_hash(path), 'discourse': None}
+    if previous is not None:
+        entry['discourse'] = previous['discourse']
+    return entry
+
+
+def write_manifest(path, manifest, entries):
+    """
+    Update the import manifest with the entries of imported files
+
+    Parameters
+    ----------
+    path : str
+        Path to the manifest
+    manifest : dict
+        Current manifest, mapping file paths relative to the corpus directory to entries
+    entries : dict
+        Entries of the imported files
+    """
+    manifest.update(entries)
+    with open(path, 'w', encoding='utf8') as f:
+        json.dump(manifest, f)
+
+
+def directory_files(parser, path):
+    """
+    Find the files in a directory and its subdirectories that a parser can parse
+
+    Parameters
+    ----------
+    parser : :class:`~polyglotdb.io.parsers.BaseParser`
+        The type of parser used for corpus
+    path : str
+        Path to the directory
+
+    Returns
+    -------
+    list or None
+        Paths of the files, or None if the parser's stop check was triggered
+    """
+    paths = []
+    for root, subdirs, files in os.walk(path, followlinks=True):
+        for filename in files:
+            if parser.stop_check is not None and parser.stop_check():
+                return None
+            if not parser.match_extension(filename):
+                continue
+            paths.append(os.path.join(root, filename))
+    if len(paths) == 0:
+        raise (ParseError(
+            'No files in the specified directory matched the parser. Please check to make sure you have the correct parser.'))
+    return paths
+
+
+def copy_hierarchy(hierarchy):
+    """
+    Copy a hierarchy, so that it can be restored after changes
+
+    Parameters
+    ----------
+    hierarchy : :class:`~polyglotdb.structure.Hierarchy`
+        Hierarchy to copy
+
+    Returns
+    -------
+    :class:`~polyglotdb.structure.Hierarchy`
+        Copy of the hierarchy
+    """
+    copied = Hierarchy(corpus_name=hierarchy.corpus_name)
+    copied.from_json(json.loads(json.dumps(hierarchy.to_json())))
+    return copied
+
+
+def check_incremental_hierarchy(hierarchy, data_hierarchy):
+    """
+    Check that the annotation types of new data match those of the corpus it is added to
+
+    Corpora that have been enriched with annotation types such as syllables or utterances are rejected on
+    purpose.  New discourses are only imported at the levels of their files, so their phones would be
+    contained by words directly, while hierarchical queries of an enriched corpus follow its containment
+    paths through the enrichment levels and would silently leave the new discourses out.  Enrichment that
+    only adds properties, subsets or pause labels does not change annotation types and is kept.
+
+    Parameters
+    ----------
+    hierarchy : :class:`~polyglotdb.structure.Hierarchy`
+        Hierarchy of the corpus
+    data_hierarchy : :class:`~polyglotdb.structure.Hierarchy`
+        Hierarchy of the new data
+    """
+    if not hierarchy.annotation_types:
+        return
+    mismatched = [k for k in sorted(hierarchy.annotation_types | data_hierarchy.annotation_types)
+                  if k not in hierarchy or k not in data_hierarchy or hierarchy[k] != data_hierarchy[k]]
+    for k, v in sorted(hierarchy.subannotations.items()):
+        mismatched.extend(sorted(x for x in v if x not in data_hierarchy.subannotations.get(k, set())))
+    if mismatched:
+        raise (CorpusIntegrityError('Files can only be imported incrementally into corpora with the same '
+                                    'annotation types, but {} differ. Please reset the enrichment that '
+                                    'added annotation types, import the files, and encode it '
+                                    'again.'.format(', '.join(mismatched))))
+
+
+def parse_file(parser, path):
+    """
+    Parse a file, for use in a worker process
+
+    Parameters
+    ----------
+    parser : :class:`~polyglotdb.io.parsers.BaseParser`
+        The type of parser used for corpus
+    path : str
+        Path to the file
+
+    Returns
+    -------
+    :class:`~polyglotdb.io.helper.DiscourseData` or None
+        Parsed data, or None if the file could not be parsed
+    """
+    try:
+        data = parser.parse_discourse(path)
+    except ParseError:
+        return None
+    if data is None:
+        return None
+    for annotation_type in data.values():
+        for _ in annotation_type:
+            return data
+    raise ParseError('There was an issue using this parser to parse the file {}.'.format(path))
+
+
+def parse_files(parser, paths, num_jobs=1):
+    """
+    Parse files in a pool of processes, yielding the parsed data in the order of the files
+
+    At most twice as many files as processes are parsed ahead of the file being yielded.
+
+    Parameters
+    ----------
+    parser : :class:`~polyglotdb.io.parsers.BaseParser`
+        The type of parser used for corpus
+    paths : list
+        Paths of the files to parse
+    num_jobs : int
+        Number of processes to use
+
+    Yields
+    ------
+    :class:`~polyglotdb.io.helper.DiscourseData` or None
+        Parsed data for each file, or None if the file could not be parsed
+    """
+    if num_jobs <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield parse_file(parser, path)
+        return
+    pool = Pool(min(num_jobs, len(paths)))
+    try:
+        pending = deque()
+        for path in paths:
+            pending.append(pool.apply_async(parse_file, (parser, path)))
+            if len(pending) >= 2 * num_jobs:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+
+
 class ImportContext(StructuredContext):
     def add_types(self, types, type_headers):
         '''
@@ -30,6 +245,9 @@ class ImportContext(StructuredContext):
     def initialize_import(self, speakers, token_headers, subannotations=None):
         """ prepares corpus for import of types of annotations """
         directory = self.config.temporary_directory('csv')
+        if self.csv_writers is not None:
+            self.csv_writers.close()
+        self.csv_writers = CSVWriterRegistry()
         for s in speakers:
             for k, v in token_headers.items():
                 path = os.path.join(directory, '{}_{}.csv'.format(s, k))
@@ -45,27 +263,22 @@ class ImportContext(StructuredContext):
                             w = csv.DictWriter(f, header, delimiter=',')
                             w.writeheader()
 
-        def corpus_index(tx):
-            tx.run('CREATE CONSTRAINT ON (node:Corpus) ASSERT node.name IS UNIQUE')
-
-        def discourse_index(tx):
-            tx.run('CREATE INDEX ON :Discourse(name)')
-
-        def speaker_index(tx):
-            tx.run('CREATE INDEX ON :Speaker(name)')
-
         def corpus_create(tx, corpus_name):
             tx.run('MERGE (n:Corpus {name: $corpus_name}) return n', corpus_name=corpus_name)
 
+        self.index_manager.add_constraint('Corpus', 'name')
+        self.index_manager.add_index('Discourse', 'name')
+        self.index_manager.add_index('Speaker', 'name')
+        self.index_manager.create()
         with self.graph_driver.session() as session:
-            session.write_transaction(corpus_index)
-            session.write_transaction(discourse_index)
-            session.write_transaction(speaker_index)
             session.write_transaction(corpus_create, self.corpus_name)
 
-    def finalize_import(self, data, call_back=None, stop_check=None):
+    def finalize_import(self, data, call_back=None, stop_check=None, speakers=None):
         """ generates hierarchy and saves variables"""
-        import_csvs(self, data, call_back, stop_check)
+        if self.csv_writers is not None:
+            self.csv_writers.close()
+            self.csv_writers = None
+        import_csvs(self, data, call_back, stop_check, speakers=speakers)
         self.encode_hierarchy()
 
     def add_discourse(self, data):
@@ -105,7 +318,7 @@ class ImportContext(StructuredContext):
         log.info('Finished adding discourse {}!'.format(data.name))
         log.debug('Total time taken: {} seconds'.format(time.time() - begin))
 
-    def load(self, parser, path):
+    def load(self, parser, path, incremental=False):
         """
         Use a specified parser on a path to either a directory or a single
         file
@@ -117,6 +330,9 @@ class ImportContext(StructuredContext):
 
         path : str
             The location of the corpus
+        incremental : bool
+            Flag for only importing files of a directory that are new or have changed since the
+            last import, see :meth:`load_directory`
 
         Returns
         -------
@@ -126,7 +342,7 @@ class ImportContext(StructuredContext):
 
         if os.path.isdir(path):
             print("loading {} with {}".format(path, parser))
-            could_not_parse = self.load_directory(parser, path)
+            could_not_parse = self.load_directory(parser, path, incremental=incremental)
 
         else:
             could_not_parse = self.load_discourse(parser, path)
@@ -155,17 +371,30 @@ class ImportContext(StructuredContext):
         self.finalize_import(data)
         return []
 
-    def load_directory(self, parser, path):
+    def load_directory(self, parser, path, incremental=False):
         """
         Checks if it can parse each file in dir,
         initializes, adds types, adds data, and finalizes import
 
+        The size, modification time and hash of each imported file are recorded in a manifest in the corpus's
+        data directory.  In incremental mode, only files that are not in the manifest or that have changed are
+        parsed.  Discourses of changed files are set aside while their new versions are imported, and removed
+        along with their acoustic measurements once the import has finished; if the import fails, they are
+        restored.  New types are merged with
+        existing ones.  Corpora that have been enriched with annotation types that the files do not have, such
+        as syllables or utterances, cannot be imported into incrementally, since the new discourses would not
+        have those levels (see :func:`check_incremental_hierarchy`).  Property, subset and pause enrichment is
+        left intact, but is not applied to the new discourses until it is encoded again.  Files of discourses
+        that were imported before the manifest existed are recorded without being imported again.
+
         Parameters
         ----------
         parser : :class:`~polyglotdb.io.parsers.BaseParser`
                 the type of parser used for corpus
         path : str
             the location of the directory
+        incremental : bool
+            Flag for only importing new or changed files, defaults to False
 
         Returns
         -------
@@ -177,73 +406,222 @@ class ImportContext(StructuredContext):
         if call_back is not None:
             call_back('Finding  files...')
             call_back(0, 0)
-        file_tuples = []
-        for root, subdirs, files in os.walk(path, followlinks=True):
-            for filename in files:
-                if parser.stop_check is not None and parser.stop_check():
-                    return
-                if not parser.match_extension(filename):
+        paths = directory_files(parser, path)
+        if paths is None:
+            return
+        stop_check = parser.stop_check
+        parser.stop_check = None
+        manifest_path = os.path.join(self.config.data_dir, 'import_manifest.json')
+        manifest = {}
+        if incremental and os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf8') as f:
+                manifest = json.load(f)
+        existing = set(self.discourses) if incremental else set()
+        entries = {}
+        replaced = {}
+        to_parse = []
+        for p in paths:
+            key = os.path.relpath(p, path)
+            previous = manifest.get(key, None)
+            entries[key] = manifest_entry(p, previous)
+            if previous is not None and previous['discourse'] in existing:
+                if entries[key]['sha1'] == previous['sha1']:
                     continue
-                file_tuples.append((root, filename))
-        if len(file_tuples) == 0:
-            raise (ParseError(
-                'No files in the specified directory matched the parser. Please check to make sure you have the correct parser.'))
+                replaced[p] = previous['discourse']
+            to_parse.append(p)
+        paths = to_parse
+        if not paths:
+            parser.stop_check = stop_check
+            parser.call_back = call_back
+            return []
         if call_back is not None:
-            call_back('Parsing types...')
-            call_back(0, len(file_tuples))
-            cur = 0
+            call_back('Parsing files...')
+            call_back(0, len(paths))
+        if incremental:
+            previous_hierarchy = copy_hierarchy(self.hierarchy)
+        self.initialize_import([], {})
+        type_writer = TypeCSVWriter(self)
+        initialized = set()
+        could_not_parse = []
         speakers = set()
-        types = defaultdict(set)
-        type_headers = None
-        token_headers = None
-        subannotations = None
-        for i, t in enumerate(file_tuples):
-            if parser.stop_check is not None and parser.stop_check():
-                return
-            if call_back is not None:
-                call_back('Parsing types from file {} of {}...'.format(i + 1, len(file_tuples)))
-                call_back(i)
-            root, filename = t
-            path = os.path.join(root, filename)
-            try:
-                information = parser.parse_information(path, self.corpus_name)
-                if not information['type_headers']:
-                    raise ParseError('There was an issue using this parser to parse the file {}.'.format(path))
-                speakers.update(information['speakers'])
-                type_headers = information['type_headers']
-                token_headers = information['token_headers']
-                subannotations = information['subannotations']
-            except ParseError:
-                print (t)
-                raise
-                continue
-            for k, v in information['types'].items():
-                types[k].update(v)
-        if call_back is not None:
-            call_back('Importing types...')
-        self.initialize_import(speakers, token_headers, subannotations)
-        self.add_types(types, type_headers)
+        imported = {}
+        set_aside = []
+        data = None
+        finished = False
+        try:
+            for i, parsed in enumerate(parse_files(parser, paths, self.config.num_jobs)):
+                if stop_check is not None and stop_check():
+                    return
+                if call_back is not None:
+                    call_back('Parsing file {} of {} ({})...'.format(i + 1, len(paths),
+                                                                     os.path.splitext(os.path.basename(paths[i]))[0]))
+                    call_back(i)
+                if parsed is None:
+                    could_not_parse.append(paths[i])
+                    continue
+                key = os.path.relpath(paths[i], path)
+                entries[key]['discourse'] = parsed.name
+                imported[key] = entries[key]
+                if paths[i] not in replaced and parsed.name in existing:
+                    continue
+                if incremental:
+                    check_incremental_hierarchy(previous_hierarchy, parsed.hierarchy)
+                if paths[i] in replaced:
+                    name = replaced[paths[i]]
+                    set_aside.append((name, '{}_replaced_{}'.format(name, uuid1()), parsed.name))
+                    self.rename_discourse(name, set_aside[-1][1])
+                data = parsed
+                speakers.update(data.speakers)
+                type_writer.add(data)
+                initialize_graph_csvs(self, data, initialized)
+                self.add_discourse(data)
+            type_writer.close()
+            if data is not None:
+                if incremental:
+                    hierarchy = copy_hierarchy(previous_hierarchy)
+                    hierarchy.merge(self.hierarchy)
+                    self.hierarchy = hierarchy
+                if call_back is not None:
+                    call_back('Importing types...')
+                import_type_csvs(self, type_writer.type_headers)
+                self.finalize_import(data, call_back, stop_check, speakers=sorted(speakers))
+            finished = True
+        finally:
+            type_writer.close()
+            parser.stop_check = stop_check
+            if not finished:
+                for name, temporary_name, new_name in set_aside:
+                    # Measurements of the set aside discourse are stored under its name, so the new discourse
+                    # is renamed before it is removed
+                    failed_name = '{}_failed_{}'.format(new_name, uuid1())
+                    self.rename_discourse(new_name, failed_name)
+                    self.remove_discourse(failed_name)
+                    self.rename_discourse(temporary_name, name)
+                if incremental:
+                    self.hierarchy = previous_hierarchy
+        for name, temporary_name, new_name in set_aside:
+            self.remove_discourse(temporary_name)
+            delete_discourse_acoustics(self, name)
+        if data is None and not (incremental and imported):
+            raise (ParseError('None of the files in the specified directory could be parsed.'))
+        write_manifest(manifest_path, manifest, imported)
+        parser.call_back = call_back
+        return could_not_parse
+
+    @property
+    def bulk_import_path(self):
+        return os.path.join(self.config.data_dir, 'bulk_import.json')
+
+    def bulk_load_directory(self, parser, path, database):
+        """
+        Parse a directory and load it into a new graph database with the Neo4j bulk importer, which is much
+        faster than importing through Cypher statements for large corpora
+
+        ``neo4j-admin import``, set with ``neo4j_admin_path`` in the corpus config, writes the corpus into the
+        database ``database`` of the local Neo4j installation.  The running server and its databases are left
+        alone, so ``database`` must be a new database name.  To use the imported corpus, set
+        ``dbms.active_database`` to ``database`` in neo4j.conf, restart Neo4j, and call
+        :meth:`finish_bulk_import` to create the indexes, audio information and hierarchy of the corpus.
+
+        Parameters
+        ----------
+        parser : :class:`~polyglotdb.io.parsers.BaseParser`
+                the type of parser used for corpus
+        path : str
+            the location of the directory
+        database : str
+            Name of the new graph database
 
+        Returns
+        -------
+        could_not_parse : list
+            list of files that were not able to be parsed
+        """
+        call_back = parser.call_back
+        parser.call_back = None
+        if call_back is not None:
+            call_back('Finding  files...')
+            call_back(0, 0)
+        paths = directory_files(parser, path)
+        if paths is None:
+            parser.call_back = call_back
+            return
         if call_back is not None:
             call_back('Parsing files...')
-            call_back(0, len(file_tuples))
-            cur = 0
+            call_back(0, len(paths))
+        stop_check = parser.stop_check
+        parser.stop_check = None
+        self.csv_writers = CSVWriterRegistry()
+        type_writer = TypeCSVWriter(self)
+        hierarchy = Hierarchy(corpus_name=self.corpus_name)
+        initialized = set()
         could_not_parse = []
-        for i, t in enumerate(file_tuples):
-            if parser.stop_check is not None and parser.stop_check():
-                return
-            root, filename = t
-            name = os.path.splitext(filename)[0]
-            if call_back is not None:
-                call_back('Parsing file {} of {} ({})...'.format(i + 1, len(file_tuples), name))
-                call_back(i)
-            path = os.path.join(root, filename)
-            try:
-                data = parser.parse_discourse(path)
-            except ParseError:
-                could_not_parse.append(path)
-                continue
-            self.add_discourse(data)
-        self.finalize_import(data, call_back, parser.stop_check)
-        parser.call_back = call_back
+        speaks_in = []
+        sound_files = []
+        discourses = set()
+        data = None
+        try:
+            for i, parsed in enumerate(parse_files(parser, paths, self.config.num_jobs)):
+                if stop_check is not None and stop_check():
+                    return
+                if call_back is not None:
+                    call_back('Parsing file {} of {} ({})...'.format(i + 1, len(paths),
+                                                                     os.path.splitext(os.path.basename(paths[i]))[0]))
+                    call_back(i)
+                if parsed is None:
+                    could_not_parse.append(paths[i])
+                    continue
+                data = parsed
+                if data.name in discourses:
+                    raise (ParseError('The discourse \'{}\' already exists in this corpus.'.format(data.name)))
+                discourses.add(data.name)
+                type_writer.add(data)
+                initialize_graph_csvs(self, data, initialized)
+                for s in data.speakers:
+                    speaks_in.append((s, data.name, data.speaker_channel_mapping.get(s, 0)))
+                data.corpus_name = self.corpus_name
+                data_to_graph_csvs(self, data)
+                hierarchy.update(data.hierarchy)
+                if data.wav_path is not None and os.path.exists(data.wav_path):
+                    sound_files.append((data.name, data.wav_path))
+        finally:
+            type_writer.close()
+            self.csv_writers.close()
+            self.csv_writers = None
+            parser.stop_check = stop_check
+            parser.call_back = call_back
+        if data is None:
+            raise (ParseError('None of the files in the specified directory could be parsed.'))
+        bulk_import_csvs(self, data, type_writer.type_headers, speaks_in, database, call_back)
+        with open(self.bulk_import_path, 'w', encoding='utf8') as f:
+            json.dump({'database': database, 'hierarchy': hierarchy.to_json(), 'sound_files': sound_files,
+                       'indexes': bulk_indexes(data, type_writer.type_headers)}, f)
         return could_not_parse
+
+    def finish_bulk_import(self):
+        """
+        Create the indexes, audio information and hierarchy of a corpus loaded with :meth:`bulk_load_directory`,
+        once the graph database server has been switched to the database it was loaded into
+        """
+        if not os.path.exists(self.bulk_import_path):
+            raise (CorpusIntegrityError('There is no bulk import of {} to finish.'.format(self.corpus_name)))
+        with open(self.bulk_import_path, 'r', encoding='utf8') as f:
+            bulk_import = json.load(f)
+        statement = 'MATCH (c:Corpus) WHERE c.name = {corpus_name} RETURN c LIMIT 1'
+        if not list(self.execute_cypher(statement, corpus_name=self.corpus_name)):
+            raise (CorpusIntegrityError('The graph database does not contain {}, please set dbms.active_database '
+                                        'to \'{}\' and restart Neo4j.'.format(self.corpus_name,
+                                                                              bulk_import['database'])))
+        self.index_manager.reset()
+        for kind, label, property in bulk_import['indexes']:
+            if kind == 'constraint':
+                self.index_manager.add_constraint(label, property)
+            else:
+                self.index_manager.add_index(label, property)
+        self.index_manager.create()
+        for name, wav_path in bulk_import['sound_files']:
+            add_discourse_sound_info(self, name, wav_path)
+        self.hierarchy = Hierarchy(corpus_name=self.corpus_name)
+        self.hierarchy.from_json(bulk_import['hierarchy'])
+        self.encode_hierarchy()
+        os.remove(self.bulk_import_path)
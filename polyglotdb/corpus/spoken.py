@@ -1,5 +1,5 @@
-from ..io.importer import (speaker_data_to_csvs, import_speaker_csvs,
-                           discourse_data_to_csvs, import_discourse_csvs)
+from ..io.importer import (speaker_data_to_csvs, import_speaker_csvs, import_speaker_rows,
+                           discourse_data_to_csvs, import_discourse_csvs, import_discourse_rows)
 from .audio import AudioContext
 from ..io.enrichment.spoken import enrich_speakers_from_csv, enrich_discourses_from_csv
 
@@ -61,8 +61,11 @@ class SpokenContext(AudioContext):
         speakers = set(self.speakers)
         speaker_data = {k: v for k, v in speaker_data.items() if k in speakers}
 
-        speaker_data_to_csvs(self, speaker_data)
-        import_speaker_csvs(self, type_data)
+        if self.config.enrichment_transport == 'bolt':
+            import_speaker_rows(self, speaker_data, type_data)
+        else:
+            speaker_data_to_csvs(self, speaker_data)
+            import_speaker_csvs(self, type_data)
         self.hierarchy.add_speaker_properties(self, type_data.items())
         self.encode_hierarchy()
 
@@ -103,8 +106,11 @@ class SpokenContext(AudioContext):
         discourses = set(self.discourses)
         print(discourses, discourse_data)
         discourse_data = {k: v for k, v in discourse_data.items() if k in discourses}
-        discourse_data_to_csvs(self, discourse_data)
-        import_discourse_csvs(self, type_data)
+        if self.config.enrichment_transport == 'bolt':
+            import_discourse_rows(self, discourse_data, type_data)
+        else:
+            discourse_data_to_csvs(self, discourse_data)
+            import_discourse_csvs(self, type_data)
         self.hierarchy.add_discourse_properties(self, type_data.items())
         self.encode_hierarchy()
 
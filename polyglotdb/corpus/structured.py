@@ -129,6 +129,7 @@ class StructuredContext(BaseContext):
         """
         encodes hierarchy
         """
+        self.clear_segment_cache()
         self.reset_hierarchy()
         hierarchy_template = '''({super})<-[:contained_by]-({sub})-[:is_a]->({sub_type})'''
         subannotation_template = '''({super})<-[:annotates]-({sub})'''
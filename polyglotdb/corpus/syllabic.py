@@ -4,7 +4,8 @@ import re
 from ..io.importer import (syllables_data_to_csvs, import_syllable_csv,
                            nonsyls_data_to_csvs, import_nonsyl_csv,
                            create_syllabic_csvs, create_nonsyllabic_csvs,
-                           syllables_enrichment_data_to_csvs, import_syllable_enrichment_csvs)
+                           syllables_enrichment_data_to_csvs, import_syllable_enrichment_csvs,
+                           import_syllable_enrichment_rows)
 
 # from ..io.importer import syllables_enrichment_data_to_csvs
 from ..io.helper import make_type_id
@@ -328,8 +329,11 @@ return coda, count(coda) as freq'''.format(corpus_name=self.cypher_safe_name,
 
             # labels = set(self.lexicon.syllables())
             #  syllable_data = {k: v for k,v in syllable_data.items() if k in labels}
-        syllables_enrichment_data_to_csvs(self, syllable_data)
-        import_syllable_enrichment_csvs(self, type_data)
+        if self.config.enrichment_transport == 'bolt':
+            import_syllable_enrichment_rows(self, syllable_data, type_data)
+        else:
+            syllables_enrichment_data_to_csvs(self, syllable_data)
+            import_syllable_enrichment_csvs(self, type_data)
         # self.hierarchy.add_type_labels(self, 'syllable', ['test'])
         self.hierarchy.add_type_properties(self, 'syllable', type_data.items())
 
@@ -4,7 +4,7 @@ from ..query.annotations import SpeakerGraphQuery
 from ..query.base.func import Max, Min
 from ..exceptions import GraphQueryError
 from ..io.importer import utterance_data_to_csvs, import_utterance_csv, create_utterance_csvs, \
-    utterance_enriched_data_to_csvs, import_utterance_enrichment_csvs
+    utterance_enriched_data_to_csvs, import_utterance_enrichment_csvs, import_utterance_enrichment_rows
 from .pause import PauseContext
 
 
@@ -380,7 +380,10 @@ ORDER BY begin'''.format(corpus=self.cypher_safe_name, word_type=word_type)
             type_data = {k: type(v) for k, v in next(iter(utterance_data.values())).items()}
 
         # self.add_type_properties('utterance', type_data)
-        utterance_enriched_data_to_csvs(self, utterance_data)
-        import_utterance_enrichment_csvs(self, type_data)
+        if self.config.enrichment_transport == 'bolt':
+            import_utterance_enrichment_rows(self, utterance_data, type_data)
+        else:
+            utterance_enriched_data_to_csvs(self, utterance_data)
+            import_utterance_enrichment_csvs(self, type_data)
         self.hierarchy.add_type_properties(self, 'utterance', type_data.items())
         self.encode_hierarchy()
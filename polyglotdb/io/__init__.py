@@ -10,7 +10,7 @@ from .inspect import (inspect_buckeye, inspect_csv, inspect_orthography,
                     inspect_ilg, inspect_mfa, inspect_labbcat,
                     inspect_fave, inspect_partitur)
 
-from .exporters import save_results
+from .exporters import save_results, save_parquet, results_to_table
 
 from .enrichment import (enrich_lexicon_from_csv,enrich_features_from_csv,
                         enrich_speakers_from_csv, enrich_discourses_from_csv)
@@ -1 +1,2 @@
 from .csv import save_results
+from .arrow import save_parquet, results_to_table
@@ -0,0 +1,361 @@
+from decimal import Decimal
+
+ARROW_BATCH_SIZE = 10000
+
+
+def import_pyarrow():
+    """
+    Import the ``pyarrow`` package, which is only needed for exporting to Arrow and Parquet
+
+    Returns
+    -------
+    module
+        The ``pyarrow`` package
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError('Exporting to Arrow or Parquet requires the pyarrow package (pip install pyarrow).')
+    return pyarrow
+
+
+def value_type(value):
+    """
+    Get the type of a single value, with numbers other than booleans treated as floats, as later values of a
+    column without a known type may not be integers
+
+    Parameters
+    ----------
+    value : object
+        Value that is not None
+
+    Returns
+    -------
+    type, tuple or None
+        One of float, bool or str, or a tuple of list and the type of the list's elements, or None for lists
+        without values
+    """
+    if isinstance(value, bool):
+        return bool
+    if isinstance(value, (int, float, Decimal)):
+        return float
+    if isinstance(value, (list, tuple)):
+        element_type = infer_type(value)
+        if element_type is None:
+            return None
+        return list, element_type
+    return str
+
+
+def infer_type(values):
+    """
+    Infer the type of a column from its first value that is not None or an empty list
+
+    Parameters
+    ----------
+    values : iterable
+        Values of the column
+
+    Returns
+    -------
+    type, tuple or None
+        Type of the column, see :func:`value_type`, or None if all values are None
+    """
+    for v in values:
+        if v is not None:
+            t = value_type(v)
+            if t is not None:
+                return t
+    return None
+
+
+def arrow_type(column_type):
+    """
+    Get the Arrow type for values of a column, with strings dictionary encoded
+
+    Parameters
+    ----------
+    column_type : type or tuple
+        Type of the column's values, or a tuple of list and the type of the list's elements
+
+    Returns
+    -------
+    :class:`pyarrow.DataType`
+        Arrow type
+    """
+    pa = import_pyarrow()
+    if column_type is float:
+        return pa.float64()
+    if column_type is int:
+        return pa.int64()
+    if column_type is bool:
+        return pa.bool_()
+    if column_type is list:
+        column_type = list, str
+    if isinstance(column_type, tuple):
+        element_type = arrow_type(column_type[1])
+        if pa.types.is_dictionary(element_type):
+            element_type = pa.string()
+        return pa.list_(element_type)
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def convert_value(value, column_type):
+    """
+    Convert a value for a column of a type, without converting values of other types
+
+    Integers are accepted for float columns and numbers without a fractional part for integer columns.
+
+    Parameters
+    ----------
+    value : object
+        Value that is not None
+    column_type : type or tuple
+        Type of the column
+
+    Returns
+    -------
+    object
+        Converted value
+    """
+    if column_type is list:
+        column_type = list, str
+    if isinstance(column_type, tuple):
+        if not isinstance(value, (list, tuple)):
+            raise ValueError(value)
+        return [None if x is None else convert_value(x, column_type[1]) for x in value]
+    if column_type is float:
+        if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+            return float(value)
+    elif column_type is int:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, (float, Decimal)) and value == int(value):
+            return int(value)
+    elif column_type is bool:
+        if isinstance(value, bool):
+            return value
+    elif isinstance(value, str):
+        return value
+    raise ValueError(value)
+
+
+def convert_values(values, column, column_type):
+    """
+    Convert the values of a column to its type, keeping missing values as None
+
+    Parameters
+    ----------
+    values : list
+        Values of the column
+    column : str
+        Name of the column
+    column_type : type or tuple
+        Type of the column
+
+    Returns
+    -------
+    list
+        Converted values
+    """
+    try:
+        return [None if v is None else convert_value(v, column_type) for v in values]
+    except ValueError as e:
+        raise ValueError('The column {} has the value {!r}, which does not match its type {}. Please '
+                         'specify the type of the column with column_types.'.format(column, e.args[0], column_type))
+
+
+def arrow_schema(header, column_types):
+    """
+    Create the Arrow schema for a set of columns
+
+    Parameters
+    ----------
+    header : list
+        Column names
+    column_types : dict
+        Column names mapped to the types of their values
+
+    Returns
+    -------
+    :class:`pyarrow.Schema`
+        Schema of the columns
+    """
+    pa = import_pyarrow()
+    return pa.schema([pa.field(k, arrow_type(column_types[k])) for k in header])
+
+
+def record_batches(rows, header, column_types=None, batch_size=ARROW_BATCH_SIZE):
+    """
+    Group rows into Arrow record batches, with a typed column for each field of the header
+
+    Columns without a known type are typed from their first value, see :func:`infer_type`, and values that
+    do not match the type of their column raise a ValueError rather than being converted.  If a column has no
+    type after the first batch, that batch is held back while the next one is read, after which columns that
+    still have no type are typed as strings (or lists of strings), so that at most one batch is held back.
+
+    Parameters
+    ----------
+    rows : iterable
+        Dictionaries of column values
+    header : list
+        Column names
+    column_types : dict
+        Column names mapped to the types of their values, where known
+    batch_size : int
+        Number of rows per batch, defaults to 10000
+
+    Yields
+    ------
+    :class:`pyarrow.RecordBatch`
+        Batch of rows, all sharing the same schema
+    """
+    pa = import_pyarrow()
+    if column_types is None:
+        column_types = {}
+    types = {k: column_types.get(k) for k in header}
+    schema = None
+    pending = []
+    lists = set()
+    for batch in row_batches(rows, batch_size):
+        columns = []
+        for k in header:
+            values = [r.get(k) for r in batch]
+            if types[k] is None:
+                types[k] = infer_type(values)
+            if types[k] is None:
+                if any(isinstance(v, (list, tuple)) for v in values):
+                    lists.add(k)
+                columns.append(values)
+            else:
+                columns.append(pa.array(convert_values(values, k, types[k]), type=arrow_type(types[k])))
+        pending.append(columns)
+        if schema is None:
+            if any(types[k] is None for k in header):
+                if len(pending) < 2:
+                    continue
+                for k in header:
+                    if types[k] is None:
+                        types[k] = (list, str) if k in lists else str
+            schema = arrow_schema(header, types)
+        for record_batch in typed_batches(pending, header, types, schema):
+            yield record_batch
+        pending = []
+    if pending:
+        if schema is None:
+            for k in header:
+                if types[k] is None:
+                    types[k] = (list, str) if k in lists else str
+            schema = arrow_schema(header, types)
+        for record_batch in typed_batches(pending, header, types, schema):
+            yield record_batch
+
+
+def row_batches(rows, batch_size):
+    """
+    Group rows into lists of at most ``batch_size`` rows
+
+    Yields
+    ------
+    list
+        Batch of rows
+    """
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def typed_batches(pending, header, types, schema):
+    """
+    Create record batches from the columns of batches, converting the columns that were held back
+    as lists of values until the type of the column was known
+
+    Parameters
+    ----------
+    pending : list
+        Column arrays or lists of values of each batch
+    header : list
+        Column names
+    types : dict
+        Column names mapped to the types of their values
+    schema : :class:`pyarrow.Schema`
+        Schema of the batches
+
+    Yields
+    ------
+    :class:`pyarrow.RecordBatch`
+        Batch of rows
+    """
+    pa = import_pyarrow()
+    for columns in pending:
+        arrays = [pa.array(convert_values(c, k, types[k]), type=f.type) if isinstance(c, list) else c
+                  for c, k, f in zip(columns, header, schema)]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def results_to_table(rows, header, column_types=None, batch_size=ARROW_BATCH_SIZE):
+    """
+    Convert rows of results to an Arrow table
+
+    Parameters
+    ----------
+    rows : iterable
+        Dictionaries of column values
+    header : list
+        Column names
+    column_types : dict
+        Column names mapped to the types of their values, where known
+    batch_size : int
+        Number of rows per record batch, defaults to 10000
+
+    Returns
+    -------
+    :class:`pyarrow.Table`
+        Table of the results
+    """
+    pa = import_pyarrow()
+    if column_types is None:
+        column_types = {}
+    batches = list(record_batches(rows, header, column_types, batch_size))
+    if not batches:
+        return arrow_schema(header, {k: column_types.get(k) for k in header}).empty_table()
+    return pa.Table.from_batches(batches)
+
+
+def save_parquet(rows, path, header, column_types=None, batch_size=ARROW_BATCH_SIZE):
+    """
+    Write rows of results to a Parquet file, one record batch at a time
+
+    Parameters
+    ----------
+    rows : iterable
+        Dictionaries of column values
+    path : str
+        Path of the Parquet file
+    header : list
+        Column names
+    column_types : dict
+        Column names mapped to the types of their values, where known
+    batch_size : int
+        Number of rows per record batch, defaults to 10000
+    """
+    import_pyarrow()
+    import pyarrow.parquet as pq
+    if column_types is None:
+        column_types = {}
+    writer = None
+    try:
+        for batch in record_batches(rows, header, column_types, batch_size):
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema)
+            writer.write_batch(batch)
+        if writer is None:
+            pq.write_table(arrow_schema(header, {k: column_types.get(k) for k in header}).empty_table(), path)
+    finally:
+        if writer is not None:
+            writer.close()
@@ -1,5 +1,7 @@
 import csv
 
+WRITE_BUFFER_SIZE = 1024 * 1024
+
 
 def make_safe(value, delimiter):
     """
@@ -43,7 +45,7 @@ def save_results(results, path, header=None, mode='w'):
     if header is None:
         header = results.columns
     if isinstance(path, str):
-        with open(path, mode, encoding='utf8', newline='') as f:
+        with open(path, mode, encoding='utf8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
             writer = csv.DictWriter(f, header)
             if mode != 'a':
                 writer.writeheader()
@@ -7,9 +7,9 @@ import hashlib
 import wave
 from collections import Counter
 
-from textgrid import TextGrid
+from polyglotdb.exceptions import DelimiterError
 
-from polyglotdb.exceptions import DelimiterError, TextGridError
+from .textgrid import read_textgrid
 
 ATT_TYPES = ['orthography', 'transcription', 'numeric',
              'morpheme', 'tobi', 'grouping']
@@ -366,11 +366,7 @@ def guess_textgrid_format(path):
                 if not f.lower().endswith('.textgrid'):
                     continue
                 tg_path = os.path.join(root, f)
-                tg = TextGrid()
-                try:
-                    tg.read(tg_path)
-                except ValueError as e:
-                    raise (TextGridError('The file {} could not be parsed: {}'.format(tg_path, str(e))))
+                tg = read_textgrid(tg_path)
 
                 labbcat_parser = inspect_labbcat(tg_path)
                 mfa_parser = inspect_mfa(tg_path)
@@ -385,8 +381,7 @@ def guess_textgrid_format(path):
                     counts[None] += 1
         return max(counts.keys(), key=lambda x: counts[x])
     elif path.lower().endswith('.textgrid'):
-        tg = TextGrid()
-        tg.read(path)
+        tg = read_textgrid(path)
         labbcat_parser = inspect_labbcat(path)
         mfa_parser = inspect_mfa(path)
         fave_parser = inspect_fave(path)
@@ -1,13 +1,18 @@
-from .to_csv import (data_to_type_csvs, data_to_graph_csvs,
-                     utterance_data_to_csvs, subannotations_data_to_csv,
+from .to_csv import (data_to_type_csvs, data_to_graph_csvs, TypeCSVWriter, initialize_graph_csvs,
+                     CSVWriterRegistry, graph_csvs_to_bulk_csvs, utterance_data_to_csvs, subannotations_data_to_csv,
                      lexicon_data_to_csvs, syllables_data_to_csvs,
                      nonsyls_data_to_csvs, feature_data_to_csvs,
                      speaker_data_to_csvs, discourse_data_to_csvs,
                      create_utterance_csvs, create_syllabic_csvs,
                      create_nonsyllabic_csvs, syllables_enrichment_data_to_csvs, utterance_enriched_data_to_csvs)
 
-from .from_csv import (import_type_csvs, import_csvs, import_lexicon_csvs,
+from .from_csv import (import_type_csvs, import_csvs, bulk_import_csvs, bulk_indexes, import_lexicon_csvs,
                        import_utterance_csv, import_subannotation_csv,
                        import_syllable_csv, import_nonsyl_csv,
                        import_feature_csvs, import_speaker_csvs,
                        import_discourse_csvs, import_syllable_enrichment_csvs, import_utterance_enrichment_csvs)
+
+from .indexes import IndexManager
+
+from .from_rows import (import_lexicon_rows, import_feature_rows, import_speaker_rows,
+                        import_discourse_rows, import_syllable_enrichment_rows, import_utterance_enrichment_rows)
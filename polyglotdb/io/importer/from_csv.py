@@ -1,5 +1,6 @@
 import os
 import logging
+import subprocess
 import time
 
 
@@ -22,22 +23,24 @@ def import_type_csvs(corpus_context, type_headers):
     """
     log = logging.getLogger('{}_loading'.format(corpus_context.corpus_name))
     prop_temp = '''{name}: csvLine.{name}'''
+    indexes = corpus_context.index_manager
+    for at in type_headers:
+        indexes.add_constraint('%s_type' % at, 'id')
+    indexes.create()
     for at, h in type_headers.items():
         path = os.path.join(corpus_context.config.temporary_directory('csv'),
                             '{}_type.csv'.format(at))
         type_path = 'file:///{}'.format(make_path_safe(path))
 
-        corpus_context.execute_cypher('CREATE CONSTRAINT ON (node:%s_type) ASSERT node.id IS UNIQUE' % at)
-
         properties = []
         for x in h:
             properties.append(prop_temp.format(name=x))
         if 'label' in h:
             properties.append('label_insensitive: lower(csvLine.label)')
-            corpus_context.execute_cypher('CREATE INDEX ON :%s_type(label_insensitive)' % at)
+            indexes.add_index('%s_type' % at, 'label_insensitive')
         for x in h:
             if x != 'id':
-                corpus_context.execute_cypher('CREATE INDEX ON :%s_type(%s)' % (at, x))
+                indexes.add_index('%s_type' % at, x)
         if properties:
             type_prop_string = ', '.join(properties)
         else:
@@ -63,9 +66,10 @@ MERGE (n:{annotation_type}_type:{corpus_name} {{ {type_property_string} }})
 
         log.info('Finished loading {} types!'.format(at))
         log.debug('{} type loading took: {} seconds.'.format(at, time.time() - begin))
+    indexes.create()
 
 
-def import_csvs(corpus_context, data, call_back=None, stop_check=None):
+def import_csvs(corpus_context, data, call_back=None, stop_check=None, speakers=None):
     """
     Loads data from a csv file
 
@@ -75,6 +79,8 @@ def import_csvs(corpus_context, data, call_back=None, stop_check=None):
         the corpus to load into
     data : :class:`~polyglotdb.io.helper.DiscourseData`
         the data object
+    speakers : list
+        Speakers whose CSV files should be loaded, defaults to all speakers in the corpus
     """
     log = logging.getLogger('{}_loading'.format(corpus_context.corpus_name))
     log.info('Beginning to import {} into the graph database...'.format(data.name))
@@ -84,7 +90,8 @@ def import_csvs(corpus_context, data, call_back=None, stop_check=None):
     prop_temp = '''{name}: csvLine.{name}'''
 
     directory = corpus_context.config.temporary_directory('csv')
-    speakers = corpus_context.speakers
+    if speakers is None:
+        speakers = corpus_context.speakers
     annotation_types = data.highest_to_lowest()
     if call_back is not None:
         call_back('Importing data...')
@@ -92,93 +99,88 @@ def import_csvs(corpus_context, data, call_back=None, stop_check=None):
         cur = 0
     statements = []
 
-    def unique_function(tx, at):
-        tx.run('CREATE CONSTRAINT ON (node:%s) ASSERT node.id IS UNIQUE' % at)
-
-    def prop_index(tx, at, prop):
-        tx.run('CREATE INDEX ON :%s(%s)' % (at, prop))
-
-    def label_index(tx, at):
-        tx.run('CREATE INDEX ON :%s(label_insensitive)' % at)
-
-    def begin_index(tx, at):
-        tx.run('CREATE INDEX ON :%s(begin)' % (at,))
-
-    def end_index(tx, at):
-        tx.run('CREATE INDEX ON :%s(end)' % (at,))
-
-    with corpus_context.graph_driver.session() as session:
-        for i, s in enumerate(speakers):
-            speaker_statements = []
-            for at in annotation_types:
-                if stop_check is not None and stop_check():
-                    return
-                if call_back is not None:
-                    call_back(cur)
-                    cur += 1
-                path = os.path.join(directory, '{}_{}.csv'.format(s, at))
-                rel_path = 'file:///{}'.format(make_path_safe(path))
-
-                session.write_transaction(unique_function, at)
-
-                properties = []
-
-                for x in data[at].token_property_keys:
-                    properties.append(prop_temp.format(name=x))
-                    session.write_transaction(prop_index, at, x)
-                if 'label' in data[at].token_property_keys:
-                    properties.append('label_insensitive: lower(csvLine.label)')
-                    session.write_transaction(label_index, at)
-                st = data[at].supertype
-                if properties:
-                    token_prop_string = ', ' + ', '.join(properties)
-                else:
-                    token_prop_string = ''
-                if st is not None:
-                    rel_import_statement = '''CYPHER planner=rule USING PERIODIC COMMIT 4000
-            LOAD CSV WITH HEADERS FROM '{path}' AS csvLine
-            MATCH (n:{annotation_type}_type:{corpus_name} {{id: csvLine.type_id}}), (super:{stype}:{corpus_name} {{id: csvLine.{stype}}}),
-            (d:Discourse:{corpus_name} {{name: csvLine.discourse}}),
-            (s:Speaker:{corpus_name} {{name: csvLine.speaker}})
-            CREATE (t:{annotation_type}:{corpus_name}:speech {{id: csvLine.id, begin: toFloat(csvLine.begin),
-                                        end: toFloat(csvLine.end){token_property_string} }}),
-                                        (t)-[:is_a]->(n),
-                                        (t)-[:contained_by]->(super),
-                                        (t)-[:spoken_in]->(d),
-                                        (t)-[:spoken_by]->(s)
-            WITH t, csvLine
-            MATCH (p:{annotation_type}:{corpus_name}:speech {{id: csvLine.previous_id}})
-            CREATE (p)-[:precedes]->(t)
-            '''
-                    kwargs = {'path': rel_path, 'annotation_type': at,
-                              'token_property_string': token_prop_string,
-                              'corpus_name': corpus_context.cypher_safe_name,
-                              'stype': st}
-                else:
-
-                    rel_import_statement = '''CYPHER planner=rule USING PERIODIC COMMIT 4000
-            LOAD CSV WITH HEADERS FROM '{path}' AS csvLine
-            MATCH (n:{annotation_type}_type:{corpus_name} {{id: csvLine.type_id}}),
-            (d:Discourse:{corpus_name} {{name: csvLine.discourse}}),
-            (s:Speaker:{corpus_name} {{ name: csvLine.speaker}})
-            CREATE (t:{annotation_type}:{corpus_name}:speech {{id: csvLine.id, begin: toFloat(csvLine.begin),
-                                        end: toFloat(csvLine.end){token_property_string} }}),
-                                        (t)-[:is_a]->(n),
-                                        (t)-[:spoken_in]->(d),
-                                        (t)-[:spoken_by]->(s)
-            WITH t, csvLine
-            MATCH (p:{annotation_type}:{corpus_name}:speech {{id: csvLine.previous_id}})
-            CREATE (p)-[:precedes]->(t)
-            '''
-                    kwargs = {'path': rel_path, 'annotation_type': at,
-                              'token_property_string': token_prop_string,
-                              'corpus_name': corpus_context.cypher_safe_name}
-                statement = rel_import_statement.format(**kwargs)
-                speaker_statements.append(statement)
-                begin = time.time()
-                session.write_transaction(begin_index, at)
-                session.write_transaction(end_index, at)
-            statements.append(speaker_statements)
+    # Ids are looked up while tokens are created, so their constraints must exist before loading,
+    # while indexes on other properties are only built once the tokens are loaded
+    indexes = corpus_context.index_manager
+    for at in annotation_types:
+        indexes.add_constraint(at, 'id')
+    for v in data.hierarchy.subannotations.values():
+        for sub in v:
+            indexes.add_constraint(sub, 'id')
+    indexes.create()
+    for at in annotation_types:
+        for x in data[at].token_property_keys:
+            indexes.add_index(at, x)
+        if 'label' in data[at].token_property_keys:
+            indexes.add_index(at, 'label_insensitive')
+        indexes.add_index(at, 'begin')
+        indexes.add_index(at, 'end')
+
+    for i, s in enumerate(speakers):
+        speaker_statements = []
+        for at in annotation_types:
+            if stop_check is not None and stop_check():
+                return
+            if call_back is not None:
+                call_back(cur)
+                cur += 1
+            path = os.path.join(directory, '{}_{}.csv'.format(s, at))
+            rel_path = 'file:///{}'.format(make_path_safe(path))
+
+            properties = []
+
+            for x in data[at].token_property_keys:
+                properties.append(prop_temp.format(name=x))
+            if 'label' in data[at].token_property_keys:
+                properties.append('label_insensitive: lower(csvLine.label)')
+            st = data[at].supertype
+            if properties:
+                token_prop_string = ', ' + ', '.join(properties)
+            else:
+                token_prop_string = ''
+            if st is not None:
+                rel_import_statement = '''CYPHER planner=rule USING PERIODIC COMMIT 4000
+        LOAD CSV WITH HEADERS FROM '{path}' AS csvLine
+        MATCH (n:{annotation_type}_type:{corpus_name} {{id: csvLine.type_id}}), (super:{stype}:{corpus_name} {{id: csvLine.{stype}}}),
+        (d:Discourse:{corpus_name} {{name: csvLine.discourse}}),
+        (s:Speaker:{corpus_name} {{name: csvLine.speaker}})
+        CREATE (t:{annotation_type}:{corpus_name}:speech {{id: csvLine.id, begin: toFloat(csvLine.begin),
+                                    end: toFloat(csvLine.end){token_property_string} }}),
+                                    (t)-[:is_a]->(n),
+                                    (t)-[:contained_by]->(super),
+                                    (t)-[:spoken_in]->(d),
+                                    (t)-[:spoken_by]->(s)
+        WITH t, csvLine
+        MATCH (p:{annotation_type}:{corpus_name}:speech {{id: csvLine.previous_id}})
+        CREATE (p)-[:precedes]->(t)
+        '''
+                kwargs = {'path': rel_path, 'annotation_type': at,
+                          'token_property_string': token_prop_string,
+                          'corpus_name': corpus_context.cypher_safe_name,
+                          'stype': st}
+            else:
+
+                rel_import_statement = '''CYPHER planner=rule USING PERIODIC COMMIT 4000
+        LOAD CSV WITH HEADERS FROM '{path}' AS csvLine
+        MATCH (n:{annotation_type}_type:{corpus_name} {{id: csvLine.type_id}}),
+        (d:Discourse:{corpus_name} {{name: csvLine.discourse}}),
+        (s:Speaker:{corpus_name} {{ name: csvLine.speaker}})
+        CREATE (t:{annotation_type}:{corpus_name}:speech {{id: csvLine.id, begin: toFloat(csvLine.begin),
+                                    end: toFloat(csvLine.end){token_property_string} }}),
+                                    (t)-[:is_a]->(n),
+                                    (t)-[:spoken_in]->(d),
+                                    (t)-[:spoken_by]->(s)
+        WITH t, csvLine
+        MATCH (p:{annotation_type}:{corpus_name}:speech {{id: csvLine.previous_id}})
+        CREATE (p)-[:precedes]->(t)
+        '''
+                kwargs = {'path': rel_path, 'annotation_type': at,
+                          'token_property_string': token_prop_string,
+                          'corpus_name': corpus_context.cypher_safe_name}
+            statement = rel_import_statement.format(**kwargs)
+            speaker_statements.append(statement)
+            begin = time.time()
+        statements.append(speaker_statements)
 
     for i, speaker_statements in enumerate(statements):
         if call_back is not None:
@@ -192,11 +194,10 @@ def import_csvs(corpus_context, data, call_back=None, stop_check=None):
     log.info('Finished importing {} into the graph database!'.format(data.name))
     log.debug('Graph importing took: {} seconds'.format(time.time() - initial_begin))
 
-    for sp in corpus_context.speakers:
+    for sp in speakers:
         for k, v in data.hierarchy.subannotations.items():
             for s in v:
                 path = os.path.join(directory, '{}_{}_{}.csv'.format(sp, k, s))
-                corpus_context.execute_cypher('CREATE CONSTRAINT ON (node:%s) ASSERT node.id IS UNIQUE' % s)
                 sub_path = 'file:///{}'.format(make_path_safe(path))
 
                 rel_import_statement = '''CYPHER planner=rule USING PERIODIC COMMIT 1000
@@ -217,6 +218,142 @@ def import_csvs(corpus_context, data, call_back=None, stop_check=None):
                     # with open(path, 'w'):
                     #    pass
                     # os.remove(path) # FIXME Neo4j 2.3 does not release files
+    indexes.create()
+
+
+def neo4j_settings(admin_path):
+    """
+    Read the data directory and the active database of the local Neo4j installation from its neo4j.conf
+
+    Parameters
+    ----------
+    admin_path : str
+        Path to the ``neo4j-admin`` executable of the installation
+
+    Returns
+    -------
+    str
+        Data directory of the installation
+    str
+        Name of the database that the server uses
+    """
+    home = os.path.dirname(os.path.dirname(os.path.realpath(admin_path)))
+    conf_path = os.path.join(os.environ.get('NEO4J_CONF', os.path.join(home, 'conf')), 'neo4j.conf')
+    settings = {}
+    if os.path.exists(conf_path):
+        with open(conf_path, 'r', encoding='utf8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue
+                key, value = line.split('=', 1)
+                settings[key.strip()] = value.strip()
+    data_directory = settings.get('dbms.directories.data', 'data')
+    if not os.path.isabs(data_directory):
+        data_directory = os.path.join(home, data_directory)
+    return data_directory, settings.get('dbms.active_database', 'graph.db')
+
+
+def bulk_indexes(data, type_headers):
+    """
+    List the constraints and indexes that a bulk imported corpus needs
+
+    Parameters
+    ----------
+    data : :class:`~polyglotdb.io.helper.DiscourseData`
+        Data for a discourse of the import, used for the annotation types and their properties
+    type_headers : dict
+        Annotation types mapped to the header of their type CSV file
+
+    Returns
+    -------
+    list
+        Tuples of kind ('constraint' or 'index'), label and property
+    """
+    indexes = [('constraint', 'Corpus', 'name'), ('index', 'Discourse', 'name'), ('index', 'Speaker', 'name')]
+    for at, h in sorted(type_headers.items()):
+        indexes.append(('constraint', '%s_type' % at, 'id'))
+        if 'label' in h:
+            indexes.append(('index', '%s_type' % at, 'label_insensitive'))
+        for x in h:
+            if x != 'id':
+                indexes.append(('index', '%s_type' % at, x))
+    for at in data.highest_to_lowest():
+        indexes.append(('constraint', at, 'id'))
+        for x in sorted(data[at].token_property_keys):
+            indexes.append(('index', at, x))
+        if 'label' in data[at].token_property_keys:
+            indexes.append(('index', at, 'label_insensitive'))
+        indexes.append(('index', at, 'begin'))
+        indexes.append(('index', at, 'end'))
+    for v in data.hierarchy.subannotations.values():
+        for s in v:
+            indexes.append(('constraint', s, 'id'))
+    return indexes
+
+
+def bulk_import_csvs(corpus_context, data, type_headers, speaks_in, database, call_back=None):
+    """
+    Load a corpus into a new graph database in one pass with the Neo4j bulk importer
+
+    ``neo4j-admin import`` writes the corpus into the database ``database`` of the local Neo4j installation
+    that ``corpus_context.config.neo4j_admin_path`` belongs to.  The running server and its databases are not
+    touched: the database must not be the one the server uses and must not exist yet.
+
+    Parameters
+    ----------
+    corpus_context: :class:`~polyglotdb.corpus.CorpusContext`
+        the corpus to load
+    data : :class:`~polyglotdb.io.helper.DiscourseData`
+        Data for a discourse of the import, used for the annotation types and their properties
+    type_headers : dict
+        Annotation types mapped to the header of their type CSV file
+    speaks_in : list
+        Tuples of speaker name, discourse name and channel for each speaker of each discourse
+    database : str
+        Name of the new graph database
+    call_back : callable
+        call back function, optional
+    """
+    from .to_csv import graph_csvs_to_bulk_csvs
+    from ...exceptions import CorpusIntegrityError, CorpusConfigError
+    log = logging.getLogger('{}_loading'.format(corpus_context.corpus_name))
+    admin_path = corpus_context.config.neo4j_admin_path
+    if admin_path is None or not os.path.exists(admin_path):
+        raise CorpusConfigError('Bulk importing requires neo4j_admin_path to point to neo4j-admin.')
+    data_directory, active_database = neo4j_settings(admin_path)
+    if database == active_database:
+        raise CorpusConfigError('The database \'{}\' is in use by the graph database server, '
+                                'please choose a new database name.'.format(database))
+    store_directory = os.path.join(data_directory, 'databases', database)
+    if os.path.exists(store_directory):
+        raise CorpusConfigError('The database \'{}\' already exists at {}, '
+                                'please choose a new database name.'.format(database, store_directory))
+
+    initial_begin = time.time()
+    if call_back is not None:
+        call_back('Writing bulk import files...')
+    node_paths, relationship_paths = graph_csvs_to_bulk_csvs(corpus_context, data, type_headers, speaks_in)
+    log.debug('Writing bulk import files took: {} seconds'.format(time.time() - initial_begin))
+
+    report_path = os.path.join(corpus_context.config.log_dir, 'bulk_import.report')
+    command = [admin_path, 'import', '--mode=csv', '--database={}'.format(database), '--id-type=STRING',
+               '--report-file={}'.format(report_path)]
+    command += ['--nodes={}'.format(x) for x in node_paths]
+    command += ['--relationships={}'.format(x) for x in relationship_paths]
+
+    if call_back is not None:
+        call_back('Importing data...')
+    log.info('Beginning bulk import into the graph database {}...'.format(database))
+    begin = time.time()
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+    log.debug(result.stdout)
+    if result.returncode != 0:
+        raise CorpusIntegrityError('The bulk import failed, see {} and {} for details.'.format(
+            os.path.join(corpus_context.config.log_dir, '{}_loading.log'.format(corpus_context.corpus_name)),
+            report_path))
+    log.info('Finished bulk import!')
+    log.debug('Bulk import took: {} seconds'.format(time.time() - begin))
 
 
 def import_lexicon_csvs(corpus_context, typed_data, case_sensitive=False):
@@ -270,7 +407,8 @@ def import_lexicon_csvs(corpus_context, typed_data, case_sensitive=False):
                                         new_properties=properties)
     corpus_context.execute_cypher(statement)
     for h, v in typed_data.items():
-        corpus_context.execute_cypher('CREATE INDEX ON :%s(%s)' % (corpus_context.word_name, h))
+        corpus_context.index_manager.add_index(corpus_context.word_name, h)
+    corpus_context.index_manager.create()
         # os.remove(path) # FIXME Neo4j 2.3 does not release files
 
 
@@ -315,7 +453,8 @@ def import_feature_csvs(corpus_context, typed_data):
                                         new_properties=properties)
     corpus_context.execute_cypher(statement)
     for h, v in typed_data.items():
-        corpus_context.execute_cypher('CREATE INDEX ON :%s(%s)' % (corpus_context.phone_name, h))
+        corpus_context.index_manager.add_index(corpus_context.phone_name, h)
+    corpus_context.index_manager.create()
         # os.remove(path) # FIXME Neo4j 2.3 does not release files
 
 
@@ -360,7 +499,8 @@ def import_syllable_enrichment_csvs(corpus_context, typed_data):
                                         new_properties=properties)
     corpus_context.execute_cypher(statement)
     for h, v in typed_data.items():
-        corpus_context.execute_cypher('CREATE INDEX ON :%s(%s)' % ("syllable", h))
+        corpus_context.index_manager.add_index("syllable", h)
+    corpus_context.index_manager.create()
 
 
 def import_utterance_enrichment_csvs(corpus_context, typed_data):
@@ -404,7 +544,8 @@ def import_utterance_enrichment_csvs(corpus_context, typed_data):
                                         new_properties=properties)
     corpus_context.execute_cypher(statement)
     for h, v in typed_data.items():
-        corpus_context.execute_cypher('CREATE INDEX ON :%s(%s)' % ("utterance", h))
+        corpus_context.index_manager.add_index("utterance", h)
+    corpus_context.index_manager.create()
 
 
 def import_speaker_csvs(corpus_context, typed_data):
@@ -447,7 +588,8 @@ def import_speaker_csvs(corpus_context, typed_data):
                                         new_properties=properties)
     corpus_context.execute_cypher(statement)
     for h, v in typed_data.items():
-        corpus_context.execute_cypher('CREATE INDEX ON :Speaker(%s)' % h)
+        corpus_context.index_manager.add_index('Speaker', h)
+    corpus_context.index_manager.create()
         # os.remove(path) # FIXME Neo4j 2.3 does not release files
 
 
@@ -491,7 +633,8 @@ def import_discourse_csvs(corpus_context, typed_data):
                                         new_properties=properties)
     corpus_context.execute_cypher(statement)
     for h, v in typed_data.items():
-        corpus_context.execute_cypher('CREATE INDEX ON :Discourse(%s)' % h)
+        corpus_context.index_manager.add_index('Discourse', h)
+    corpus_context.index_manager.create()
         # os.remove(path) # FIXME Neo4j 2.3 does not release files
 
 
@@ -510,7 +653,8 @@ def import_utterance_csv(corpus_context, call_back=None, stop_check=None):
     if call_back is not None:
         call_back('Importing data...')
         call_back(0, len(speakers))
-    corpus_context.execute_cypher('CREATE CONSTRAINT ON (node:utterance) ASSERT node.id IS UNIQUE')
+    corpus_context.index_manager.add_constraint('utterance', 'id')
+    corpus_context.index_manager.create()
     for i, s in enumerate(speakers):
         if stop_check is not None and stop_check():
             return
@@ -562,13 +706,15 @@ def import_syllable_csv(corpus_context, call_back=None, stop_check=None):
     if call_back is not None:
         call_back('Importing syllables...')
         call_back(0, len(speakers))
-    corpus_context.execute_cypher('CREATE CONSTRAINT ON (node:syllable) ASSERT node.id IS UNIQUE')
-    corpus_context.execute_cypher('CREATE CONSTRAINT ON (node:syllable_type) ASSERT node.id IS UNIQUE')
-    corpus_context.execute_cypher('CREATE INDEX ON :syllable(begin)')
-    corpus_context.execute_cypher('CREATE INDEX ON :syllable(prev_id)')
-    corpus_context.execute_cypher('CREATE INDEX ON :syllable(end)')
-    corpus_context.execute_cypher('CREATE INDEX ON :syllable(label)')
-    corpus_context.execute_cypher('CREATE INDEX ON :syllable_type(label)')
+    indexes = corpus_context.index_manager
+    indexes.add_constraint('syllable', 'id')
+    indexes.add_constraint('syllable_type', 'id')
+    indexes.add_index('syllable', 'prev_id')
+    indexes.create()
+    indexes.add_index('syllable', 'begin')
+    indexes.add_index('syllable', 'end')
+    indexes.add_index('syllable', 'label')
+    indexes.add_index('syllable_type', 'label')
     for i, s in enumerate(speakers):
         if stop_check is not None and stop_check():
             return
@@ -638,6 +784,7 @@ def import_syllable_csv(corpus_context, call_back=None, stop_check=None):
                                      word_name=corpus_context.word_name,
                                      phone_name=corpus_context.phone_name)
         corpus_context.execute_cypher(statement)
+    indexes.create()
 
 
 def import_nonsyl_csv(corpus_context, call_back=None, stop_check=None):
@@ -655,13 +802,15 @@ def import_nonsyl_csv(corpus_context, call_back=None, stop_check=None):
     if call_back is not None:
         call_back('Importing degenerate syllables...')
         call_back(0, len(speakers))
-    corpus_context.execute_cypher('CREATE CONSTRAINT ON (node:syllable) ASSERT node.id IS UNIQUE')
-    corpus_context.execute_cypher('CREATE CONSTRAINT ON (node:syllable_type) ASSERT node.id IS UNIQUE')
-    corpus_context.execute_cypher('CREATE INDEX ON :syllable(begin)')
-    corpus_context.execute_cypher('CREATE INDEX ON :syllable(prev_id)')
-    corpus_context.execute_cypher('CREATE INDEX ON :syllable(end)')
-    corpus_context.execute_cypher('CREATE INDEX ON :syllable(label)')
-    corpus_context.execute_cypher('CREATE INDEX ON :syllable_type(label)')
+    indexes = corpus_context.index_manager
+    indexes.add_constraint('syllable', 'id')
+    indexes.add_constraint('syllable_type', 'id')
+    indexes.add_index('syllable', 'prev_id')
+    indexes.create()
+    indexes.add_index('syllable', 'begin')
+    indexes.add_index('syllable', 'end')
+    indexes.add_index('syllable', 'label')
+    indexes.add_index('syllable_type', 'label')
     for i, s in enumerate(speakers):
         if stop_check is not None and stop_check():
             return
@@ -721,6 +870,7 @@ def import_nonsyl_csv(corpus_context, call_back=None, stop_check=None):
                                      phone_name=corpus_context.phone_name
                                      )
         corpus_context.execute_cypher(statement)
+    indexes.create()
 
 
 def import_subannotation_csv(corpus_context, type, annotated_type, props):
@@ -744,7 +894,8 @@ def import_subannotation_csv(corpus_context, type, annotated_type, props):
     prop_temp = '''{name}: csvLine.{name}'''
     properties = []
 
-    corpus_context.execute_cypher('CREATE CONSTRAINT ON (node:%s) ASSERT node.id IS UNIQUE' % type)
+    corpus_context.index_manager.add_constraint(type, 'id')
+    corpus_context.index_manager.create()
 
     for p in props:
         if p in ['id', 'annotated_id', 'begin', 'end']:
@@ -770,5 +921,6 @@ def import_subannotation_csv(corpus_context, type, annotated_type, props):
     for p in props:
         if p in ['id', 'annotated_id']:
             continue
-        corpus_context.execute_cypher('CREATE INDEX ON :%s(%s)' % (type, p))
+        corpus_context.index_manager.add_index(type, p)
+    corpus_context.index_manager.create()
         # os.remove(path) # FIXME Neo4j 2.3 does not release files
@@ -0,0 +1,257 @@
+import logging
+import time
+
+
+def convert_value(value, value_type):
+    """
+    Convert a value to the type of a property, matching the conversions done when properties are
+    loaded from CSV files
+
+    Parameters
+    ----------
+    value : object
+        Value to convert
+    value_type : type
+        Type of the property
+
+    Returns
+    -------
+    object
+        Converted value, or None if the value is missing or cannot be converted
+    """
+    if value is None:
+        return None
+    try:
+        if value_type == int:
+            return int(float(value))
+        elif value_type == float:
+            return float(value)
+        elif value_type == bool:
+            return str(value) != 'False'
+    except ValueError:
+        return None
+    return str(value)
+
+
+def row_size(row):
+    """
+    Estimate the number of bytes a row takes up when sent as a query parameter
+
+    Parameters
+    ----------
+    row : dict
+        Row of property values
+
+    Returns
+    -------
+    int
+        Estimated size of the row
+    """
+    return sum(len(k) + len(str(v)) + 4 for k, v in row.items())
+
+
+def row_batches(rows, max_bytes=1000000, max_rows=10000):
+    """
+    Group rows into batches of roughly equal payload, so that rows with many or long values are sent in
+    smaller batches
+
+    Parameters
+    ----------
+    rows : iterable
+        Rows to group
+    max_bytes : int
+        Maximum estimated size of a batch, defaults to 1 MB
+    max_rows : int
+        Maximum number of rows in a batch, defaults to 10000
+
+    Yields
+    ------
+    list
+        Batch of rows
+    """
+    batch = []
+    size = 0
+    for row in rows:
+        current = row_size(row)
+        if batch and (size + current > max_bytes or len(batch) >= max_rows):
+            yield batch
+            batch = []
+            size = 0
+        batch.append(row)
+        size += current
+    if batch:
+        yield batch
+
+
+def enrichment_rows(data, typed_data, key):
+    """
+    Generate rows for enrichment data, with values converted to the types of their properties
+
+    Parameters
+    ----------
+    data : dict
+        Keys of the nodes to enrich mapped to dictionaries of property values
+    typed_data : dict
+        Property names mapped to their types
+    key : str
+        Name of the field for the key of each node
+
+    Yields
+    ------
+    dict
+        Row with the key and the converted property values
+    """
+    for k, v in sorted(data.items()):
+        row = {name: convert_value(v.get(name, None), t) for name, t in typed_data.items()}
+        row[key] = k
+        yield row
+
+
+def import_enrichment_rows(corpus_context, match, data, typed_data, key, index_label):
+    """
+    Set properties on nodes from batches of rows sent as query parameters, as an alternative to loading
+    them from a CSV file that the graph database must be able to read
+
+    Parameters
+    ----------
+    corpus_context: :class:`~polyglotdb.corpus.CorpusContext`
+        the corpus to load into
+    match : str
+        Cypher clause matching the node ``n`` for a ``row``
+    data : dict
+        Keys of the nodes to enrich mapped to dictionaries of property values
+    typed_data : dict
+        Property names mapped to their types
+    key : str
+        Name of the field for the key of each node
+    index_label : str
+        Label to index the new properties on
+    """
+    log = logging.getLogger('{}_loading'.format(corpus_context.corpus_name))
+    properties = ',\n'.join('n.{name} = row.{name}'.format(name=x) for x in typed_data)
+    statement = '''UNWIND $rows AS row
+    {match}
+    SET {new_properties}'''.format(match=match, new_properties=properties)
+    begin = time.time()
+    num_rows = 0
+    for batch in row_batches(enrichment_rows(data, typed_data, key)):
+        corpus_context.execute_cypher(statement, rows=batch)
+        num_rows += len(batch)
+    log.debug('Setting properties on {} nodes took: {} seconds'.format(num_rows, time.time() - begin))
+    for h in typed_data:
+        corpus_context.index_manager.add_index(index_label, h)
+    corpus_context.index_manager.create()
+
+
+def import_lexicon_rows(corpus_context, data, typed_data, case_sensitive=False):
+    """
+    Import a lexicon through query parameters
+
+    Parameters
+    ----------
+    corpus_context: :class:`~polyglotdb.corpus.CorpusContext`
+        the corpus to load into
+    data : dict
+        Word labels mapped to dictionaries of property values
+    typed_data : dict
+        Property names mapped to their types
+    case_sensitive : boolean
+        defaults to false
+    """
+    if case_sensitive:
+        match = 'MATCH (n:{word_type}_type:{corpus_name}) where n.label = row.label'
+    else:
+        match = 'MATCH (n:{word_type}_type:{corpus_name}) where n.label_insensitive = row.label'
+        data = {k.lower(): v for k, v in data.items()}
+    match = match.format(word_type=corpus_context.word_name, corpus_name=corpus_context.cypher_safe_name)
+    import_enrichment_rows(corpus_context, match, data, typed_data, 'label', corpus_context.word_name)
+
+
+def import_feature_rows(corpus_context, data, typed_data):
+    """
+    Import phone features through query parameters
+
+    Parameters
+    ----------
+    corpus_context: :class:`~polyglotdb.corpus.CorpusContext`
+        the corpus to load into
+    data : dict
+        Phone labels mapped to dictionaries of feature values
+    typed_data : dict
+        Feature names mapped to their types
+    """
+    match = 'MATCH (n:{phone_type}_type:{corpus_name}) where n.label = row.label'.format(
+        phone_type=corpus_context.phone_name, corpus_name=corpus_context.cypher_safe_name)
+    import_enrichment_rows(corpus_context, match, data, typed_data, 'label', corpus_context.phone_name)
+
+
+def import_syllable_enrichment_rows(corpus_context, data, typed_data):
+    """
+    Import syllable properties through query parameters
+
+    Parameters
+    ----------
+    corpus_context: :class:`~polyglotdb.corpus.CorpusContext`
+        the corpus to load into
+    data : dict
+        Syllable labels mapped to dictionaries of property values
+    typed_data : dict
+        Property names mapped to their types
+    """
+    match = 'MATCH (n:syllable_type:{corpus_name}) where n.label = row.label'.format(
+        corpus_name=corpus_context.cypher_safe_name)
+    import_enrichment_rows(corpus_context, match, data, typed_data, 'label', 'syllable')
+
+
+def import_utterance_enrichment_rows(corpus_context, data, typed_data):
+    """
+    Import utterance properties through query parameters
+
+    Parameters
+    ----------
+    corpus_context: :class:`~polyglotdb.corpus.CorpusContext`
+        the corpus to load into
+    data : dict
+        Utterance ids mapped to dictionaries of property values
+    typed_data : dict
+        Property names mapped to their types
+    """
+    match = 'MATCH (n:utterance:{corpus_name}) where n.id = row.id'.format(
+        corpus_name=corpus_context.cypher_safe_name)
+    import_enrichment_rows(corpus_context, match, data, typed_data, 'id', 'utterance')
+
+
+def import_speaker_rows(corpus_context, data, typed_data):
+    """
+    Import speaker properties through query parameters
+
+    Parameters
+    ----------
+    corpus_context: :class:`~polyglotdb.corpus.CorpusContext`
+        the corpus to load into
+    data : dict
+        Speaker names mapped to dictionaries of property values
+    typed_data : dict
+        Property names mapped to their types
+    """
+    match = 'MATCH (n:Speaker:{corpus_name}) where n.name = row.name'.format(
+        corpus_name=corpus_context.cypher_safe_name)
+    import_enrichment_rows(corpus_context, match, data, typed_data, 'name', 'Speaker')
+
+
+def import_discourse_rows(corpus_context, data, typed_data):
+    """
+    Import discourse properties through query parameters
+
+    Parameters
+    ----------
+    corpus_context: :class:`~polyglotdb.corpus.CorpusContext`
+        the corpus to load into
+    data : dict
+        Discourse names mapped to dictionaries of property values
+    typed_data : dict
+        Property names mapped to their types
+    """
+    match = 'MATCH (n:Discourse:{corpus_name}) where n.name = row.name'.format(
+        corpus_name=corpus_context.cypher_safe_name)
+    import_enrichment_rows(corpus_context, match, data, typed_data, 'name', 'Discourse')
@@ -0,0 +1,127 @@
+import re
+import logging
+import time
+
+INDEX_PATTERN = re.compile(r'^INDEX ON :`?([^`(]+)`?\(`?([^`)]+)`?\)$')
+
+
+class IndexManager(object):
+    """
+    Records the indexes and unique constraints that the graph database needs, and creates the ones that do not
+    exist yet in a single phase
+
+    Indexes and constraints known to exist are remembered, so repeated imports and enrichments do not
+    issue statements for them again.
+
+    Parameters
+    ----------
+    corpus_context : :class:`~polyglotdb.corpus.CorpusContext`
+        The corpus that the indexes are created for
+    """
+
+    def __init__(self, corpus_context):
+        self.corpus_context = corpus_context
+        self.pending = []
+        self._existing = None
+
+    def add_index(self, label, property):
+        """
+        Record that a property of nodes with a label should be indexed
+
+        Parameters
+        ----------
+        label : str
+            Node label
+        property : str
+            Property name
+        """
+        self.pending.append(('index', label, property))
+
+    def add_constraint(self, label, property):
+        """
+        Record that a property of nodes with a label should be unique
+
+        Parameters
+        ----------
+        label : str
+            Node label
+        property : str
+            Property name
+        """
+        self.pending.append(('constraint', label, property))
+
+    @property
+    def existing(self):
+        """
+        Indexes and constraints in the graph database, as tuples of kind, label and property
+        """
+        if self._existing is None:
+            self._existing = set()
+            for r in self.corpus_context.execute_cypher('CALL db.indexes()'):
+                m = INDEX_PATTERN.match(r['description'])
+                if m is None:
+                    continue
+                kind = 'constraint' if 'unique' in r['type'] else 'index'
+                self._existing.add((kind, m.group(1), m.group(2)))
+        return self._existing
+
+    def reset(self):
+        """
+        Forget the indexes and constraints known to exist, for when the graph database has been replaced
+        """
+        self._existing = None
+
+    def statements(self):
+        """
+        Generate the statements for recorded indexes and constraints that do not exist yet
+
+        Returns
+        -------
+        list
+            Tuples of kind, label, property and Cypher statement
+        """
+        existing = self.existing
+        statements = []
+        seen = set()
+        for kind, label, property in self.pending:
+            key = (kind, label, property)
+            if key in seen or key in existing:
+                continue
+            constraint = ('constraint', label, property)
+            if kind == 'index' and (constraint in existing or constraint in seen):
+                continue
+            seen.add(key)
+            if kind == 'constraint':
+                statement = 'CREATE CONSTRAINT ON (node:%s) ASSERT node.%s IS UNIQUE' % (label, property)
+            else:
+                statement = 'CREATE INDEX ON :%s(%s)' % (label, property)
+            statements.append((kind, label, property, statement))
+        return statements
+
+    def create(self, timeout=300):
+        """
+        Create the recorded indexes and constraints that do not exist yet, and wait for them to be built
+
+        Parameters
+        ----------
+        timeout : int
+            Seconds to wait for the indexes to come online, defaults to 300
+
+        Returns
+        -------
+        float
+            Seconds taken to create and build the indexes
+        """
+        log = logging.getLogger('{}_loading'.format(self.corpus_context.corpus_name))
+        statements = self.statements()
+        self.pending = []
+        if not statements:
+            return 0
+        begin = time.time()
+        for kind, label, property, statement in statements:
+            self.corpus_context.execute_cypher(statement)
+            self._existing.add((kind, label, property))
+        self.corpus_context.execute_cypher('CALL db.awaitIndexes({})'.format(timeout))
+        time_taken = time.time() - begin
+        log.info('Created {} indexes and constraints in {} seconds.'.format(len(statements), time_taken))
+        return time_taken
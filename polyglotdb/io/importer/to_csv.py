@@ -1,6 +1,6 @@
 import csv
 import os
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from ...exceptions import AlphabetError
 
 
@@ -36,11 +36,156 @@ def data_to_type_csvs(corpus_context, types, type_headers):
         write_csv_file(path, header, data)
 
 
+class CSVWriterRegistry(object):
+    """
+    Registry of open CSV files that are appended to over the course of an import
+
+    Files are kept open between discourses, with the least recently used files closed when more
+    than ``max_open`` are open.
+
+    Parameters
+    ----------
+    max_open : int
+        Maximum number of files to keep open at once, defaults to 256
+    """
+
+    def __init__(self, max_open=256):
+        self.max_open = max_open
+        self._files = OrderedDict()
+        self._writers = {}
+
+    def writer(self, path, header):
+        """
+        Get a writer that appends rows to a CSV file
+
+        Parameters
+        ----------
+        path : str
+            Path to the CSV file
+        header : list
+            Column names of the rows to be written
+
+        Returns
+        -------
+        :class:`csv.DictWriter`
+            Writer for the file
+        """
+        key = (path, tuple(header))
+        if path in self._files:
+            self._files.move_to_end(path)
+        else:
+            self._files[path] = open(path, 'a', newline='', encoding='utf8', buffering=65536)
+            if len(self._files) > self.max_open:
+                self._close(next(iter(self._files)))
+        if key not in self._writers:
+            self._writers[key] = csv.DictWriter(self._files[path], header, delimiter=',')
+        return self._writers[key]
+
+    def _close(self, path):
+        self._files.pop(path).close()
+        for key in [x for x in self._writers if x[0] == path]:
+            del self._writers[key]
+
+    def close(self):
+        """
+        Flush and close all open files
+        """
+        for path in list(self._files):
+            self._close(path)
+
+
+class TypeCSVWriter(object):
+    """
+    Writer for type CSV files that takes the types of one discourse at a time, writing each type
+    only the first time its hash is seen
+
+    Parameters
+    ----------
+    corpus_context: :class:`~polyglotdb.corpus.CorpusContext`
+        the corpus
+    """
+
+    def __init__(self, corpus_context):
+        self.corpus_name = corpus_context.corpus_name
+        self.directory = corpus_context.config.temporary_directory('csv')
+        self.type_headers = {}
+        self._seen = defaultdict(set)
+        self._files = {}
+        self._writers = {}
+
+    def add(self, data):
+        """
+        Write the new types of a discourse
+
+        Parameters
+        ----------
+        data : :class:`~polyglotdb.io.helper.DiscourseData`
+            Data for the discourse
+        """
+        for k, v in data.items():
+            seen = self._seen[k]
+            for w in v:
+                id = w.sha(self.corpus_name)
+                if id in seen:
+                    continue
+                seen.add(id)
+                if k not in self._writers:
+                    header = ['id'] + w.type_keys()
+                    self.type_headers[k] = header
+                    path = os.path.join(self.directory, '{}_type.csv'.format(k))
+                    self._files[k] = open(path, 'w', newline='', encoding='utf8')
+                    self._writers[k] = csv.DictWriter(self._files[k], header, delimiter=',')
+                    self._writers[k].writeheader()
+                self._writers[k].writerow(dict(zip(self.type_headers[k], [id] + list(w.type_values()))))
+
+    def close(self):
+        """
+        Close all type CSV files
+        """
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+        self._writers = {}
+
+
+def initialize_graph_csvs(corpus_context, data, initialized):
+    """
+    Create the token and subannotation CSV files for the speakers of a discourse that have not
+    been created yet during an import
+
+    Parameters
+    ----------
+    corpus_context: :class:`~polyglotdb.corpus.CorpusContext`
+        the corpus
+    data : :class:`~polyglotdb.io.helper.DiscourseData`
+        Data for the discourse
+    initialized : set
+        Paths of CSV files already created during the import, updated with newly created files
+    """
+    directory = corpus_context.config.temporary_directory('csv')
+    to_create = []
+    for s in data.speakers:
+        for k, v in data.token_headers.items():
+            to_create.append((os.path.join(directory, '{}_{}.csv'.format(s, k)), v))
+        for k, v in data.hierarchy.subannotations.items():
+            for sub in v:
+                to_create.append((os.path.join(directory, '{}_{}_{}.csv'.format(s, k, sub)),
+                                  ['id', 'begin', 'end', 'annotation_id', 'label']))
+    for path, header in to_create:
+        if path in initialized:
+            continue
+        write_csv_file(path, header, [])
+        initialized.add(path)
+
+
 def data_to_graph_csvs(corpus_context, data):
     """
     Convert a DiscourseData object into CSV files for efficient loading
     of graph nodes and relationships
 
+    Rows are written through the corpus's import CSV writers when an import is in progress, so files stay
+    open between discourses.
+
     Parameters
     ----------
     data : :class:`~polyglotdb.io.helper.DiscourseData`
@@ -49,23 +194,11 @@ def data_to_graph_csvs(corpus_context, data):
         Full path to a directory to store CSV files
     """
     directory = corpus_context.config.temporary_directory('csv')
-    rfs = {}
-    rel_writers = {}
+    writers = corpus_context.csv_writers
+    if writers is None:
+        writers = CSVWriterRegistry()
     token_headers = data.token_headers
-    for s in data.speakers:
-        for x in data.annotation_types:
-            path = os.path.join(directory, '{}_{}.csv'.format(s, x))
-            rfs[s, x] = open(path, 'a', newline='', encoding='utf8')
-            rel_writers[s, x] = csv.DictWriter(rfs[s, x], token_headers[x], delimiter=',')
-    subanno_files = {}
-    subanno_writers = {}
-    for sp in data.speakers:
-        for k, v in data.hierarchy.subannotations.items():
-            for s in v:
-                path = os.path.join(directory, '{}_{}_{}.csv'.format(sp, k, s))
-                subanno_files[sp, k, s] = open(path, 'a', newline='', encoding='utf8')
-                header = ['id', 'begin', 'end', 'annotation_id', 'label']
-                subanno_writers[sp, k, s] = csv.DictWriter(subanno_files[sp, k, s], header, delimiter=',')
+    subanno_header = ['id', 'begin', 'end', 'annotation_id', 'label']
 
     segment_type = data.segment_type
     for level in data.highest_to_lowest():
@@ -78,21 +211,157 @@ def data_to_graph_csvs(corpus_context, data):
             s = d.speaker
             if s is None:
                 s = 'unknown'
-            rel_writers[s, level].writerow(dict(begin=d.begin, end=d.end,
-                                                type_id=d.sha(corpus=corpus_context.corpus_name),
-                                                id=d.id, speaker=s, discourse=data.name,
-                                                previous_id=d.previous_id,
-                                                **token_additional))
+            path = os.path.join(directory, '{}_{}.csv'.format(s, level))
+            writers.writer(path, token_headers[level]).writerow(dict(begin=d.begin, end=d.end,
+                                                                     type_id=d.sha(corpus=corpus_context.corpus_name),
+                                                                     id=d.id, speaker=s, discourse=data.name,
+                                                                     previous_id=d.previous_id,
+                                                                     **token_additional))
             if d.subannotations:
                 for sub in d.subannotations:
                     row = {'begin': sub.begin, 'end': sub.end, 'label': sub.label,
                            'annotation_id': d.id, 'id': sub.id}
-                    subanno_writers[s, level, sub.type].writerow(row)
+                    path = os.path.join(directory, '{}_{}_{}.csv'.format(s, level, sub.type))
+                    writers.writer(path, subanno_header).writerow(row)
+
+    if writers is not corpus_context.csv_writers:
+        writers.close()
+
+
+def graph_csvs_to_bulk_csvs(corpus_context, data, type_headers, speaks_in):
+    """
+    Convert the type, token and subannotation CSV files of an import into node and relationship files
+    in the format of the Neo4j bulk importer (``neo4j-admin import``)
+
+    Each annotation type gets its own ID space, so that token and type ids only need to be unique within
+    an annotation type, as they do for imports through Cypher.
 
-    for x in rfs.values():
-        x.close()
-    for x in subanno_files.values():
-        x.close()
+    Parameters
+    ----------
+    corpus_context: :class:`~polyglotdb.corpus.CorpusContext`
+        the corpus
+    data : :class:`~polyglotdb.io.helper.DiscourseData`
+        Data for a discourse of the import, used for the annotation types and their properties
+    type_headers : dict
+        Annotation types mapped to the header of their type CSV file
+    speaks_in : list
+        Tuples of speaker name, discourse name and channel for each speaker of each discourse
+
+    Returns
+    -------
+    list
+        Paths of node files
+    list
+        Paths of relationship files
+    """
+    csv_directory = corpus_context.config.temporary_directory('csv')
+    directory = corpus_context.config.temporary_directory('bulk')
+    corpus_name = corpus_context.corpus_name
+    node_paths = []
+    relationship_paths = []
+    files = []
+    writers = {}
+
+    def bulk_writer(name, header, relationship=False):
+        if name not in writers:
+            path = os.path.join(directory, '{}.csv'.format(name))
+            f = open(path, 'w', newline='', encoding='utf8', buffering=65536)
+            files.append(f)
+            writers[name] = csv.writer(f, delimiter=',')
+            writers[name].writerow(header)
+            if relationship:
+                relationship_paths.append(path)
+            else:
+                node_paths.append(path)
+        return writers[name]
+
+    try:
+        bulk_writer('corpus_nodes', ['name:ID(Corpus)', ':LABEL']).writerow([corpus_name, 'Corpus'])
+        speakers = sorted(set(x[0] for x in speaks_in))
+        discourses = sorted(set(x[1] for x in speaks_in))
+        writer = bulk_writer('speaker_nodes', ['name:ID(Speaker)', ':LABEL'])
+        for s in speakers:
+            writer.writerow([s, 'Speaker;{}'.format(corpus_name)])
+        writer = bulk_writer('discourse_nodes', ['name:ID(Discourse)', ':LABEL'])
+        for d in discourses:
+            writer.writerow([d, 'Discourse;{}'.format(corpus_name)])
+        writer = bulk_writer('speaks_in', [':START_ID(Speaker)', ':END_ID(Discourse)', 'channel:int', ':TYPE'],
+                             relationship=True)
+        for s, d, channel in speaks_in:
+            writer.writerow([s, d, channel, 'speaks_in'])
+
+        for at, header in type_headers.items():
+            type_label = '{}_type'.format(at)
+            properties = [x for x in header if x != 'id']
+            bulk_header = ['id:ID({})'.format(type_label)] + properties
+            if 'label' in properties:
+                bulk_header.append('label_insensitive')
+            writer = bulk_writer('{}_nodes'.format(type_label), bulk_header + [':LABEL'])
+            labels = '{};{}'.format(type_label, corpus_name)
+            with open(os.path.join(csv_directory, '{}_type.csv'.format(at)), 'r', newline='', encoding='utf8') as f:
+                for line in csv.DictReader(f):
+                    row = [line['id']] + [line[x] for x in properties]
+                    if 'label' in properties:
+                        row.append(line['label'].lower())
+                    row.append(labels)
+                    writer.writerow(row)
+
+        for at in data.highest_to_lowest():
+            properties = sorted(data[at].token_property_keys)
+            supertype = data[at].supertype
+            bulk_header = ['id:ID({})'.format(at), 'begin:float', 'end:float'] + properties
+            if 'label' in properties:
+                bulk_header.append('label_insensitive')
+            labels = '{};{};speech'.format(at, corpus_name)
+            relationships = [('is_a', '{}_type'.format(at), 'type_id'),
+                             ('spoken_in', 'Discourse', 'discourse'),
+                             ('spoken_by', 'Speaker', 'speaker'),
+                             ('precedes', at, 'previous_id')]
+            if supertype is not None:
+                relationships.append(('contained_by', supertype, supertype))
+            for s in speakers:
+                path = os.path.join(csv_directory, '{}_{}.csv'.format(s, at))
+                if not os.path.exists(path):
+                    continue
+                node_writer = bulk_writer('{}_nodes'.format(at), bulk_header + [':LABEL'])
+                with open(path, 'r', newline='', encoding='utf8') as f:
+                    for line in csv.DictReader(f):
+                        row = [line['id'], line['begin'], line['end']] + [line.get(x, '') for x in properties]
+                        if 'label' in properties:
+                            row.append(line['label'].lower())
+                        row.append(labels)
+                        node_writer.writerow(row)
+                        for rel_type, end_space, column in relationships:
+                            if not line[column]:
+                                continue
+                            writer = bulk_writer('{}_{}'.format(at, rel_type),
+                                                 [':START_ID({})'.format(at), ':END_ID({})'.format(end_space),
+                                                  ':TYPE'], relationship=True)
+                            if rel_type == 'precedes':
+                                writer.writerow([line[column], line['id'], rel_type])
+                            else:
+                                writer.writerow([line['id'], line[column], rel_type])
+
+        for k, v in data.hierarchy.subannotations.items():
+            for sub in v:
+                labels = '{};{};speech'.format(sub, corpus_name)
+                node_writer = bulk_writer('{}_nodes'.format(sub), ['id:ID({})'.format(sub), 'begin:float',
+                                                                   'end:float', 'label', ':LABEL'])
+                writer = bulk_writer('{}_{}_annotates'.format(k, sub), [':START_ID({})'.format(sub),
+                                                                        ':END_ID({})'.format(k), ':TYPE'],
+                                     relationship=True)
+                for s in speakers:
+                    path = os.path.join(csv_directory, '{}_{}_{}.csv'.format(s, k, sub))
+                    if not os.path.exists(path):
+                        continue
+                    with open(path, 'r', newline='', encoding='utf8') as f:
+                        for line in csv.DictReader(f):
+                            node_writer.writerow([line['id'], line['begin'], line['end'], line['label'], labels])
+                            writer.writerow([line['id'], line['annotation_id'], 'annotates'])
+    finally:
+        for f in files:
+            f.close()
+    return node_paths, relationship_paths
 
 
 def utterance_data_to_csvs(corpus_context, speaker_data):
@@ -1,11 +1,11 @@
 import os
 import math
 
-from textgrid import TextGrid, IntervalTier
 
 from polyglotdb.structure import Hierarchy
 
 from ..helper import guess_type, guess_trans_delimiter
+from ..textgrid import read_textgrid, IntervalTier
 
 from ..types.parsing import *
 
@@ -81,10 +81,7 @@ def uniqueLabels(tier):
     set
         label from the tier
     """
-    try:
-        return set(x.mark for x in tier.intervals)
-    except AttributeError:
-        return set(x.mark for x in tier.points)
+    return set(tier.labels)
 
 
 def average_duration(tier):
@@ -103,9 +100,9 @@ def average_duration(tier):
     """
 
     if isinstance(tier, IntervalTier):
-        return sum(float(x.maxTime) - float(x.minTime) for x in tier) / len(tier)
+        return sum((tier.ends - tier.begins).tolist()) / len(tier)
     else:
-        return float(tier.maxTime) / len(tier)
+        return float(tier.max_time) / len(tier)
 
 
 def averageLabelLen(tier):
@@ -171,7 +168,7 @@ def guess_tiers(tg):
     for i, t in enumerate(tg.tiers):
         if len(t) == 0:
             continue
-        t.maxTime = tg.maxTime
+        t.max_time = tg.max_time
         tier_properties[t.name] = (i, average_duration(t))
     for k, v in tier_properties.items():
         if v is None:
@@ -224,8 +221,7 @@ def inspect_textgrid(path):
         textgrids.append(path)
     anno_types = []
     for t in textgrids:
-        tg = TextGrid()
-        tg.read(t)
+        tg = read_textgrid(t)
         if len(anno_types) == 0:
             tier_guesses, hierarchy = guess_tiers(tg)
             for ti in tg.tiers:
@@ -259,19 +255,13 @@ def inspect_textgrid(path):
                         print(cat)
                         raise (NotImplementedError)
                 if not a.ignored:
-                    try:
-                        a.add(((x.mark.strip(), x.minTime, x.maxTime) for x in ti), save=False)
-                    except AttributeError:
-                        a.add(((x.mark.strip(), x.time) for x in ti), save=False)
+                    a.add(ti.annotations(), save=False)
                 anno_types.append(a)
         else:
             for i, ti in enumerate(tg.tiers):
                 if anno_types[i].ignored:
                     continue
-                try:
-                    anno_types[i].add(((x.mark.strip(), x.minTime, x.maxTime) for x in ti), save=False)
-                except AttributeError:
-                    anno_types[i].add(((x.mark.strip(), x.time) for x in ti), save=False)
+                anno_types[i].add(ti.annotations(), save=False)
 
     parser = TextgridParser(anno_types, hierarchy)
     return parser
@@ -1,14 +1,13 @@
 #from __future__ import absolute_import
 import os
 
-from textgrid import TextGrid, IntervalTier
-
 from .textgrid import TextgridParser
 from ..types.parsing import OrthographyTier
 
 from polyglotdb.exceptions import TextGridError
 from ..helper import find_wav_path, get_n_channels
 from polyglotdb.io.helper import find_wav_path
+from polyglotdb.io.textgrid import read_textgrid
 
 from polyglotdb.io.parsers.base import DiscourseData
 
@@ -80,9 +79,8 @@ class AlignerParser(TextgridParser):
         :class:`~polyglotdb.io.discoursedata.DiscourseData`
             Parsed data from the file
         '''
-        tg = TextGrid()
         try:
-            tg.read(path)
+            tg = read_textgrid(path)
         except Exception as e:
             print('There was an issue parsing {}:'.format(path))
             raise
@@ -107,9 +105,9 @@ class AlignerParser(TextgridParser):
             # Parse the tiers
             for i, ti in enumerate(tg.tiers):
                 if ti.name.lower().startswith(self.word_label):
-                    self.annotation_types[0].add(((x.mark.strip(), x.minTime, x.maxTime) for x in ti))
+                    self.annotation_types[0].add(ti.annotations())
                 elif ti.name.lower().startswith(self.phone_label):
-                    self.annotation_types[1].add(((x.mark.strip(), x.minTime, x.maxTime) for x in ti))
+                    self.annotation_types[1].add(ti.annotations())
             pg_annotations = self._parse_annotations(types_only)
 
             data = DiscourseData(name, pg_annotations, self.hierarchy)
@@ -166,11 +164,11 @@ class AlignerParser(TextgridParser):
                     type = 'word'
                 elif type.lower().startswith(self.phone_label):
                     type = 'phone'
-                if len(ti) == 1 and ti[0].mark.strip() == '':
+                if len(ti) == 1 and ti.labels[0].strip() == '':
                     continue
                 at = OrthographyTier(type, type)
                 at.speaker = speaker
-                at.add(((x.mark.strip(), x.minTime, x.maxTime) for x in ti))
+                at.add(ti.annotations())
                 self.annotation_types.append(at)
             pg_annotations = self._parse_annotations(types_only)
             data = DiscourseData(name, pg_annotations, self.hierarchy)
@@ -2,6 +2,8 @@ import os
 import re
 import sys
 import hashlib
+from collections import deque
+from itertools import islice
 
 from polyglotdb.exceptions import BuckeyeParseError
 
@@ -84,59 +86,70 @@ class BuckeyeParser(BaseParser):
             a.speaker = speaker
 
         try:
-            words = read_words(word_path)
+            words = iter_words(word_path)
         except Exception as e:
             print(e)
             return
-        phones = read_phones(phone_path)
+        phones = iter_phones(phone_path)
+        upcoming = deque(islice(phones, 1))
 
         if self.call_back is not None:
             cur = 0
             self.call_back("Parsing %s..." % name)
-            self.call_back(0, len(words))
-
-        for i, w in enumerate(words):
-            if self.stop_check is not None and self.stop_check():
-                return
-            if self.call_back is not None:
-                cur += 1
-                if cur % 20 == 0:
-                    self.call_back(cur)
-            annotations = {}
-            word = w['spelling']
-            if word[0] == '{':
-                continue
-            beg = w['begin']
-            end = w['end']
-
-            found = []
+            self.call_back(0, 0)
 
-            while len(phones):
-                if contained_by(w, phones[0]):
-                    cur_phone = phones.pop(0)
-                    found.append(cur_phone)
-                elif phones[0][0][0] == '{' or phones[0][1] < beg:
-                    phones.pop(0)
+        next_begin = None
+        try:
+            for w in words:
+                if self.stop_check is not None and self.stop_check():
+                    return
+                if self.call_back is not None:
+                    cur += 1
+                    if cur % 20 == 0:
+                        self.call_back(cur)
+                if next_begin is not None:
+                    w['begin'] = next_begin
+                    next_begin = None
+                word = w['spelling']
+                if word[0] == '{':
+                    continue
+                beg = w['begin']
+                end = w['end']
+
+                found = []
+
+                while upcoming:
+                    if contained_by(w, upcoming[0]):
+                        found.append(upcoming.popleft())
+                    elif upcoming[0][0][0] == '{' or upcoming[0][1] < beg:
+                        upcoming.popleft()
+                    else:
+                        break
+                    upcoming.extend(islice(phones, 1))
+                if not found:
+                    ba = ('?', w['begin'], w['end'])
+                    found.append(ba)
                 else:
-                    break
-            if not found:
-                ba = ('?', w['begin'], w['end'])
-                found.append(ba)
-            else:
-                beg = found[0][1]
-                if end != found[-1][2]:
-                    end = found[-1][2]
-                    if i != len(words) - 1:
-                        words[i + 1]['begin'] = end
-            self.annotation_types[0].add([(word, beg, end)])
-            if w['transcription'] is None:
-                w['transcription'] = '?'
-            if w['surface_transcription'] is None:
-                w['surface_transcription'] = '?'
-            self.annotation_types[1].add([(w['transcription'], beg, end)])
-            self.annotation_types[2].add([(' '.join(w['surface_transcription']), beg, end)])
-            self.annotation_types[3].add([(w['category'], beg, end)])
-            self.annotation_types[4].add(found)
+                    beg = found[0][1]
+                    if end != found[-1][2]:
+                        end = found[-1][2]
+                        next_begin = end
+                self.annotation_types[0].add([(word, beg, end)])
+                if w['transcription'] is None:
+                    w['transcription'] = '?'
+                if w['surface_transcription'] is None:
+                    w['surface_transcription'] = '?'
+                self.annotation_types[1].add([(w['transcription'], beg, end)])
+                self.annotation_types[2].add([(' '.join(w['surface_transcription']), beg, end)])
+                self.annotation_types[3].add([(w['category'], beg, end)])
+                self.annotation_types[4].add(found)
+        except BuckeyeParseError as e:
+            print(e)
+            for a in self.annotation_types:
+                a.reset()
+            return
+        finally:
+            phones.close()
 
         pg_annotations = self._parse_annotations(types_only)
 
@@ -148,30 +161,52 @@ class BuckeyeParser(BaseParser):
         return data
 
 
-def read_phones(path):
+def read_data_lines(file_handle):
     """
-    From a buckeye file, reads the phone lines, appends label, begin, and end to output
-    
+    Generate the lines following the header of a Buckeye file, which ends with a line of ``#``
+
+    Parameters
+    ----------
+    file_handle : file
+        Open Buckeye file
+
+    Yields
+    ------
+    str
+        Line of the file without the line break
+    """
+    in_header = True
+    for line in file_handle:
+        line = line.rstrip('\r\n')
+        if line.endswith('#'):
+            if in_header:
+                in_header = False
+                continue
+            yield line[:-1]
+            break
+        if not in_header:
+            yield line
+
+
+def iter_phones(path):
+    """
+    From a buckeye file, generates the label, begin, and end of each phone line, one line at a time
+
     Parameters
     ----------
     path : str
         path to file
-    
-    Returns
-    -------
-    output : list of tuples
-        each tuple is label, begin, end for a phone
 
+    Yields
+    ------
+    tuple
+        label, begin, end for a phone
     """
-    output = []
+    line_pattern = re.compile("\s+\d{3}\s+")
+    label_pattern = re.compile(" {0,1};| {0,1}\+")
     with open(path, 'r') as file_handle:
-        header_pattern = re.compile("#\r{0,1}\n")
-        line_pattern = re.compile("\s+\d{3}\s+")
-        label_pattern = re.compile(" {0,1};| {0,1}\+")
-        f = header_pattern.split(file_handle.read())[1]
-        flist = f.splitlines()
         begin = 0.0
-        for l in flist:
+        for l in read_data_lines(file_handle):
             line = line_pattern.split(l.strip())
             try:
                 end = float(line[0])
@@ -179,14 +214,13 @@ def read_phones(path):
                 print('Warning: no label found in line: \'{}\''.format(l))
                 continue
             label = label_pattern.split(line[1])[0]
-            output.append((label, begin, end))
+            yield (label, begin, end)
             begin = end
-    return output
 
 
-def read_words(path):
+def read_phones(path):
     """
-    From a buckeye file, reads the word info
+    From a buckeye file, reads the phone lines, appends label, begin, and end to output
     
     Parameters
     ----------
@@ -195,46 +229,85 @@ def read_words(path):
     
     Returns
     -------
-    output : list of dicts
-        each dict has spelling, begin, end, transcription, surface_transcription, category
+    output : list of tuples
+        each tuple is label, begin, end for a phone
 
     """
-    output = []
-    misparsed_lines = []
-    with open(path, 'r') as file_handle:
-        f = re.split(r"#\r{0,1}\n", file_handle.read())[1]
+    return list(iter_phones(path))
+
+
+def iter_words(path):
+    """
+    From a buckeye file, generates the word info one line at a time
+
+    The file is opened when this function is called, so missing files are reported before iterating.
+    Misparsed lines are collected and reported in a
+    :class:`~polyglotdb.exceptions.BuckeyeParseError` once the rest of the file has been generated.
+
+    Parameters
+    ----------
+    path : str
+        path to file
+
+    Returns
+    -------
+    generator
+        dicts with spelling, begin, end, transcription, surface_transcription, category
+    """
+    file_handle = open(path, 'r')
+
+    def generate():
+        misparsed_lines = []
         line_pattern = re.compile("; | \d{3} ")
         begin = 0.0
-        flist = f.splitlines()
-        for l in flist:
-            line = line_pattern.split(l.strip())
-            try:
-                end = float(line[0])
-                word = line[1].replace(' ', '_')
-                if word[0] != "<" and word[0] != "{":
-                    citation = line[2]
-                    phonetic = line[3].split(' ')
-                    if len(line) > 4:
-                        category = line[4]
-                        if word in FILLERS:
-                            category = 'UH'
+        with file_handle:
+            for l in read_data_lines(file_handle):
+                line = line_pattern.split(l.strip())
+                try:
+                    end = float(line[0])
+                    word = line[1].replace(' ', '_')
+                    if word[0] != "<" and word[0] != "{":
+                        citation = line[2]
+                        phonetic = line[3].split(' ')
+                        if len(line) > 4:
+                            category = line[4]
+                            if word in FILLERS:
+                                category = 'UH'
+                        else:
+                            category = None
                     else:
+                        citation = None
+                        phonetic = None
                         category = None
-                else:
-                    citation = None
-                    phonetic = None
-                    category = None
-            except IndexError:
-                misparsed_lines.append(l)
-                continue
-            line = {'spelling': word, 'begin': begin, 'end': end,
-                    'transcription': citation, 'surface_transcription': phonetic,
-                    'category': category}
-            output.append(line)
-            begin = end
-    if misparsed_lines:
-        raise (BuckeyeParseError(path, misparsed_lines))
-    return output
+                except IndexError:
+                    misparsed_lines.append(l)
+                    continue
+                yield {'spelling': word, 'begin': begin, 'end': end,
+                       'transcription': citation, 'surface_transcription': phonetic,
+                       'category': category}
+                begin = end
+        if misparsed_lines:
+            raise (BuckeyeParseError(path, misparsed_lines))
+
+    return generate()
+
+
+def read_words(path):
+    """
+    From a buckeye file, reads the word info
+    
+    Parameters
+    ----------
+    path : str
+        path to file
+    
+    Returns
+    -------
+    output : list of dicts
+        each dict has spelling, begin, end, transcription, surface_transcription, category
+
+    """
+    return list(iter_words(path))
 
 
 def phone_match(one, two):
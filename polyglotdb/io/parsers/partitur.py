@@ -32,15 +32,14 @@ class PartiturParser(BaseParser):
         :class:`~polyglotdb.io.discoursedata.DiscourseData`
             Parsed data from the file
         '''
-        speaker = parse_speaker(path)
+        speaker, words, phones = read_partitur(path)
         for a in self.annotation_types:
             a.reset()
             a.speaker = speaker
 
         name = os.path.splitext(os.path.split(path)[1])[0]
 
-        phones = read_phones(path)
-        scrambled = match_words(read_words(path), phones)
+        scrambled = match_words(words, phones)
         words = sorted(scrambled.values(), key=lambda x: x[1])
 
         for i, tup in enumerate(words):
@@ -63,6 +62,95 @@ class PartiturParser(BaseParser):
         return data
 
 
+def iter_lines(path):
+    """
+    Generate the split lines of a BAS partitur file, one line at a time
+
+    Parameters
+    ----------
+    path : str
+        a path to the file
+
+    Yields
+    ------
+    list
+        the line split on whitespace
+    """
+    with open(path, 'r', encoding='utf8') as f:
+        for line in f:
+            yield re.split("\s", line)
+
+
+def add_word_line(words, splitline):
+    """
+    Add the orthography or canonical transcription of a word from a line of a BAS partitur file
+
+    Parameters
+    ----------
+    words : dict
+        dictionary of words and their indexes
+    splitline : list
+        an ORT or KAN line split on whitespace
+    """
+    if splitline[1] not in words:
+        words[splitline[1]] = [None, None]
+    if splitline[0] == 'ORT:':
+        words[splitline[1]][0] = splitline[2]
+    else:
+        words[splitline[1]][-1] = splitline[2]
+
+
+def add_phone_line(phones, splitline):
+    """
+    Add a phone from a MAU line of a BAS partitur file
+
+    Parameters
+    ----------
+    phones : dict
+        dictionary of phones, their word indexes, and their begin and end
+    splitline : list
+        a MAU line split on whitespace
+    """
+    begin = float(splitline[1].strip()) / 10000
+    end = begin + float(splitline[2].strip()) / 10000
+    index = splitline[3]
+    try:
+        phones[index].append((splitline[4].strip(), begin, end))
+    except KeyError:
+        phones[index] = [(splitline[4].strip(), begin, end)]
+
+
+def read_partitur(path):
+    """
+    Get the speaker id, word info and phone info from a BAS partitur file in a single pass
+
+    Parameters
+    ----------
+    path : str
+        a path to the file
+    Returns
+    -------
+    str or None
+        the speaker id
+    dict
+        dictionary of words and their indexes
+    dict
+        dictionary of phones, their word indexes, and their begin and end
+    """
+    speaker = None
+    words = {}
+    phones = {}
+    for splitline in iter_lines(path):
+        if splitline[0] == 'SPN:':
+            if speaker is None:
+                speaker = splitline[1].strip()
+        elif splitline[0] in ('ORT:', 'KAN:'):
+            add_word_line(words, splitline)
+        elif splitline[0] == 'MAU:':
+            add_phone_line(phones, splitline)
+    return speaker, words, phones
+
+
 def parse_speaker(path):
     """
     Get speaker id from a BAS partitur file
@@ -76,11 +164,7 @@ def parse_speaker(path):
     str or None
         the speaker id
     """
-    speaker = ''
-    with open(path, 'r', encoding='utf8') as f:
-        lines = f.readlines()
-    for line in lines:
-        splitline = re.split("\s", line)
+    for splitline in iter_lines(path):
         if splitline[0] == 'SPN:':
             return splitline[1].strip()
 
@@ -101,23 +185,9 @@ def read_words(path):
         dictionary of words and their indexes
     """
     words = {}
-    with open(path, 'r', encoding='utf8') as f:
-        lines = f.readlines()
-    for line in lines:
-        splitline = re.split("\s", line)
-        if splitline[0] == 'ORT:':
-            try:
-                words[splitline[1]][0] = splitline[2]
-            except KeyError:
-                words[splitline[1]] = [None, None]
-                words[splitline[1]][0] = splitline[2]
-                # words.update({splitline[1].strip():splitline[2].strip()})
-        if splitline[0] == 'KAN:':
-            try:
-                words[splitline[1]][-1] = splitline[2]
-            except KeyError:
-                words[splitline[1]] = [None, None]
-                words[splitline[1]][-1] = splitline[2]
+    for splitline in iter_lines(path):
+        if splitline[0] in ('ORT:', 'KAN:'):
+            add_word_line(words, splitline)
     return words
 
 
@@ -135,19 +205,9 @@ def read_phones(path):
         dictionary of phones, their word indexes, and their begin and end
     """
     phones = {}
-    with open(path, 'r', encoding='utf8') as f:
-        lines = f.readlines()
-    for i, line in enumerate(lines):
-        splitline = re.split("\s", line)
+    for splitline in iter_lines(path):
         if splitline[0] == 'MAU:':
-            begin = float(splitline[1].strip()) / 10000
-            end = begin + float(splitline[2].strip()) / 10000
-            index = splitline[3]
-            try:
-                phones[index].append((splitline[4].strip(), begin, end))
-            except KeyError:
-                phones[index] = [(splitline[4].strip(), begin, end)]
-
+            add_phone_line(phones, splitline)
     return phones
 
 
@@ -67,13 +67,12 @@ class TimitParser(BaseParser):
         if self.call_back is not None:
             self.call_back('Reading files...')
             self.call_back(0, 0)
-        words = read_words(word_path)
-        phones = read_phones(phone_path)
-        if words[-1]['end'] != phones[-1][2]:
-            words.append({'spelling': 'sil', 'begin': words[-1]['end'], 'end': phones[-1][2]})
-
-        self.annotation_types[0].add((x['spelling'], x['begin'], x['end']) for x in words)
-        self.annotation_types[1].add(phones)
+        self.annotation_types[0].add((x['spelling'], x['begin'], x['end']) for x in iter_words(word_path))
+        self.annotation_types[1].add(iter_phones(phone_path))
+        word_end = self.annotation_types[0][-1].end
+        phone_end = self.annotation_types[1][-1].end
+        if word_end != phone_end:
+            self.annotation_types[0].add([('sil', word_end, phone_end)])
 
         pg_annotations = self._parse_annotations(types_only)
 
@@ -95,22 +94,20 @@ class TimitParser(BaseParser):
         return data
 
 
-def read_phones(path):
+def iter_phones(path):
     """
-    From a timit file, reads the phone lines, appends label, begin, and end to output
-    
+    From a timit file, generates the label, begin, and end of each phone line, one line at a time
+
     Parameters
     ----------
     path : str
         path to file
-    
-    Returns
-    -------
-    output : list of tuples
-        each tuple is label, begin, end for a phone
 
+    Yields
+    ------
+    tuple
+        label, begin, end for a phone
     """
-    output = []
     sr = 16000
     with open(path, 'r') as file_handle:
         for line in file_handle:
@@ -118,13 +115,12 @@ def read_phones(path):
             begin = float(l[0]) / sr
             end = float(l[1]) / sr
             label = l[2]
-            output.append((label, begin, end))
-    return output
+            yield (label, begin, end)
 
 
-def read_words(path):
+def read_phones(path):
     """
-    From a timit file, reads the word info
+    From a timit file, reads the phone lines, appends label, begin, and end to output
     
     Parameters
     ----------
@@ -133,11 +129,27 @@ def read_words(path):
     
     Returns
     -------
-    output : list of dicts
-        each dict has spelling, begin, end
+    output : list of tuples
+        each tuple is label, begin, end for a phone
 
     """
-    output = []
+    return list(iter_phones(path))
+
+
+def iter_words(path):
+    """
+    From a timit file, generates the word info one line at a time, with silences between words
+
+    Parameters
+    ----------
+    path : str
+        path to file
+
+    Yields
+    ------
+    dict
+        spelling, begin, end of a word or silence
+    """
     sr = 16000
     prev = None
     with open(path, 'r') as file_handle:
@@ -147,9 +159,26 @@ def read_words(path):
             end = float(l[1]) / sr
             word = l[2]
             if prev is not None and begin != prev:
-                output.append({'spelling': '<SIL>', 'begin': prev, 'end': begin})
+                yield {'spelling': '<SIL>', 'begin': prev, 'end': begin}
             elif prev is None and begin != 0:
-                output.append({'spelling': '<SIL>', 'begin': 0, 'end': begin})
-            output.append({'spelling': word, 'begin': begin, 'end': end})
+                yield {'spelling': '<SIL>', 'begin': 0, 'end': begin}
+            yield {'spelling': word, 'begin': begin, 'end': end}
             prev = end
-    return output
+
+
+def read_words(path):
+    """
+    From a timit file, reads the word info
+    
+    Parameters
+    ----------
+    path : str
+        path to file
+    
+    Returns
+    -------
+    output : list of dicts
+        each dict has spelling, begin, end
+
+    """
+    return list(iter_words(path))
@@ -0,0 +1,303 @@
+import re
+import codecs
+
+import numpy as np
+
+from polyglotdb.exceptions import TextGridError
+
+HEADER_PATTERN = re.compile(r'File type = "([\w ]+)"')
+
+LONG_VALUE_PATTERN = re.compile(r'= ("(?:[^"]|"")*"|\S+)')
+
+SHORT_VALUE_PATTERN = re.compile(r'"(?:[^"]|"")*"|[^\s"]+')
+
+DEFAULT_PRECISION = 5
+
+
+class IntervalTier(object):
+    """
+    Interval tier of a TextGrid, stored as columns of labels, begins and ends sorted by begin
+
+    Parameters
+    ----------
+    name : str
+        Name of the tier
+    min_time : float
+        Beginning of the tier
+    max_time : float
+        End of the tier
+    labels : list
+        Label of each interval
+    begins : :class:`numpy.ndarray`
+        Begin time of each interval
+    ends : :class:`numpy.ndarray`
+        End time of each interval
+    """
+
+    def __init__(self, name, min_time, max_time, labels, begins, ends):
+        self.name = name
+        self.min_time = min_time
+        self.max_time = max_time
+        self.labels = labels
+        self.begins = begins
+        self.ends = ends
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __repr__(self):
+        return '<IntervalTier {} with {} intervals>'.format(self.name, len(self))
+
+    def annotations(self):
+        """
+        Generate the intervals of the tier for adding to an annotation type
+
+        Returns
+        -------
+        iterable
+            Tuples of stripped label, begin and end
+        """
+        return zip((x.strip() for x in self.labels), self.begins.tolist(), self.ends.tolist())
+
+
+class PointTier(object):
+    """
+    Point tier of a TextGrid, stored as columns of labels and times sorted by time
+
+    Parameters
+    ----------
+    name : str
+        Name of the tier
+    min_time : float
+        Beginning of the tier
+    max_time : float
+        End of the tier
+    labels : list
+        Label of each point
+    times : :class:`numpy.ndarray`
+        Time of each point
+    """
+
+    def __init__(self, name, min_time, max_time, labels, times):
+        self.name = name
+        self.min_time = min_time
+        self.max_time = max_time
+        self.labels = labels
+        self.times = times
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __repr__(self):
+        return '<PointTier {} with {} points>'.format(self.name, len(self))
+
+    def annotations(self):
+        """
+        Generate the points of the tier for adding to an annotation type
+
+        Returns
+        -------
+        iterable
+            Tuples of stripped label and time
+        """
+        return zip((x.strip() for x in self.labels), self.times.tolist())
+
+
+class TextGrid(object):
+    """
+    Tiers of a Praat TextGrid
+
+    Parameters
+    ----------
+    min_time : float
+        Beginning of the TextGrid
+    max_time : float
+        End of the TextGrid
+    tiers : list
+        :class:`IntervalTier` and :class:`PointTier` objects in the order they appear in the file
+    """
+
+    def __init__(self, min_time, max_time, tiers):
+        self.min_time = min_time
+        self.max_time = max_time
+        self.tiers = tiers
+
+    def __len__(self):
+        return len(self.tiers)
+
+    def __iter__(self):
+        return iter(self.tiers)
+
+    def __getitem__(self, key):
+        return self.tiers[key]
+
+
+def detect_encoding(path):
+    """
+    Detect the encoding of a TextGrid file, which Praat saves as UTF-16 when labels are not ASCII
+
+    Parameters
+    ----------
+    path : str
+        Path to the TextGrid file
+
+    Returns
+    -------
+    str
+        Name of the encoding
+    """
+    with open(path, 'rb') as f:
+        start = f.read(4)
+    if start.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    if start[:2].startswith(b'\x00'):
+        return 'utf-16-be'
+    if start[1:2] == b'\x00':
+        return 'utf-16-le'
+    return 'utf-8-sig'
+
+
+def unquote(value):
+    """
+    Remove the quotes around a Praat string, and unescape its doubled quotes
+
+    Parameters
+    ----------
+    value : str
+        Quoted string
+
+    Returns
+    -------
+    str
+        String contents
+    """
+    return value[1:-1].replace('""', '"')
+
+
+def parse_times(values, round_digits):
+    """
+    Convert time values to an array, rounded as the ``textgrid`` package does
+
+    Parameters
+    ----------
+    values : list
+        Time values as strings
+    round_digits : int
+        Number of decimal places to round to
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Rounded times
+    """
+    return np.array([round(float(x), round_digits) for x in values], dtype=float)
+
+
+def read_interval_tier(name, min_time, max_time, values, round_digits):
+    """
+    Build an interval tier from the flat list of begin, end and label values of its intervals
+
+    Intervals of zero or negative duration are skipped, as Praat cannot represent them.
+    """
+    begins = parse_times(values[0::3], round_digits)
+    ends = parse_times(values[1::3], round_digits)
+    labels = values[2::3]
+    keep = begins < ends
+    if not keep.all():
+        begins = begins[keep]
+        ends = ends[keep]
+        labels = [x for x, k in zip(labels, keep) if k]
+    order = np.argsort(begins, kind='mergesort')
+    if np.any(order[1:] < order[:-1]):
+        begins = begins[order]
+        ends = ends[order]
+        labels = [labels[i] for i in order]
+    if len(begins):
+        if begins[0] < min_time or (max_time and ends[-1] > max_time):
+            raise ValueError('intervals in tier "{}" are outside of the tier'.format(name))
+        overlaps = np.nonzero(begins[1:] < ends[:-1])[0]
+        if len(overlaps):
+            raise ValueError('intervals in tier "{}" overlap at {}'.format(name, begins[overlaps[0] + 1]))
+    return IntervalTier(name, min_time, max_time, [unquote(x) for x in labels], begins, ends)
+
+
+def read_point_tier(name, min_time, max_time, values, round_digits):
+    """
+    Build a point tier from the flat list of time and label values of its points
+    """
+    times = parse_times(values[0::2], round_digits)
+    labels = values[1::2]
+    order = np.argsort(times, kind='mergesort')
+    if np.any(order[1:] < order[:-1]):
+        times = times[order]
+        labels = [labels[i] for i in order]
+    if len(times):
+        if times[0] < min_time or (max_time and times[-1] > max_time):
+            raise ValueError('points in tier "{}" are outside of the tier'.format(name))
+        duplicates = np.nonzero(times[1:] == times[:-1])[0]
+        if len(duplicates):
+            raise ValueError('tier "{}" has multiple points at {}'.format(name, times[duplicates[0]]))
+    return PointTier(name, min_time, max_time, [unquote(x) for x in labels], times)
+
+
+def read_textgrid(path, round_digits=DEFAULT_PRECISION):
+    """
+    Read a Praat TextGrid file in the long or short text format, storing the intervals and points of each tier
+    as columns rather than as an object per interval
+
+    Times are rounded to five decimal places, as the ``textgrid`` package does.
+
+    Parameters
+    ----------
+    path : str
+        Path to the TextGrid file
+    round_digits : int
+        Number of decimal places to round times to
+
+    Returns
+    -------
+    :class:`TextGrid`
+        Tiers of the file
+    """
+    with open(path, 'r', encoding=detect_encoding(path)) as f:
+        header = f.readline()
+        text = f.read()
+    m = HEADER_PATTERN.match(header)
+    if m is None or not m.groups()[0].startswith('ooTextFile'):
+        raise TextGridError('The file {} could not be parsed: it is lacking a proper header.'.format(path))
+    object_class, _, text = text.partition('\n')
+    if '"TextGrid"' not in object_class:
+        raise TextGridError('The file {} could not be parsed: it is not a TextGrid.'.format(path))
+    if re.match(r'\s*xmin = ', text):
+        values = LONG_VALUE_PATTERN.findall(text)
+    else:
+        values = [x for x in SHORT_VALUE_PATTERN.findall(text) if x != '<exists>']
+    try:
+        min_time = round(float(values[0]), round_digits)
+        max_time = round(float(values[1]), round_digits)
+        tiers = []
+        if len(values) > 2 and values[2] != '<absent>':
+            cur = 3
+            for i in range(int(values[2])):
+                tier_class, name = unquote(values[cur]), unquote(values[cur + 1])
+                tier_min = round(float(values[cur + 2]), round_digits)
+                tier_max = round(float(values[cur + 3]), round_digits)
+                size = int(values[cur + 4])
+                cur += 5
+                if tier_class == 'IntervalTier':
+                    end = cur + 3 * size
+                else:
+                    end = cur + 2 * size
+                if len(values) < end:
+                    raise ValueError('the file ends before tier "{}" is complete'.format(name))
+                if tier_class == 'IntervalTier':
+                    tier = read_interval_tier(name, tier_min, tier_max, values[cur:end], round_digits)
+                else:
+                    tier = read_point_tier(name, tier_min, tier_max, values[cur:end], round_digits)
+                if max_time is not None and tier_max > max_time:
+                    raise ValueError('tier "{}" ends after the TextGrid'.format(name))
+                cur = end
+                tiers.append(tier)
+    except (ValueError, IndexError) as e:
+        raise TextGridError('The file {} could not be parsed: {}'.format(path, str(e)))
+    return TextGrid(min_time, max_time, tiers)
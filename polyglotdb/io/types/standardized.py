@@ -1,6 +1,8 @@
 from uuid import uuid1
 import hashlib
 
+import numpy as np
+
 from ..helper import normalize_values_for_neo4j
 
 
@@ -121,21 +123,18 @@ class PGAnnotationType(object):
         self.type_properties = set()
         self.token_properties = set()
         self.is_word = False
-        self._lookup_dict = None
+        self._sorted = False
+        self._index = None
 
     def optimize_lookups(self):
         """
-        optimizes the lookup dictionary
+        Sorts annotations by begin time, to be done once all annotations have been added
         """
-        if self._lookup_dict is not None:
+        if self._sorted:
             return
         self._list = sorted(self._list, key=lambda x: x.begin)
-        if len(self._list) > 1000:
-            self._lookup_dict = {}
-            cur = 0
-            while cur < len(self._list):
-                self._lookup_dict[cur] = self._list[cur].begin
-                cur += 1000
+        self._sorted = True
+        self._index = None
 
     def add(self, annotation):
         """
@@ -147,6 +146,8 @@ class PGAnnotationType(object):
             the annotation to add
         """
         self._list.append(annotation)
+        self._sorted = False
+        self._index = None
         self.type_property_keys.update(annotation.type_keys())
         for k, v in annotation.type_properties.items():
             if isinstance(v, list):
@@ -175,47 +176,76 @@ class PGAnnotationType(object):
             speakers.add(s)
         return speakers
 
+    def _speaker_index(self, speaker):
+        """
+        Get the sorted arrays used to look up annotations of a speaker, building them if needed
+
+        Parameters
+        ----------
+        speaker : str
+            Speaker to look up, or None for annotations of all speakers
+
+        Returns
+        -------
+        dict or None
+            Sorted arrays of positions, begins, running maximum of ends and midpoints, or None if the speaker
+            has no annotations
+        """
+        if self._index is None:
+            positions = {None: []}
+            for i, x in enumerate(self._list):
+                positions[None].append(i)
+                if x.speaker is not None:
+                    positions.setdefault(x.speaker, []).append(i)
+            self._index = {k: np.array(v, dtype=np.intp) for k, v in positions.items()}
+        index = self._index.get(speaker, None)
+        if index is None:
+            return None
+        if not isinstance(index, dict):
+            positions = index
+            begins = np.array([self._list[i].begin for i in positions], dtype=float)
+            ends = np.array([self._list[i].end for i in positions], dtype=float)
+            midpoints = np.array([self._list[i].midpoint for i in positions], dtype=float)
+            order = np.argsort(begins, kind='mergesort')
+            mid_order = np.argsort(midpoints, kind='mergesort')
+            index = {'positions': positions[order],
+                     'begins': begins[order],
+                     'max_ends': np.maximum.accumulate(ends[order]),
+                     'mid_positions': positions[mid_order],
+                     'midpoints': midpoints[mid_order]}
+            self._index[speaker] = index
+        return index
+
     def lookup(self, timepoint, speaker=None):
         """
-        Searches the lookup_dict for a particular begin time, and optionally a speaker 
+        Finds the first annotation (by begin time) that contains a time point, and optionally belongs to a speaker
 
         Parameters
         ----------
         timepoint : double
-            the begin of the desired linguistic object
+            the time point to look up
         speaker : str
             Defaults to None
+
+        Returns
+        -------
+        :class:`~polyglotdb.io.types.standardized.PGAnnotation` or None
+            Annotation containing the time point, or None if no annotation contains it
         """
-        if self._lookup_dict is not None:
-            prev = 0
-            for ind, time in sorted(self._lookup_dict.items()):
-                if timepoint < time:
-                    if prev != 0:
-                        prev -= 500
-                    lookup_list = self._list[prev:ind + 100]
-                    break
-                prev = ind
-            else:
-                if ind != 0:
-                    ind -= 500
-                lookup_list = self._list[ind:]
-        else:
-            lookup_list = self._list
-        if speaker is None:
-            return next((x for x in lookup_list
-                         if timepoint >= x.begin and
-                         timepoint <= x.end),
-                        None)
-        else:
-            return next((x for x in lookup_list
-                         if x.speaker == speaker and
-                         timepoint >= x.begin and
-                         timepoint <= x.end),
-                        None)
+        index = self._speaker_index(speaker)
+        if index is None:
+            return None
+        timepoint = float(timepoint)
+        candidates = np.searchsorted(index['begins'], timepoint, side='right')
+        i = np.searchsorted(index['max_ends'], timepoint, side='left')
+        if i >= candidates:
+            return None
+        return self._list[index['positions'][i]]
 
     def lookup_range(self, begin, end, speaker=None):
         """
-        Searches the lookup_dict for objects between begin time, end time, and optionally a speaker 
+        Finds annotations whose midpoints are between a begin time and an end time, and optionally belong to a
+        speaker
 
         Parameters
         ----------
@@ -225,36 +255,19 @@ class PGAnnotationType(object):
             the upper bound of the range
         speaker : str
             Defaults to None
+
+        Returns
+        -------
+        list
+            Annotations in the range, sorted by begin time
         """
-        if self._lookup_dict is not None:
-            prev = 0
-            mapping = sorted(self._lookup_dict.items())
-            for i, (ind, time) in enumerate(mapping):
-                if begin < time:
-                    if end < time:
-                        lookup_list = self._list[prev:ind]
-                    else:
-                        try:
-                            lookup_list = self._list[prev:mapping[i + 1][0]]
-                        except IndexError:
-                            lookup_list = self._list[prev:]
-                    break
-                prev = ind
-            else:
-                lookup_list = self._list[ind:]
-        else:
-            lookup_list = self._list
-        if speaker is None:
-            return sorted([x for x in lookup_list
-                           if x.midpoint >= begin and
-                           x.midpoint <= end],
-                          key=lambda x: x.begin)
-        else:
-            return sorted([x for x in lookup_list
-                           if x.speaker == speaker and
-                           x.midpoint >= begin and
-                           x.midpoint <= end],
-                          key=lambda x: x.begin)
+        index = self._speaker_index(speaker)
+        if index is None:
+            return []
+        low = np.searchsorted(index['midpoints'], float(begin), side='left')
+        high = np.searchsorted(index['midpoints'], float(end), side='right')
+        found = [self._list[i] for i in np.sort(index['mid_positions'][low:high])]
+        return sorted(found, key=lambda x: x.begin)
 
     def __getitem__(self, key):
         return self._list[key]
@@ -1,7 +1,14 @@
 from statistics import mean
+from decimal import Decimal
+
+import numpy as np
 
 from .base import AnnotationAttribute
 
+PREFETCH_PADDING = 0.05
+
+PREFETCH_MAX_GAP = 1
+
 
 class AcousticAttribute(AnnotationAttribute):
     acoustic = True
@@ -17,6 +24,7 @@ class AcousticAttribute(AnnotationAttribute):
         self.cached_settings = None
         self.relative = False
         self.relative_time = False
+        self.prefetched = {}
 
     def __repr__(self):
         return '<AcousticAttribute \'{}\'>'.format(str(self))
@@ -38,6 +46,61 @@ class AcousticAttribute(AnnotationAttribute):
     def hydrate(self, corpus, discourse, begin, end):
         pass
 
+    def _get_track(self, corpus, discourse, begin, end, channel=0, num_points=0, relative_time=False):
+        raise NotImplementedError
+
+    def prefetch(self, corpus, discourse, ranges, channel=0):
+        """
+        Fetch the measurements covering a set of time ranges in a discourse, so that later calls
+        to ``hydrate`` within those ranges are served from memory instead of querying InfluxDB per annotation
+
+        Nearby ranges are merged and fetched with a single query each.
+
+        Parameters
+        ----------
+        corpus : :class:`~polyglotdb.corpus.CorpusContext`
+            The corpus to query
+        discourse : str
+            the discourse to query
+        ranges : list
+            List of (begin, end) tuples of the annotations that will be hydrated
+        channel : int
+            Channel of the track
+        """
+        clusters = []
+        for begin, end in sorted(ranges):
+            if clusters and begin - clusters[-1][1] <= PREFETCH_MAX_GAP:
+                clusters[-1][1] = max(clusters[-1][1], end)
+            else:
+                clusters.append([begin, end])
+        fetched = self.prefetched.setdefault((discourse, channel), [])
+        for begin, end in clusters:
+            begin -= PREFETCH_PADDING
+            end += PREFETCH_PADDING
+            track = self._get_track(corpus, discourse, begin, end, channel)
+            fetched.append((Decimal(begin).quantize(Decimal('0.001')), Decimal(end).quantize(Decimal('0.001')), track))
+
+    def clear_prefetched(self):
+        self.prefetched = {}
+
+    def _prefetched_track(self, discourse, begin, end, channel=0):
+        if (discourse, channel) not in self.prefetched:
+            return None
+        begin = Decimal(begin).quantize(Decimal('0.001'))
+        end = Decimal(end).quantize(Decimal('0.001'))
+        for fetched_begin, fetched_end, track in self.prefetched.get((discourse, channel), []):
+            if fetched_begin <= begin and end <= fetched_end:
+                break
+        else:
+            return None
+        track = track.slice(begin, end)
+        if self.relative_time:
+            # Same millisecond arithmetic as tracks queried with relative times
+            begin_ms = int(begin * 1000)
+            end_ms = int(end * 1000)
+            track._times = (np.round(track._times * 1000) - begin_ms) / (end_ms - begin_ms)
+        return track
+
 
 class AggregationAttribute(AcousticAttribute):
     def __init__(self, acoustic_attribute):
@@ -214,6 +277,10 @@ class PitchAttribute(AcousticAttribute):
     def __repr__(self):
         return '<PitchAttribute \'{}\'>'.format(str(self))
 
+    def _get_track(self, corpus, discourse, begin, end, channel=0, num_points=0, relative_time=False):
+        return corpus.get_pitch(discourse, begin, end, channel=channel, relative=self.relative,
+                                num_points=num_points, relative_time=relative_time)
+
     def hydrate(self, corpus, discourse, begin, end, channel=0, num_points=0, padding=0):
         """
         Gets all F0 from a discourse
@@ -242,8 +309,11 @@ class PitchAttribute(AcousticAttribute):
 
             begin -= padding
             end += padding
-            data = corpus.get_pitch(discourse, begin, end, channel=channel, relative=self.relative,
-                                       num_points=num_points, relative_time=self.relative_time)
+            data = None
+            if not num_points:
+                data = self._prefetched_track(discourse, begin, end, channel)
+            if data is None:
+                data = self._get_track(corpus, discourse, begin, end, channel, num_points, self.relative_time)
             self.cached_settings = (discourse, begin, end, channel, self.relative, num_points)
             self.cached_data = data
         return data
@@ -261,6 +331,10 @@ class IntensityAttribute(AcousticAttribute):
     def __repr__(self):
         return '<IntensityAttribute \'{}\'>'.format(str(self))
 
+    def _get_track(self, corpus, discourse, begin, end, channel=0, num_points=0, relative_time=False):
+        return corpus.get_intensity(discourse, begin, end, channel=channel, relative=self.relative,
+                                    relative_time=relative_time)
+
     def hydrate(self, corpus, discourse, begin, end, channel=0, num_points=0, padding=0):
         """
         Gets all Intensity from a discourse
@@ -288,8 +362,9 @@ class IntensityAttribute(AcousticAttribute):
         else:
             begin -= padding
             end += padding
-            data = corpus.get_intensity(discourse, begin, end, channel=channel, relative=self.relative,
-                                           relative_time=self.relative_time)
+            data = self._prefetched_track(discourse, begin, end, channel)
+            if data is None:
+                data = self._get_track(corpus, discourse, begin, end, channel, relative_time=self.relative_time)
             self.cached_settings = (discourse, begin, end, channel, self.relative)
             self.cached_data = data
         return data
@@ -308,6 +383,10 @@ class FormantAttribute(AcousticAttribute):
     def __repr__(self):
         return '<FormantAttribute \'{}\'>'.format(str(self))
 
+    def _get_track(self, corpus, discourse, begin, end, channel=0, num_points=0, relative_time=False):
+        return corpus.get_formants(discourse, begin, end, channel=channel, relative=self.relative,
+                                   relative_time=relative_time)
+
     def hydrate(self, corpus, discourse, begin, end, channel=0, num_points=0,padding=0):
         """
         Gets all formants from a discourse
@@ -335,8 +414,9 @@ class FormantAttribute(AcousticAttribute):
 
             begin -= padding
             end += padding
-            data = corpus.get_formants(discourse, begin, end, channel=channel, relative=self.relative,
-                                          relative_time=self.relative_time)
+            data = self._prefetched_track(discourse, begin, end, channel)
+            if data is None:
+                data = self._get_track(corpus, discourse, begin, end, channel, relative_time=self.relative_time)
             self.cached_settings = (discourse, begin, end, channel, self.relative)
             self.cached_data = data
         return data
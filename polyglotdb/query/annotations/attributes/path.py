@@ -10,9 +10,9 @@ class SubPathAnnotation(AnnotationCollectionNode):
         WITH {output_with_string}'''
 
     def subquery(self, withs, filters=None, optional=False):
-        input_with = ', '.join(withs)
+        input_with = ', '.join(sorted(withs))
         new_withs = withs - {self.collection_alias}
-        output_with = ', '.join(new_withs) + ', ' + self.with_statement()
+        output_with = ', '.join(sorted(new_withs)) + ', ' + self.with_statement()
         where_string = ''
         if filters is not None:
             relevant = []
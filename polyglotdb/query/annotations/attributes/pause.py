@@ -115,9 +115,9 @@ class FollowingPauseAnnotation(AnnotationCollectionNode):
 
     def subquery(self, withs, filters=None, optional=False):
         """Generates a subquery given a list of alias and type_alias """
-        input_with = ', '.join(withs)
+        input_with = ', '.join(sorted(withs))
         new_withs = withs - {self.collection_alias}
-        output_with = ', '.join(new_withs) + ', ' + self.with_statement()
+        output_with = ', '.join(sorted(new_withs)) + ', ' + self.with_statement()
 
         where_string = ''
         if filters is not None:
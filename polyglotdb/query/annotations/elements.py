@@ -115,6 +115,7 @@ class NotPrecedesPauseClauseElement(PausePrecedenceClauseElement):
 
 class SubsetClauseElement(AnnotationClauseElement):
     template = "{}:{}"
+    parameter_value = False
 
     def for_cypher(self):
         """
@@ -138,6 +139,7 @@ class ContainsClauseElement(AnnotationClauseElement):
     Clause for filtering based on hierarchical relations.
     """
     sign = 'contains'
+    parameter_value = False
     template = '''({alias})<-[:contained_by]-({token})-[:is_a]->({type} {{{label}: {value}}})'''
 
     def for_cypher(self):
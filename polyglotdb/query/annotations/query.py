@@ -1,5 +1,7 @@
-from collections import defaultdict
+from collections import defaultdict, deque
+from multiprocessing.pool import ThreadPool
 import copy
+import time
 
 from .elements import (ContainsClauseElement,
                        AlignmentClauseElement,
@@ -20,6 +22,22 @@ def base_stop_check():
     return False
 
 
+def run_partition(function, query):
+    """
+    Run a function on the query for a partition of a split query, timing it
+
+    Returns
+    -------
+    object
+        Return value of the function
+    float
+        Seconds taken
+    """
+    begin = time.time()
+    value = function(query)
+    return value, time.time() - begin
+
+
 class GraphQuery(BaseQuery):
     """
     Base GraphQuery class.
@@ -168,10 +186,17 @@ class GraphQuery(BaseQuery):
         self._preload_acoustics.extend(args)
         return self
 
-    def all(self):
+    def all(self, max_cache=None, stream=False):
         """
         Returns all results for the query
 
+        Parameters
+        ----------
+        max_cache : int
+            Maximum number of results to keep for indexing and iterating again, defaults to None (all results)
+        stream : bool
+            Fetch results from the graph database as they are read, defaults to False
+
         Returns
         -------
         res_list : list
@@ -208,7 +233,7 @@ class GraphQuery(BaseQuery):
                     self._hidden_columns.append(a.node.begin.column_name(a.begin_alias))
                 if not end_found:
                     self._hidden_columns.append(a.node.end.column_name(a.end_alias))
-        return QueryResults(self)
+        return QueryResults(self, max_cache=max_cache, stream=stream)
 
     def create_subset(self, label):
         labels_to_add = []
@@ -220,6 +245,13 @@ class GraphQuery(BaseQuery):
             self.corpus.hierarchy.add_token_labels(self.corpus, self.to_find.node_type, labels_to_add)
 
     def set_properties(self, **kwargs):
+        super(GraphQuery, self).set_properties(**kwargs)
+        self.update_token_properties(**kwargs)
+
+    def update_token_properties(self, **kwargs):
+        """
+        Update the token properties of the hierarchy after setting properties on the results of the query
+        """
         props_to_remove = []
         props_to_add = []
         for k, v in kwargs.items():
@@ -228,7 +260,6 @@ class GraphQuery(BaseQuery):
             else:
                 if not self.corpus.hierarchy.has_token_property(self.to_find.node_type, k):
                     props_to_add.append((k, type(kwargs[k])))
-        super(GraphQuery, self).set_properties(**kwargs)
         if props_to_add:
             self.corpus.hierarchy.add_token_properties(self.corpus, self.to_find.node_type, props_to_add)
         if props_to_remove:
@@ -241,7 +272,12 @@ class GraphQuery(BaseQuery):
     def cache(self, *args):
         self._cache.extend(args)
         self.corpus.execute_cypher(self.cypher(), **self.cypher_params())
+        self.update_cached_properties(*args)
 
+    def update_cached_properties(self, *args):
+        """
+        Add the properties cached by the query to the token properties of the hierarchy
+        """
         props_to_add = []
         for k in args:
             k = k.output_label
@@ -290,7 +326,26 @@ class SplitQuery(GraphQuery):
         return q
 
     def split_queries(self):
-        """ splits a query into multiple queries """
+        """
+        Splits a query into a query for each speaker or discourse
+
+        The queries share the structure of a single base query and differ only in the name they are filtered on,
+        which is bound as a parameter, so their Cypher statement is generated once and reused.
+        """
+        for _, q in self.partitions():
+            yield q
+
+    def partitions(self):
+        """
+        Generate the name of each speaker or discourse that the query is split by, along with its query
+
+        Yields
+        ------
+        str
+            Name of the speaker or discourse
+        :class:`~polyglotdb.query.annotations.query.GraphQuery`
+            Query for the speaker or discourse
+        """
         from .elements import BaseNotEqualClauseElement, BaseNotInClauseElement
         attribute_name = self.splitter[:-1]  # remove 's', fixme maybe?
         splitter_annotation = getattr(self.to_find, attribute_name)
@@ -316,6 +371,7 @@ class SplitQuery(GraphQuery):
             except AttributeError:
                 reg_filters.append(c)
 
+        base = self.base_query(reg_filters)
         for i, x in enumerate(splitter_names):
             if selection:
                 if include and x not in selection:
@@ -326,11 +382,62 @@ class SplitQuery(GraphQuery):
                 self.call_back(i)
                 self.call_back('Querying {} {} of {} ({})...'.format(attribute_name, i, len(splitter_names), x))
 
-            base = self.base_query(reg_filters)
-            al = base.required_nodes()
-            al.update(base.optional_nodes())
-            base = base.filter(splitter_attribute == x)
-            yield base
+            q = copy.copy(base)
+            for k, v in vars(base).items():
+                if isinstance(v, list):
+                    setattr(q, k, list(v))
+            q._criterion.append(splitter_attribute == x)
+            yield x, q
+
+    def run_partitions(self, function):
+        """
+        Run a function on the query for each speaker or discourse, on a pool of threads if the corpus is
+        configured to use more than one query job
+
+        Each partition's statement is sent in its own session.  At most twice as many partitions as threads are
+        run ahead of the partition being yielded, and no more partitions are started once ``stop_check``
+        returns True.  The time taken by each partition is reported through ``call_back``.
+
+        Parameters
+        ----------
+        function : callable
+            Function that takes the query for a partition
+
+        Yields
+        ------
+        object
+            Return value of the function for each partition, in the order of the partitions
+        """
+        num_jobs = getattr(self.corpus.config, 'query_jobs', 1)
+        partitions = self.partitions()
+        if num_jobs <= 1:
+            for name, q in partitions:
+                if self.stop_check():
+                    return
+                yield self._report_partition(name, *run_partition(function, q))
+            return
+        pool = ThreadPool(num_jobs)
+        try:
+            pending = deque()
+            for name, q in partitions:
+                if self.stop_check():
+                    return
+                pending.append((name, pool.apply_async(run_partition, (function, q))))
+                if len(pending) >= 2 * num_jobs:
+                    name, result = pending.popleft()
+                    yield self._report_partition(name, *result.get())
+            while pending:
+                if self.stop_check():
+                    return
+                name, result = pending.popleft()
+                yield self._report_partition(name, *result.get())
+        finally:
+            pool.terminate()
+
+    def _report_partition(self, name, value, time_taken):
+        if self.call_back is not None:
+            self.call_back('Finished {} {} in {:.2f} seconds'.format(self.splitter[:-1], name, time_taken))
+        return value
 
     def set_pause(self):
         """ sets a pause in queries """
@@ -339,45 +446,47 @@ class SplitQuery(GraphQuery):
                 return
             q.set_pause()
 
-    def all(self):
+    def all(self, max_cache=None, stream=False):
         """ returns all results from a query """
         labels = [x.attribute.label for x in self._criterion if hasattr(x, 'attribute')]
         if self._offset is not None or self._limit is not None or 'id' in labels:
-            return self.base_query().all()
+            return self.base_query().all(max_cache=max_cache, stream=stream)
         else:
             results = None
-            for q in self.split_queries():
-                if self.stop_check():
-                    return
+            for r in self.run_partitions(lambda q: GraphQuery.all(q, max_cache=max_cache, stream=stream)):
                 if results is None:
-                    r = q.all()
                     results = r
                 else:
-                    results.add_results(q)
+                    results.cursors.extend(r.cursors)
+            if self.stop_check():
+                return
             return results
 
     def to_csv(self, path):
-        for i, q in enumerate(self.split_queries()):
+        """
+        Output the results of the query to a CSV file, streaming the results of each partition and writing them
+        in the order of the partitions
+        """
+        for i, r in enumerate(self.run_partitions(lambda q: GraphQuery.all(q, max_cache=0, stream=True))):
             if i == 0:
                 mode = 'w'
             else:
                 mode = 'a'
-            r = q.all()
-
             r.to_csv(path, mode=mode)
 
     def delete(self):
         """ deletes the query """
-        for q in self.split_queries():
-            if self.stop_check():
-                return
-            q.delete()
+        for _ in self.run_partitions(GraphQuery.delete):
+            pass
 
     def cache(self, *args):
-        for q in self.split_queries():
-            if self.stop_check():
-                return
-            q.cache(*args)
+        def cache_partition(q):
+            q._cache.extend(args)
+            q.corpus.execute_cypher(q.cypher(), **q.cypher_params())
+
+        for _ in self.run_partitions(cache_partition):
+            pass
+        self.update_cached_properties(*args)
 
     def set_label(self, *args):
         """ sets the query type"""
@@ -388,10 +497,9 @@ class SplitQuery(GraphQuery):
 
     def set_properties(self, **kwargs):
         """ sets the query token """
-        for q in self.split_queries():
-            if self.stop_check():
-                return
-            q.set_properties(**kwargs)
+        for _ in self.run_partitions(lambda q: BaseQuery.set_properties(q, **kwargs)):
+            pass
+        self.update_token_properties(**kwargs)
 
 
 class SpeakerGraphQuery(SplitQuery):
@@ -1,8 +1,9 @@
-
+from collections import defaultdict
+from itertools import islice
 
 from polyglotdb.exceptions import GraphQueryError
 
-from ..base.results import BaseQueryResults, BaseRecord
+from ..base.results import BaseQueryResults, BaseRecord, column_index
 
 from .attributes import (HierarchicalAnnotation, SubPathAnnotation,
                          SubAnnotation as QuerySubAnnotation,
@@ -67,8 +68,8 @@ def hydrate_model(r, to_find, to_find_type, to_preload, to_preload_acoustics, co
 
 
 class QueryResults(BaseQueryResults):
-    def __init__(self, query):
-        super(QueryResults, self).__init__(query)
+    def __init__(self, query, max_cache=None, stream=False):
+        super(QueryResults, self).__init__(query, max_cache=max_cache, stream=stream)
         self.speaker_discourse_channels = {}
         self.num_tracks = 0
         self.track_columns = set()
@@ -79,21 +80,65 @@ class QueryResults(BaseQueryResults):
                     self.num_tracks += 1
                     self.track_columns.update(x.output_columns)
                 self.columns.extend(x.output_columns)
+                self.column_types.update((k, float) for k in x.output_columns)
         if query._columns and self._acoustic_columns:
             statement = '''MATCH (s:Speaker:{corpus_name})-[r:speaks_in]->(d:Discourse:{corpus_name})
             RETURN s.name as speaker, d.name as discourse, r.channel as channel'''.format(corpus_name=self.corpus.cypher_safe_name)
             results = self.corpus.execute_cypher(statement)
             for r in results:
                 self.speaker_discourse_channels[r['speaker'], r['discourse']] = r['channel']
+            if self.corpus.config.acoustic_batch_size:
+                self.cursors = [self._prefetch_cursor(c) for c in self.cursors]
         if self.models:
             self._preload_acoustics = query._preload_acoustics
 
+    def _prefetch_cursor(self, cursor):
+        batch_size = self.corpus.config.acoustic_batch_size
+        try:
+            while True:
+                batch = list(islice(cursor, batch_size))
+                if not batch:
+                    break
+                self._prefetch_acoustics(batch)
+                for r in batch:
+                    yield r
+        finally:
+            for a in self._acoustic_columns:
+                attribute = a.attribute if a.attribute is not None else a
+                attribute.clear_prefetched()
+
+    def _prefetch_acoustics(self, batch):
+        fetched = {}
+        for a in self._acoustic_columns:
+            attribute = a.attribute if a.attribute is not None else a
+            key = attribute.node.alias, attribute.label
+            if key in fetched:
+                attribute.prefetched = fetched[key]
+                continue
+            attribute.clear_prefetched()
+            ranges = defaultdict(list)
+            for r in batch:
+                if r[a.begin_alias] is None:
+                    continue
+                discourse = r[a.discourse_alias]
+                channel = self.speaker_discourse_channels[r[a.speaker_alias], discourse]
+                ranges[discourse, channel].append((r[a.begin_alias], r[a.end_alias]))
+            for (discourse, channel), v in ranges.items():
+                attribute.prefetch(self.corpus, discourse, v, channel)
+            fetched[key] = attribute.prefetched
 
     def _sanitize_record(self, r):
         if self.models:
             r = hydrate_model(r, self._to_find, self._to_find_type, self._preload, self._preload_acoustics, self.corpus)
+        elif not self._acoustic_columns:
+            if self.record_index is None:
+                self.record_index = column_index(r.keys())
+            r = AnnotationRecord(tuple(r), self.record_index)
         else:
-            r = AnnotationRecord(r)
+            if self.record_index is None:
+                acoustic_columns = [k for a in self._acoustic_columns for k in a.output_columns]
+                self.record_index = column_index(r.keys() + acoustic_columns)
+            r = AnnotationRecord(list(r) + [None] * (len(self.record_index) - len(r)), self.record_index)
             cache = {}
             for a in self._acoustic_columns:
                 if a.attribute is not None and a.attribute.label in cache:
@@ -143,32 +188,47 @@ class QueryResults(BaseQueryResults):
             raise (GraphQueryError('Only one track attribute can currently be exported to csv.'))
         super(QueryResults, self).to_csv(path, mode=mode)
 
+    def to_arrow(self, batch_size=10000, column_types=None):
+        if self.num_tracks > 1:
+            raise (GraphQueryError('Only one track attribute can currently be exported to Arrow.'))
+        return super(QueryResults, self).to_arrow(batch_size=batch_size, column_types=column_types)
+
+    def to_parquet(self, path, batch_size=10000, column_types=None):
+        if self.num_tracks > 1:
+            raise (GraphQueryError('Only one track attribute can currently be exported to Parquet.'))
+        super(QueryResults, self).to_parquet(path, batch_size=batch_size, column_types=column_types)
+
 
 class AnnotationRecord(BaseRecord):
-    def __init__(self, result):
-        self.columns = result.keys()
-        self.values = result.values()
-        self.acoustic_columns = []
-        self.acoustic_values = []
-        self.track = Track()
-        self.track_columns = []
-
-    def __getitem__(self, key):
-        if key in self.columns:
-            return self.values[self.columns.index(key)]
-        elif key in self.acoustic_columns:
-            return self.acoustic_values[self.acoustic_columns.index(key)]
-        raise KeyError('{} not in columns {} or {}'.format(key, self.columns, self.acoustic_columns))
+    """
+    Row of query results for annotations, with any acoustic measurements and track
+
+    Values of acoustic columns are stored after the values returned by the graph database, so the values are a list
+    rather than a tuple when the query has acoustic columns.
+    """
+    __slots__ = ('_track',)
+
+    def __init__(self, values, index):
+        super(AnnotationRecord, self).__init__(values, index)
+        self._track = None
+
+    @property
+    def track(self):
+        if self._track is None:
+            self._track = Track()
+        return self._track
+
+    @property
+    def track_columns(self):
+        if self._track is None:
+            return []
+        return self._track.keys()
 
     def add_acoustic(self, key, value):
-        self.acoustic_columns.append(key)
-        self.acoustic_values.append(value)
+        try:
+            self.values[self.index[key]] = value
+        except KeyError:
+            raise KeyError('{} not in columns {}'.format(key, self.columns))
 
     def add_track(self, track):
-
-        for point in track:
-            if point.time not in self.track:
-                self.track.add(point)
-            else:
-                self.track[point.time].update(point)
-        self.track_columns = self.track.keys()
+        self.track.update(track)
@@ -9,6 +9,7 @@ class ClauseElement(object):
     """
     sign = ''
     template = "{} {} {}"
+    parameter_value = True
 
     def __init__(self, attribute, value):
         self.attribute = attribute
@@ -185,6 +186,7 @@ class RegexClauseElement(ClauseElement):
 
 class SubsetClauseElement(ClauseElement):
     template = "{}:{}"
+    parameter_value = False
 
     def for_cypher(self):
         """
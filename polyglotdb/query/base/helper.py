@@ -3,6 +3,8 @@ import re
 
 non_letter_finder = re.compile('\W')
 
+primitive_types = {type(None), str, int, float, bool}
+
 
 def value_for_cypher(value):
     """
@@ -44,3 +46,40 @@ def key_for_cypher(key):
     if non_letter_finder.search(key) is not None:
         return "`{}`".format(key)
     return key
+
+
+def structure_key(obj):
+    """
+    Generate a hashable key for the structure of a query element, leaving out the values of clauses that are
+    bound as parameters
+
+    Parameters
+    ----------
+    obj : object
+        Query element, or a list, dictionary or primitive value contained in one
+
+    Returns
+    -------
+    object
+        Hashable key that is equal for elements that generate the same Cypher
+    """
+    if type(obj) in primitive_types or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, (list, tuple)):
+        return tuple(structure_key(x) for x in obj)
+    if isinstance(obj, (set, frozenset)):
+        return frozenset(structure_key(x) for x in obj)
+    if isinstance(obj, dict):
+        return tuple(sorted(((str(k), structure_key(v)) for k, v in obj.items()), key=lambda x: x[0]))
+    if isinstance(obj, type):
+        return obj.__name__
+    if not type(obj).__module__.startswith('polyglotdb.query'):
+        # The hierarchy and corpus are part of the query's key, so objects outside of queries are only told apart
+        return type(obj).__name__, id(obj)
+    parameter_value = getattr(type(obj), 'parameter_value', False)
+    items = []
+    for k, v in sorted(vars(obj).items()):
+        if k == 'value' and parameter_value and not hasattr(type(v), 'for_filter'):
+            v = None
+        items.append((k, structure_key(v)))
+    return (type(obj).__name__, tuple(items))
@@ -1,7 +1,17 @@
+import json
+import threading
+from collections import OrderedDict
+
 from .results import BaseQueryResults
 
 from .func import Count
-from ..base.helper import key_for_cypher, value_for_cypher
+from ..base.helper import key_for_cypher, structure_key
+
+CYPHER_TEMPLATE_CACHE_SIZE = 1000
+
+cypher_templates = OrderedDict()
+
+cypher_templates_lock = threading.Lock()
 
 
 class BaseQuery(object):
@@ -23,6 +33,8 @@ class BaseQuery(object):
 
     set_property_template = '''{alias}.{attribute} = {value}'''
 
+    unstructured_attributes = ['corpus', 'call_back', 'stop_check', '_set_properties', '_limit', '_offset']
+
     def __init__(self, corpus, to_find):
         self.corpus = corpus
         self.to_find = to_find
@@ -130,8 +142,10 @@ class BaseQuery(object):
         """
         Same as ``all``, but the results of the query are output to the
         specified path as a CSV file.
+
+        Results are streamed from the graph database and written as they are read, without being kept.
         """
-        results = self.all()
+        results = self.all(max_cache=0, stream=True)
         if self.stop_check is not None and self.stop_check():
             return
         results.to_csv(path)
@@ -177,9 +191,45 @@ class BaseQuery(object):
                 'columns': [x.for_json() for x in self._columns]}
         return data
 
+    def fingerprint(self):
+        """
+        Generate a key for the structure of the query, which is shared by queries that only differ in the values
+        that are bound as parameters, such as filter values and speaker or discourse names
+
+        Returns
+        -------
+        tuple
+            Hashable key of the query
+        """
+        structure = {k: v for k, v in vars(self).items() if k not in self.unstructured_attributes}
+        structure['_set_properties'] = sorted((k, v is None) for k, v in self._set_properties.items())
+        structure['_limit'] = self._limit is None
+        structure['_offset'] = self._offset is None
+        hierarchy = json.dumps(self.corpus.hierarchy.to_json(), sort_keys=True)
+        return type(self).__name__, self.corpus.corpus_name, hierarchy, structure_key(structure)
+
     def cypher(self):
         """
         Generates a Cypher statement based on the query.
+
+        Statements are cached by the query's fingerprint, so queries with the same structure reuse the same
+        parameterized statement rather than generating it again.
+        """
+        key = self.fingerprint()
+        with cypher_templates_lock:
+            if key in cypher_templates:
+                cypher_templates.move_to_end(key)
+                return cypher_templates[key]
+        cypher = self.generate_cypher()
+        with cypher_templates_lock:
+            cypher_templates[key] = cypher
+            if len(cypher_templates) > CYPHER_TEMPLATE_CACHE_SIZE:
+                cypher_templates.popitem(last=False)
+        return cypher
+
+    def generate_cypher(self):
+        """
+        Generates a Cypher statement based on the query, without looking it up in the cache of statements.
         """
         kwargs = {'match': '',
                   'optional_match': '',
@@ -198,7 +248,7 @@ class BaseQuery(object):
             match_strings.add(node.for_match())
             withs.update(node.withs)
 
-        kwargs['match'] = 'MATCH ' + ',\n'.join(match_strings)
+        kwargs['match'] = 'MATCH ' + ',\n'.join(sorted(match_strings))
 
         # generate main filters
 
@@ -225,7 +275,7 @@ class BaseQuery(object):
 
         # generate subqueries
 
-        with_statements = ['WITH ' + ', '.join(withs)]
+        with_statements = ['WITH ' + ', '.join(sorted(withs))]
 
         for node in nodes:
             if not node.has_subquery:
@@ -252,11 +302,13 @@ class BaseQuery(object):
     def create_subset(self, label):
         self._set_labels.append(label)
         self.corpus.execute_cypher(self.cypher(), **self.cypher_params())
+        self.corpus.clear_segment_cache()
         self._set_labels = []
 
     def remove_subset(self, label):
         self._remove_labels.append(label)
         self.corpus.execute_cypher(self.cypher(), **self.cypher_params())
+        self.corpus.clear_segment_cache()
         self._remove_labels = []
 
     def delete(self):
@@ -266,15 +318,17 @@ class BaseQuery(object):
         """
         self._delete = True
         self.corpus.execute_cypher(self.cypher(), **self.cypher_params())
+        self.corpus.clear_segment_cache()
 
     def set_properties(self, **kwargs):
         self._set_properties = {k: v for k,v in kwargs.items()}
         self.corpus.execute_cypher(self.cypher(), **self.cypher_params())
+        self.corpus.clear_segment_cache()
 
         self._set_properties = {}
 
-    def all(self):
-        return BaseQueryResults(self)
+    def all(self, max_cache=None, stream=False):
+        return BaseQueryResults(self, max_cache=max_cache, stream=stream)
 
     def get(self):
         r = BaseQueryResults(self)
@@ -295,6 +349,13 @@ class BaseQuery(object):
                         params[c.cypher_value_string()[1:-1].replace('`', '')] = c.value
                 except AttributeError:
                     pass
+        for k, v in self._set_properties.items():
+            if v is not None:
+                params['set_property_' + k] = v
+        if self._limit is not None:
+            params['query_limit'] = self._limit
+        if self._offset is not None:
+            params['query_offset'] = self._offset
         return params
 
     def generate_return(self):
@@ -365,7 +426,7 @@ class BaseQuery(object):
             if v is None:
                 v = 'NULL'
             else:
-                v = value_for_cypher(v)
+                v = '{`set_property_%s`}' % k
             s = self.set_property_template.format(alias=self.to_find.alias, attribute=k, value=v)
             set_strings.append(s)
         return 'SET ' + ', '.join(set_strings)
@@ -410,12 +471,12 @@ class BaseQuery(object):
 
     def _generate_limit(self):
         if self._limit is not None:
-            return '\nLIMIT {}'.format(self._limit)
+            return '\nLIMIT {query_limit}'
         return ''
 
     def _generate_offset(self):
         if self._offset is not None:
-            return '\nSKIP {}'.format(self._offset)
+            return '\nSKIP {query_offset}'
         return ''
 
     def _generate_order_by(self):
@@ -1,37 +1,204 @@
+from .attributes import CollectionAttribute
+from .func import AggregateFunction, Count, Average, Stdev
+
+
+def column_index(columns):
+    """
+    Map column names to their positions in the values of records
+
+    Parameters
+    ----------
+    columns : list
+        Column names
+
+    Returns
+    -------
+    dict
+        Position of each column
+    """
+    return {k: i for i, k in enumerate(columns)}
+
+
+def property_type(hierarchy, node_type, label):
+    """
+    Look up the type of a property of a node type in the hierarchy
+
+    Parameters
+    ----------
+    hierarchy : :class:`~polyglotdb.structure.Hierarchy`
+        Hierarchy of the corpus
+    node_type : str
+        Annotation type, or 'Speaker' or 'Discourse'
+    label : str
+        Name of the property
+
+    Returns
+    -------
+    type or None
+        Type of the property's values, or None if it is not known
+    """
+    if label in ('begin', 'end', 'duration'):
+        return float
+    if hierarchy is None:
+        return None
+    if node_type == 'Speaker':
+        properties = hierarchy.speaker_properties
+    elif node_type == 'Discourse':
+        properties = hierarchy.discourse_properties
+    else:
+        properties = set(hierarchy.token_properties.get(node_type, set())) | \
+                     set(hierarchy.type_properties.get(node_type, set()))
+    for name, t in properties:
+        if name == label:
+            return t
+    return None
+
+
+def collection_type(attribute):
+    """
+    Get the type of the values of a column of a collection, such as the phones of a word
+
+    Parameters
+    ----------
+    attribute : :class:`~polyglotdb.query.base.attributes.CollectionAttribute`
+        Attribute of the column
+
+    Returns
+    -------
+    type, tuple or None
+        Type of the column's values, a tuple of list and the type of the list's elements, or None if it is
+        not known
+    """
+    from ..annotations.attributes.path import PathAttribute
+    from ..annotations.attributes.pause import PausePathAttribute
+    label = attribute.label
+    if isinstance(attribute, PausePathAttribute) and label == 'duration':
+        return float
+    if isinstance(attribute, PathAttribute):
+        if label in ('count', 'position'):
+            return int
+        if label == 'rate':
+            return float
+    if label == 'channel':
+        return list, int
+    element_type = property_type(attribute.node.hierarchy, attribute.node.collected_node.node_type, label)
+    if element_type is None:
+        return None
+    return list, element_type
+
+
+def column_type(attribute):
+    """
+    Look up the type of the values of a column in the hierarchy, or from the aggregate function of the column
+
+    Parameters
+    ----------
+    attribute : :class:`~polyglotdb.query.base.attributes.NodeAttribute`
+        Attribute of the column
+
+    Returns
+    -------
+    type, tuple or None
+        Type of the column's values, a tuple of list and the type of the list's elements for collections,
+        or None if it is not known
+    """
+    from ..annotations.attributes.aggregate import AggregateAttribute
+    if isinstance(attribute, AggregateAttribute):
+        attribute = attribute.aggregate
+    if isinstance(attribute, AggregateFunction):
+        if isinstance(attribute, Count):
+            return int
+        if isinstance(attribute, (Average, Stdev)):
+            return float
+        if attribute.attribute is None:
+            return None
+        return column_type(attribute.attribute)
+    if isinstance(attribute, CollectionAttribute):
+        return collection_type(attribute)
+    label = getattr(attribute, 'label', None)
+    try:
+        node_type = attribute.node.node_type
+        hierarchy = attribute.node.hierarchy
+    except AttributeError:
+        node_type, hierarchy = None, None
+    return property_type(hierarchy, node_type, label)
+
+
 class BaseRecord(object):
-    def __init__(self, result):
-        self.columns = result.keys()
-        self.values = result.values()
+    """
+    Row of query results, storing its values in a tuple and sharing the positions of columns with the other
+    records of its results
+
+    Parameters
+    ----------
+    values : tuple
+        Values of the row
+    index : dict
+        Position of each column in the values
+    """
+    __slots__ = ('values', 'index')
+
+    def __init__(self, values, index):
+        self.values = values
+        self.index = index
+
+    @property
+    def columns(self):
+        return list(self.index)
 
     def __getitem__(self, key):
-        if key in self.columns:
-            return self.values[self.columns.index(key)]
-        raise KeyError('{} not in columns {}'.format(key, self.columns))
+        try:
+            return self.values[self.index[key]]
+        except KeyError:
+            raise KeyError('{} not in columns {}'.format(key, self.columns))
 
     def __str__(self):
         return ', '.join('{}: {}'.format(k, v) for k, v in zip(self.columns, self.values))
 
 class BaseQueryResults(object):
-    def __init__(self, query):
+    """
+    Results of a query, read from the graph database as they are needed
+
+    Parameters
+    ----------
+    query : :class:`~polyglotdb.query.base.BaseQuery`
+        Query to get the results of
+    max_cache : int
+        Maximum number of results to keep for indexing and iterating again, defaults to None (all results are
+        kept); results read beyond the maximum are only available once, and the number of results is only
+        available with ``len`` once they have all been read
+    stream : bool
+        Keep the session of the query open so that results are fetched as they are read, rather than all
+        being buffered by the driver, defaults to False
+    """
+    def __init__(self, query, max_cache=None, stream=False):
         self.corpus = query.corpus
         self.call_back = query.call_back
         self.stop_check = query.stop_check
-        self.cursors = [self.corpus.execute_cypher(query.cypher(), **query.cypher_params()).records()]
+        if stream:
+            self.cursors = [self.corpus.stream_cypher(query.cypher(), **query.cypher_params())]
+        else:
+            self.cursors = [self.corpus.execute_cypher(query.cypher(), **query.cypher_params()).records()]
+        self.max_cache = max_cache
         self.cache = []
         self.evaluated = []
+        self.num_read = 0
         self.current_ind = 0
+        self.record_index = None
         if query._columns:
             self.models = False
             self._preload = None
             self._to_find = None
             self._to_find_type = None
             self.columns = [x.output_alias.replace('`', '') for x in query._columns]
+            self.column_types = {c: column_type(x) for c, x in zip(self.columns, query._columns)}
         else:
             self.models = True
             self._preload = query._preload
             self._to_find = query.to_find.alias
             self._to_find_type = query.to_find.type_alias
             self.columns = None
+            self.column_types = {}
 
     def __str__(self):
         return '\n'.join(str(x) for x in self)
@@ -42,30 +209,37 @@ class BaseQueryResults(object):
         cur_cache_len = len(self.cache)
         if key < cur_cache_len:
             return self.cache[key]
+        if self.max_cache is not None and key >= self.max_cache:
+            raise (IndexError('Only the first {} results are kept.'.format(self.max_cache)))
         self._cache_cursor(up_to=key)
         cur_cache_len = len(self.cache)
         if key < cur_cache_len:
             return self.cache[key]
         raise (IndexError(key))
 
-    def _cache_cursor(self, up_to=None):
+    def _read_cursors(self, check_stop=False):
         for i, c in enumerate(self.cursors):
             if i in self.evaluated:
                 continue
-            while True:
-                try:
-                    r = next(c)
-                except StopIteration:
-                    r = None
-                if r is None:
-                    self.evaluated.append(i)
-                    break
-                r = self._sanitize_record(r)
-                self.cache.append(r)
-                if up_to is not None and len(self.cache) > up_to:
-                    break
+            if check_stop and self.stop_check is not None and self.stop_check():
+                break
+            for r in c:
+                self.num_read += 1
+                yield self._sanitize_record(r)
+            self.evaluated.append(i)
+
+    def _cache_full(self):
+        return self.max_cache is not None and len(self.cache) >= self.max_cache
+
+    def _cache_cursor(self, up_to=None):
+        if self._cache_full():
+            return
+        for r in self._read_cursors():
+            self.cache.append(r)
             if up_to is not None and len(self.cache) > up_to:
                 break
+            if self._cache_full():
+                break
 
     def add_results(self, query):
         ## Add some validation
@@ -93,20 +267,10 @@ class BaseQueryResults(object):
     def __iter__(self):
         for r in self.cache:
             yield r
-        for i, c in enumerate(self.cursors):
-            if self.stop_check is not None and self.stop_check():
-                break
-            while True:
-                try:
-                    r = next(c)
-                except StopIteration:
-                    r = None
-                if r is None:
-                    self.evaluated.append(i)
-                    break
-                r = self._sanitize_record(r)
+        for r in self._read_cursors(check_stop=True):
+            if not self._cache_full():
                 self.cache.append(r)
-                yield r
+            yield r
 
     def rows_for_csv(self):
         header = self.columns
@@ -117,6 +281,57 @@ class BaseQueryResults(object):
         from ...io import save_results
         save_results(self.rows_for_csv(), path, header=self.columns, mode=mode)
 
+    def _export_types(self, column_types):
+        types = dict(self.column_types)
+        if column_types is not None:
+            types.update(column_types)
+        return types
+
+    def to_arrow(self, batch_size=10000, column_types=None):
+        """
+        Convert the results to an Arrow table, built from record batches with a typed column for each column of
+        the results, and strings dictionary encoded
+
+        Requires the ``pyarrow`` package.
+
+        Parameters
+        ----------
+        batch_size : int
+            Number of rows per record batch, defaults to 10000
+        column_types : dict
+            Column names mapped to types (float, int, bool, str or list) to use instead of the types of their
+            properties in the hierarchy, or of their values
+
+        Returns
+        -------
+        :class:`pyarrow.Table`
+            Table of the results
+        """
+        from ...io import results_to_table
+        return results_to_table(self.rows_for_csv(), self.columns, self._export_types(column_types),
+                                batch_size=batch_size)
+
+    def to_parquet(self, path, batch_size=10000, column_types=None):
+        """
+        Write the results to a Parquet file, one record batch at a time, with the same columns as ``to_csv``
+
+        Requires the ``pyarrow`` package.  Results are only kept as allowed by ``max_cache``, so results from
+        ``query.all(max_cache=0, stream=True)`` are written without being kept in memory.
+
+        Parameters
+        ----------
+        path : str
+            Path of the Parquet file
+        batch_size : int
+            Number of rows per record batch, defaults to 10000
+        column_types : dict
+            Column names mapped to types (float, int, bool, str or list) to use instead of the types of their
+            properties in the hierarchy, or of their values
+        """
+        from ...io import save_parquet
+        save_parquet(self.rows_for_csv(), path, self.columns, self._export_types(column_types),
+                     batch_size=batch_size)
+
     def to_json(self):
         for line in self:
             baseline = {k: line[k] for k in self.columns}
@@ -124,11 +339,19 @@ class BaseQueryResults(object):
 
     def __len__(self):
         self._cache_cursor()
-        return len(self.cache)
+        if self.max_cache is None:
+            for _ in self._read_cursors():
+                pass
+        elif len(self.evaluated) < len(self.cursors):
+            raise (TypeError('The number of results is not known before they are read, as only the first {} '
+                             'results are kept.'.format(self.max_cache)))
+        return self.num_read
 
     def _sanitize_record(self, r):
         if self.models:
             raise NotImplementedError
         else:
-            r = BaseRecord(r)
+            if self.record_index is None:
+                self.record_index = column_index(r.keys())
+            r = BaseRecord(tuple(r), self.record_index)
         return r
@@ -418,6 +418,27 @@ class Hierarchy(object):
     def __contains__(self, item):
         return item in self._data
 
+    def merge(self, other):
+        '''
+        Merge another Hierarchy into this one, keeping all annotation types and
+        properties already in this one, for adding data to an existing corpus
+
+        Parameters
+        ----------
+        other : Hierarchy
+            Hierarchy to be merged in
+        '''
+        for k, v in other._data.items():
+            if k not in self._data:
+                self._data[k] = v
+        for attribute in ['subannotations', 'subannotation_properties', 'token_properties', 'type_properties']:
+            current = getattr(self, attribute)
+            for k, v in getattr(other, attribute).items():
+                if k not in current:
+                    current[k] = set(v)
+                else:
+                    current[k].update(v)
+
     def update(self, other):
         '''
         Merge Hierarchies together.  If other is a dictionary, then only
@@ -81,5 +81,6 @@ if __name__ == '__main__':
           cmdclass={'test': PyTest},
           extras_require={
               'testing': ['pytest'],
+              'arrow': ['pyarrow'],
           }
           )
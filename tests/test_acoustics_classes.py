@@ -0,0 +1,90 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from polyglotdb.acoustics.classes import Track, TimePoint
+
+
+def make_track(data):
+    track = Track()
+    for t, v in data.items():
+        p = TimePoint(t)
+        for k, x in v.items():
+            p.add_value(k, x)
+        track.add(p)
+    return track
+
+
+def test_track_dict_api():
+    track = make_track({Decimal('4.25'): {'F0': 99},
+                        Decimal('4.23'): {'F0': 98},
+                        Decimal('4.24'): {'F0': None}})
+    assert len(track) == 3
+    assert track.keys() == ['F0']
+    assert [p.time for p in track] == [Decimal('4.23'), Decimal('4.24'), Decimal('4.25')]
+    assert Decimal('4.24') in track
+    assert Decimal('4.26') not in track
+    assert track[Decimal('4.26')] is None
+    assert track[Decimal('4.23')]['F0'] == 98
+    assert track[Decimal('4.24')]['F0'] is None
+    assert 'F0' not in track[Decimal('4.24')]
+    assert track[Decimal('4.25')].values == {'F0': 99}
+
+    for p in track:
+        p['F0'] = 100
+    assert np.all(track.column('F0') == 100)
+
+
+def test_track_slice_update():
+    track = make_track({x / 100: {'F0': x} for x in range(100)})
+    sliced = track.slice(0.1, 0.2)
+    assert len(sliced) == 11
+    assert sliced.times[0] == 0.1
+    assert sliced.times[-1] == 0.2
+
+    other = make_track({0.2: {'Intensity': 50}, 1.5: {'Intensity': 60}})
+    sliced.update(other)
+    assert sliced.keys() == ['F0', 'Intensity']
+    assert len(sliced) == 12
+    assert sliced[0.2].values == {'F0': 20, 'Intensity': 50}
+    assert sliced[1.5]['F0'] is None
+    assert sliced.to_numpy().shape == (12, 3)
+
+
+def test_interval_lookup():
+    from polyglotdb.acoustics.utils import IntervalLookup
+    phones = [('b', 0.1, 0.2), ('a', 0.0, 0.1), ('c', 0.2, 0.35)]
+    lookup = IntervalLookup(phones, [x[1] for x in phones])
+    assert lookup.find(-0.01) is None
+    assert lookup.find(0.0)[0] == 'a'
+    assert lookup.find(0.15)[0] == 'b'
+    assert lookup.find(0.2)[0] == 'c'
+    assert lookup.find(0.5)[0] == 'c'
+    assert [x[0] if x else None for x in lookup.find_all([-1, 0.05, 0.1, 0.3])] == [None, 'a', 'b', 'c']
+
+
+def test_grouped_statistic():
+    from polyglotdb.acoustics.utils import grouped_statistic
+    values = np.array([1.0, 2.0, np.nan, 4.0, 10.0, np.nan])
+    groups = np.array(['a', 'a', 'a', 'a', 'b', 'c'], dtype=object)
+    assert grouped_statistic(values, groups, 'mean') == {'a': 7 / 3, 'b': 10.0, 'c': None}
+    assert grouped_statistic(values, groups, 'count') == {'a': 3, 'b': 1, 'c': None}
+    assert grouped_statistic(values, groups, 'stddev')['b'] is None
+
+
+def test_grouped_summary():
+    from polyglotdb.acoustics.utils import grouped_statistic, GroupedSummary, GROUPED_STATISTICS
+    values = np.array([1.0, 2.0, np.nan, 4.0, 10.0, np.nan, 3.0, 5.5, np.nan])
+    groups = np.array(['a', 'a', 'a', 'a', 'b', 'c', 'b', 'a', 'd'], dtype=object)
+    summary = GroupedSummary(keep_values=True)
+    for chunk in [slice(0, 2), slice(2, 6), slice(6, 9)]:
+        summary.add(values[chunk], groups[chunk])
+    for statistic in GROUPED_STATISTICS:
+        expected = grouped_statistic(values, groups, statistic)
+        calculated = summary.statistic(statistic)
+        assert sorted(calculated) == sorted(expected)
+        for k, v in expected.items():
+            assert calculated[k] == pytest.approx(v)
+    with pytest.raises(ValueError):
+        GroupedSummary().statistic('median')
@@ -0,0 +1,64 @@
+from polyglotdb.acoustics.io import AcousticWriter
+
+
+class RecordingClient(object):
+    def __init__(self):
+        self.writes = []
+
+    def write_points(self, points, time_precision=None, protocol='json'):
+        self.writes.append((list(points), time_precision, protocol))
+
+
+def test_acoustic_writer_batches():
+    client = RecordingClient()
+    with AcousticWriter(client, batch_size=2, time_precision='ms') as writer:
+        for i in range(5):
+            writer.add('pitch', {'speaker': 'a', 'discourse': 'b', 'channel': 0}, 1000 + i,
+                       {'phone': 'aa', 'F0': 100.0 + i})
+    assert [len(x[0]) for x in client.writes] == [2, 2, 1]
+    assert writer.points_written == 5
+    assert client.writes[0][0][0]['fields']['F0'] == 100.0
+
+
+def test_acoustic_writer_line_protocol():
+    client = RecordingClient()
+    writer = AcousticWriter(client, batch_size=10, time_precision='ms', protocol='line')
+    writer.add('pitch', {'speaker': 'a b', 'discourse': 'b', 'channel': 0}, 1500, {'phone': 'aa', 'F0': 100.0})
+    writer.close()
+    assert client.writes == [(['pitch,channel=0,discourse=b,speaker=a\\ b F0=100.0,phone="aa" 1500'], 'ms', 'line')]
+
+
+def test_track_from_points():
+    from decimal import Decimal
+    from polyglotdb.corpus.audio import track_from_points, to_seconds
+    points = [{'time': 1500, 'F0': 100.0}, {'time': 1510, 'F0': None}, {'time': 86401520, 'F0': 102.0}]
+    track = track_from_points(points, ['F0'], Decimal('1.500'), Decimal('1.520'))
+    assert [x['time'] for x in track] == [to_seconds('1970-01-01T00:00:01.5Z'), Decimal('1.51'), Decimal('1.52')]
+    assert [x['F0'] for x in track] == [100.0, None, 102.0]
+    track = track_from_points(points, ['F0'], Decimal('1.500'), Decimal('1.520'), relative_time=True)
+    assert [float(x['time']) for x in track] == [0, 0.5, 1]
+
+
+def test_prefetched_relative_time():
+    from decimal import Decimal
+    from polyglotdb.corpus.audio import track_from_points, s_to_ms
+    from polyglotdb.query.annotations.attributes import AnnotationNode
+    from polyglotdb.query.annotations.attributes.acoustic import PitchAttribute
+
+    points = [{'time': t, 'F0': 100.0 + t % 7} for t in range(1000, 3000, 10)]
+
+    class PointsPitchAttribute(PitchAttribute):
+        def _get_track(self, corpus, discourse, begin, end, channel=0, num_points=0, relative_time=False):
+            begin = Decimal(begin).quantize(Decimal('0.001'))
+            end = Decimal(end).quantize(Decimal('0.001'))
+            in_range = [p for p in points if s_to_ms(begin) <= p['time'] <= s_to_ms(end)]
+            return track_from_points(in_range, ['F0'], begin, end, relative_time)
+
+    ranges = [(1.013, 1.127), (1.2, 1.3), (1.333, 1.377), (2.501, 2.999)]
+    attribute = PointsPitchAttribute(AnnotationNode('phone'))
+    attribute.relative_time = True
+    expected = [[(x.time, x['F0']) for x in attribute.hydrate(None, 'd', b, e)] for b, e in ranges]
+    attribute.cached_settings = None
+    attribute.prefetch(None, 'd', ranges)
+    prefetched = [[(x.time, x['F0']) for x in attribute.hydrate(None, 'd', b, e)] for b, e in ranges]
+    assert prefetched == expected
@@ -47,3 +47,20 @@ def test_analyze_script(acoustic_utt_config, praat_path, praatscript_test_dir):
         assert (len(results) > 0)
         for r in results:
             assert (r.values)
+
+
+def test_segment_cache(acoustic_utt_config):
+    from polyglotdb.acoustics.segments import generate_segments
+    with CorpusContext(acoustic_utt_config) as g:
+        segments = generate_segments(g, 'utterance', cache=True)
+        assert len(os.listdir(g.segment_cache_dir)) == 1
+        assert len(generate_segments(g, 'utterance', cache=True)) == len(segments)
+        g.encode_hierarchy()
+        assert not os.path.exists(g.segment_cache_dir)
+        generate_segments(g, 'utterance', cache=True)
+        generate_segments(g, 'utterance', file_type='consonant', cache=True)
+        assert len(os.listdir(g.segment_cache_dir)) == 2
+        g.query_graph(g.utterance).set_properties(segment_cache_test=True)
+        assert not os.path.exists(g.segment_cache_dir)
+        g.query_graph(g.utterance).set_properties(segment_cache_test=None)
+        g.clear_segment_cache()
@@ -184,6 +184,23 @@ def test_analyze_pitch_gendered_praat(acoustic_utt_config, praat_path):
         assert (g.has_pitch('acoustic_corpus'))
 
 
+@acoustic
+def test_analyze_pitch_speaker_adjusted_stopped(acoustic_utt_config, praat_path):
+    from polyglotdb.acoustics.pitch.base import analyze_pitch
+    checks = []
+
+    def stop_check():
+        checks.append(True)
+        return len(checks) > 1
+
+    with CorpusContext(acoustic_utt_config) as g:
+        g.reset_acoustics()
+        g.config.praat_path = praat_path
+        g.config.pitch_algorithm = 'speaker_adjusted'
+        analyze_pitch(g, source='praat', stop_check=stop_check)
+        assert (not g.has_pitch('acoustic_corpus'))
+
+
 def test_query_pitch(acoustic_utt_config):
     with CorpusContext(acoustic_utt_config) as g:
         g.reset_acoustics()
@@ -238,3 +255,30 @@ def test_export_pitch(acoustic_utt_config):
         assert (next(t) == {'label': 'ow', 'time': Decimal('4.25'), 'F0': 99})
         assert (next(t) == {'label': 'ow', 'time': Decimal('4.26'), 'F0': 95.8})
         assert (next(t) == {'label': 'ow', 'time': Decimal('4.27'), 'F0': 95.8})
+
+
+def test_batched_pitch_hydration(acoustic_utt_config):
+    with CorpusContext(acoustic_utt_config) as g:
+        q = g.query_graph(g.phone)
+        q = q.filter(g.phone.label == 'ow')
+        q = q.order_by(g.phone.begin.column_name('begin'))
+        q = q.columns(g.phone.label, g.phone.pitch.track, g.phone.pitch.mean)
+        g.config.acoustic_batch_size = 0
+        expected = [(r['Mean_F0'], [(x.time, x['F0']) for x in r.track]) for r in q.all()]
+        g.config.acoustic_batch_size = 2
+        results = [(r['Mean_F0'], [(x.time, x['F0']) for x in r.track]) for r in q.all()]
+        assert results == expected
+
+
+def test_batched_pitch_hydration_multiple_nodes(acoustic_utt_config):
+    with CorpusContext(acoustic_utt_config) as g:
+        q = g.query_graph(g.phone)
+        q = q.filter(g.phone.label == 'ow')
+        q = q.order_by(g.phone.begin.column_name('begin'))
+        q = q.columns(g.phone.label, g.phone.pitch.mean.column_name('phone_pitch'),
+                      g.phone.word.pitch.mean.column_name('word_pitch'))
+        g.config.acoustic_batch_size = 0
+        expected = [(r['phone_pitch'], r['word_pitch']) for r in q.all()]
+        g.config.acoustic_batch_size = 2
+        results = [(r['phone_pitch'], r['word_pitch']) for r in q.all()]
+        assert results == expected
@@ -0,0 +1,21 @@
+import numpy as np
+
+from polyglotdb.acoustics.relativize import phone_statistics
+from polyglotdb.acoustics.utils import GroupedSummary
+
+
+def test_phone_statistics():
+    values = np.array([[1.0, 1.0], [2.0, np.nan], [np.nan, 3.0], [4.0, 5.0], [10.0, 2.0], [7.0, np.nan]])
+    phones = np.array(['a', 'a', 'a', 'a', 'b', 'c'], dtype=object)
+    summaries = [GroupedSummary(), GroupedSummary()]
+    for chunk in [slice(0, 3), slice(3, 6)]:
+        for j, summary in enumerate(summaries):
+            summary.add(values[chunk, j], phones[chunk])
+    statistics = phone_statistics(summaries)
+    assert sorted(statistics) == ['a', 'b', 'c']
+    means, sds = statistics['a']
+    assert np.allclose(means, [7 / 3, 3])
+    assert np.allclose(sds, [np.std([1, 2, 4], ddof=1), np.std([1, 3, 5], ddof=1)])
+    means, sds = statistics['c']
+    assert means[0] == 7 and np.isnan(means[1])
+    assert np.isnan(sds).all()
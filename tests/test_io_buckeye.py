@@ -69,6 +69,30 @@ def test_load_words(buckeye_test_dir):
         assert (w == words[i])
 
 
+def test_misparsed_words(tmpdir):
+    from polyglotdb.exceptions import BuckeyeParseError
+    from polyglotdb.io.parsers.buckeye import iter_words
+    path = str(tmpdir.join('misparsed.words'))
+    with open(path, 'w') as f:
+        f.write('header\n#\n   2.609000 122 {B_TRANS}; B; B; null\n   2.714347 122 that\'s\n'
+                '   2.892096 122 that\'s; dh ae t s; eh s; DT_VBZ\n')
+    words = iter_words(path)
+    assert next(words)['spelling'] == '{B_TRANS}'
+    assert next(words)['begin'] == 2.609000
+    with pytest.raises(BuckeyeParseError):
+        next(words)
+
+
+def test_parse_discourse_buckeye(buckeye_test_dir):
+    word_path = os.path.join(buckeye_test_dir, 'test.words')
+    parser = inspect_buckeye(word_path)
+    data = parser.parse_discourse(word_path)
+    words = {a.id: a for a in data['word']}
+    phones = list(data['phone'])
+    assert [x.label for x in phones if x.label == 's'] == ['s', 's', 's']
+    assert all(words[x.super_id].begin <= x.midpoint <= words[x.super_id].end for x in phones)
+
+
 def test_load_discourse_buckeye(graph_db, buckeye_test_dir):
     with CorpusContext('discourse_buckeye', **graph_db) as c:
         c.reset()
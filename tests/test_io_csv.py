@@ -71,3 +71,165 @@ def test_to_csv(acoustic_utt_config, export_test_dir):
             i += 1
 
 
+def test_csv_writer_registry(tmpdir):
+    from polyglotdb.io.importer import CSVWriterRegistry
+    writers = CSVWriterRegistry(max_open=2)
+    paths = [os.path.join(str(tmpdir), '{}.csv'.format(i)) for i in range(3)]
+    for i in range(2):
+        for p in paths:
+            writers.writer(p, ['id', 'label']).writerow({'id': i, 'label': 'a'})
+    assert len(writers._files) == 2
+    writers.close()
+    for p in paths:
+        with open(p) as f:
+            assert f.read().splitlines() == ['0,a', '1,a']
+
+
+def test_bulk_import_csvs(buckeye_test_dir, tmpdir):
+    import csv
+    from types import SimpleNamespace
+    from polyglotdb.config import CorpusConfig
+    from polyglotdb.io import inspect_buckeye
+    from polyglotdb.io.importer import (TypeCSVWriter, initialize_graph_csvs, data_to_graph_csvs,
+                                        graph_csvs_to_bulk_csvs)
+    config = CorpusConfig('bulk_test', data_dir=str(tmpdir))
+    corpus_context = SimpleNamespace(config=config, corpus_name='bulk_test', csv_writers=None)
+    parser = inspect_buckeye(os.path.join(buckeye_test_dir, 'test.words'))
+    data = parser.parse_discourse(os.path.join(buckeye_test_dir, 'test.words'))
+    data.corpus_name = 'bulk_test'
+    type_writer = TypeCSVWriter(corpus_context)
+    type_writer.add(data)
+    type_writer.close()
+    initialize_graph_csvs(corpus_context, data, set())
+    data_to_graph_csvs(corpus_context, data)
+    speaks_in = [(s, data.name, 0) for s in data.speakers]
+    node_paths, relationship_paths = graph_csvs_to_bulk_csvs(corpus_context, data, type_writer.type_headers,
+                                                             speaks_in)
+
+    def read(name):
+        with open(os.path.join(config.temporary_directory('bulk'), name + '.csv'), newline='') as f:
+            return list(csv.reader(f))
+
+    num_phones = len(list(data['phone']))
+    phones = read('phone_nodes')
+    assert phones[0][:3] == ['id:ID(phone)', 'begin:float', 'end:float']
+    assert phones[0][-1] == ':LABEL'
+    assert len(phones) - 1 == num_phones
+    assert all(x[-1] == 'phone;bulk_test;speech' for x in phones[1:])
+    contained_by = read('phone_contained_by')
+    assert contained_by[0] == [':START_ID(phone)', ':END_ID(word)', ':TYPE']
+    assert len(contained_by) - 1 == num_phones
+    precedes = read('phone_precedes')
+    assert len(precedes) - 1 == num_phones - 1
+    assert read('speaks_in')[1] == [speaks_in[0][0], data.name, '0', 'speaks_in']
+    assert os.path.join(config.temporary_directory('bulk'), 'word_type_nodes.csv') in node_paths
+    assert os.path.join(config.temporary_directory('bulk'), 'word_is_a.csv') in relationship_paths
+
+
+def test_bulk_import_database(tmpdir):
+    from types import SimpleNamespace
+    from polyglotdb.config import CorpusConfig
+    from polyglotdb.exceptions import CorpusConfigError
+    from polyglotdb.io.importer import bulk_import_csvs
+    from polyglotdb.io.importer.from_csv import neo4j_settings
+    home = tmpdir.mkdir('neo4j')
+    admin_path = home.mkdir('bin').join('neo4j-admin')
+    admin_path.write('')
+    home.mkdir('conf').join('neo4j.conf').write('#dbms.active_database=graph.db\n'
+                                                'dbms.active_database=corpora.db\n'
+                                                'dbms.directories.data=store\n')
+    home.mkdir('store').mkdir('databases').mkdir('existing.db')
+    data_directory, active_database = neo4j_settings(str(admin_path))
+    assert data_directory == os.path.join(str(home), 'store')
+    assert active_database == 'corpora.db'
+
+    config = CorpusConfig('bulk_test', data_dir=str(tmpdir), neo4j_admin_path=str(admin_path))
+    corpus_context = SimpleNamespace(config=config, corpus_name='bulk_test', csv_writers=None)
+    for database in ['corpora.db', 'existing.db']:
+        with pytest.raises(CorpusConfigError):
+            bulk_import_csvs(corpus_context, None, {}, [], database)
+    assert os.path.exists(os.path.join(str(home), 'store', 'databases', 'existing.db'))
+
+
+def test_enrichment_rows():
+    from polyglotdb.io.importer.from_rows import convert_value, enrichment_rows, row_batches
+    assert convert_value('3.0', int) == 3
+    assert convert_value('abc', float) is None
+    assert convert_value('False', bool) is False
+    assert convert_value(1, str) == '1'
+    assert convert_value(None, float) is None
+    data = {'b': {'frequency': '2', 'pos': 'N'}, 'a': {'frequency': 1.5}}
+    rows = list(enrichment_rows(data, {'frequency': float, 'pos': str}, 'label'))
+    assert rows == [{'label': 'a', 'frequency': 1.5, 'pos': None},
+                    {'label': 'b', 'frequency': 2.0, 'pos': 'N'}]
+    rows = [{'label': 'x' * 10} for _ in range(10)]
+    assert [len(x) for x in row_batches(rows, max_bytes=50)] == [2] * 5
+    assert [len(x) for x in row_batches(rows, max_rows=4)] == [4, 4, 2]
+
+
+def test_index_manager():
+    from polyglotdb.io.importer import IndexManager
+
+    class Context(object):
+        corpus_name = 'test'
+
+        def __init__(self):
+            self.statements = []
+
+        def execute_cypher(self, statement, **parameters):
+            self.statements.append(statement)
+            if statement == 'CALL db.indexes()':
+                return [{'description': 'INDEX ON :phone(begin)', 'type': 'node_label_property'},
+                        {'description': 'INDEX ON :phone(id)', 'type': 'node_unique_property'}]
+            return []
+
+    context = Context()
+    manager = IndexManager(context)
+    manager.add_constraint('phone', 'id')
+    manager.add_index('phone', 'id')
+    manager.add_index('phone', 'begin')
+    manager.add_index('phone', 'end')
+    manager.add_index('phone', 'end')
+    manager.add_constraint('word', 'id')
+    manager.create()
+    assert context.statements[1:] == ['CREATE INDEX ON :phone(end)',
+                                      'CREATE CONSTRAINT ON (node:word) ASSERT node.id IS UNIQUE',
+                                      'CALL db.awaitIndexes(300)']
+    manager.add_index('phone', 'end')
+    assert manager.create() == 0
+    assert len(context.statements) == 4
+
+
+def test_import_manifest_entry(tmpdir):
+    from polyglotdb.corpus.importable import manifest_entry
+    path = os.path.join(str(tmpdir), 'test.TextGrid')
+    with open(path, 'w') as f:
+        f.write('first')
+    entry = manifest_entry(path)
+    entry['discourse'] = 'test'
+    assert manifest_entry(path, entry) == entry
+    with open(path, 'w') as f:
+        f.write('second')
+    changed = manifest_entry(path, entry)
+    assert changed['sha1'] != entry['sha1']
+    assert changed['discourse'] == 'test'
+
+
+def test_check_incremental_hierarchy():
+    from polyglotdb.structure import Hierarchy
+    from polyglotdb.exceptions import CorpusIntegrityError
+    from polyglotdb.corpus.importable import check_incremental_hierarchy
+    data_hierarchy = Hierarchy({'phone': 'word', 'word': None})
+    check_incremental_hierarchy(Hierarchy(), data_hierarchy)
+    check_incremental_hierarchy(Hierarchy({'phone': 'word', 'word': None}), data_hierarchy)
+    with_properties = Hierarchy({'phone': 'word', 'word': None})
+    with_properties.token_properties['word'] = {('label', str), ('speech_rate', float)}
+    with_properties.subset_tokens['word'] = {'pause'}
+    check_incremental_hierarchy(with_properties, data_hierarchy)
+    enriched = Hierarchy({'phone': 'syllable', 'syllable': 'word', 'word': 'utterance', 'utterance': None})
+    with pytest.raises(CorpusIntegrityError):
+        check_incremental_hierarchy(enriched, data_hierarchy)
+    with_subannotations = Hierarchy({'phone': 'word', 'word': None})
+    with_subannotations.subannotations['phone'] = {'burst'}
+    with pytest.raises(CorpusIntegrityError):
+        check_incremental_hierarchy(with_subannotations, data_hierarchy)
@@ -4,6 +4,7 @@ import os
 from polyglotdb.io import inspect_textgrid
 
 from polyglotdb.io.types.parsing import TobiTier, OrthographyTier
+from polyglotdb.io.textgrid import read_textgrid, IntervalTier, PointTier
 
 from polyglotdb import CorpusContext
 
@@ -17,6 +18,60 @@ def test_tobi(textgrid_test_dir):
     assert (isinstance(parser.annotation_types[1], OrthographyTier))
 
 
+def write_short_textgrid(path, tg, encoding):
+    lines = ['File type = "ooTextFile"', 'Object class = "TextGrid"', '', tg.min_time, tg.max_time, '<exists>',
+             len(tg.tiers)]
+    for ti in tg.tiers:
+        if isinstance(ti, IntervalTier):
+            lines.extend(['"IntervalTier"', '"{}"'.format(ti.name), ti.min_time, ti.max_time, len(ti)])
+            for label, begin, end in zip(ti.labels, ti.begins, ti.ends):
+                lines.extend([begin, end, '"{}"'.format(label.replace('"', '""'))])
+        else:
+            lines.extend(['"TextTier"', '"{}"'.format(ti.name), ti.min_time, ti.max_time, len(ti)])
+            for label, time in zip(ti.labels, ti.times):
+                lines.extend([time, '"{}"'.format(label.replace('"', '""'))])
+    with open(path, 'w', encoding=encoding) as f:
+        f.write('\n'.join(map(str, lines)) + '\n')
+
+
+def test_read_textgrid(textgrid_test_dir, tmpdir):
+    tg = read_textgrid(os.path.join(textgrid_test_dir, 'tobi.TextGrid'))
+    assert tg.min_time == 0
+    assert tg.max_time == 2.13510
+    assert [x.name for x in tg.tiers] == ['tones', 'words', 'breaks', 'misc']
+    assert isinstance(tg.tiers[0], PointTier)
+    assert list(tg.tiers[0].annotations())[0] == ('L+H*', 0.37624)
+    assert isinstance(tg.tiers[1], IntervalTier)
+    assert list(tg.tiers[1].annotations())[0] == ('Armani', 0, 0.68447)
+
+    tg.tiers[1].labels[0] = 'say "Armani"\nagain'
+    for encoding in ['utf8', 'utf-16']:
+        path = str(tmpdir.join('short_{}.TextGrid'.format(encoding)))
+        write_short_textgrid(path, tg, encoding)
+        short = read_textgrid(path)
+        for a, b in zip(tg.tiers, short.tiers):
+            assert a.name == b.name
+            assert list(a.annotations()) == list(b.annotations())
+
+
+def test_read_textgrid_overlap(tmpdir):
+    path = str(tmpdir.join('overlap.TextGrid'))
+    with open(path, 'w') as f:
+        f.write('File type = "ooTextFile"\nObject class = "TextGrid"\n\n0\n1\n<exists>\n1\n'
+                '"IntervalTier"\n"words"\n0\n1\n2\n0\n0.6\n"a"\n0.5\n1\n"b"\n')
+    with pytest.raises(TextGridError):
+        read_textgrid(path)
+
+
+def test_textgrid_value_patterns():
+    from polyglotdb.io.textgrid import LONG_VALUE_PATTERN, SHORT_VALUE_PATTERN
+    assert LONG_VALUE_PATTERN.findall('text = "say ""hi"""') == ['"say ""hi"""']
+    assert SHORT_VALUE_PATTERN.findall('"a ""b""" 1.5') == ['"a ""b"""', '1.5']
+    unterminated = '"' + 'a' * 10000
+    assert LONG_VALUE_PATTERN.findall('= ' + unterminated) == [unterminated]
+    assert SHORT_VALUE_PATTERN.findall(unterminated) == ['a' * 10000]
+
+
 @pytest.mark.xfail
 def test_guess_tiers(textgrid_test_dir):
     tg = load_textgrid(os.path.join(textgrid_test_dir, 'phone_word.TextGrid'))
@@ -52,3 +52,30 @@ def test_compile_digraphs():
 
     digraph_at.digraphs = set(['aa', 'aab'])
     assert (digraph_at.digraph_pattern == re.compile('aab|aa|\d+|\S'))
+
+
+def test_annotation_type_lookup():
+    from polyglotdb.io.types.standardized import PGAnnotation, PGAnnotationType
+    at = PGAnnotationType('phone')
+    for label, begin, end, speaker in [('b', 0.1, 0.2, 'A'), ('a', 0.0, 0.1, 'A'), ('c', 0.2, 0.35, 'A'),
+                                       ('d', 0.05, 0.3, 'B')]:
+        a = PGAnnotation(label, begin, end)
+        a.speaker = speaker
+        at.add(a)
+    at.optimize_lookups()
+    assert [x.label for x in at] == ['a', 'd', 'b', 'c']
+    assert at.lookup(-0.01) is None
+    assert at.lookup(0.1).label == 'a'
+    assert at.lookup(0.15).label == 'd'
+    assert at.lookup(0.15, speaker='A').label == 'b'
+    assert at.lookup(0.32, speaker='A').label == 'c'
+    assert at.lookup(0.5, speaker='A') is None
+    assert at.lookup(0.1, speaker='C') is None
+    assert [x.label for x in at.lookup_range(0.0, 0.2)] == ['a', 'd', 'b']
+    assert [x.label for x in at.lookup_range(0.0, 0.2, speaker='A')] == ['a', 'b']
+    assert at.lookup_range(0.0, 0.2, speaker='C') == []
+
+    a = PGAnnotation('e', 0.4, 0.5)
+    a.speaker = 'A'
+    at.add(a)
+    assert at.lookup(0.45, speaker='A').label == 'e'
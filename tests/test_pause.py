@@ -153,3 +153,20 @@ def test_buckeye_pause(graph_db, buckeye_test_dir):
         parser = inspect_buckeye(word_path)
         c.load(parser, word_path)
         c.encode_pauses('^[<{].*$')
+
+
+def test_remove_discourse_with_pauses(graph_db, buckeye_test_dir):
+    from polyglotdb.io import inspect_buckeye
+    import os
+    with CorpusContext('discourse_buckeye_remove', **graph_db) as c:
+        c.reset()
+        word_path = os.path.join(buckeye_test_dir, 'test.words')
+        parser = inspect_buckeye(word_path)
+        c.load(parser, word_path)
+        c.encode_pauses('^[<{].*$')
+        c.remove_discourse('test')
+        statement = '''MATCH (n:{})-[:spoken_in]->() RETURN count(n) AS number'''.format(c.cypher_safe_name)
+        assert c.execute_cypher(statement).single()['number'] == 0
+        assert c.words == []
+        assert c.phones == []
+        assert c.speakers == []
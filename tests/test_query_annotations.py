@@ -45,6 +45,43 @@ def test_speaker_split_queries(overlapped_config):
         assert all(x['speaker_name'] == 'Speaker 2' for x in results)
 
 
+def test_split_queries_share_statement(overlapped_config):
+    with CorpusContext(overlapped_config) as g:
+        q = g.query_graph(g.word).filter(g.word.label == 'this')
+        q = q.columns(g.word.speaker.name.column_name('speaker_name'))
+        queries = list(q.split_queries())
+        assert len(queries) == 2
+        assert len(set(x.cypher() for x in queries)) == 1
+        assert [x.cypher_params()['node_Speaker_name'] for x in queries] == ['Speaker 1', 'Speaker 2']
+
+        other = g.query_graph(g.word).filter(g.word.label == 'that')
+        other = other.columns(g.word.speaker.name.column_name('speaker_name'))
+        assert other.fingerprint() == q.fingerprint()
+        assert other.cypher() == q.cypher()
+
+        other = other.columns(g.word.begin)
+        assert other.fingerprint() != q.fingerprint()
+
+
+def test_split_queries_concurrent(overlapped_config, tmpdir):
+    with CorpusContext(overlapped_config) as g:
+        q = g.query_graph(g.word).filter(g.word.label == 'this')
+        q = q.columns(g.word.speaker.name.column_name('speaker_name'), g.word.begin.column_name('begin'))
+        expected = [(x['speaker_name'], x['begin']) for x in q.all()]
+        sequential_path = str(tmpdir.join('sequential.csv'))
+        q.to_csv(sequential_path)
+
+        g.config.query_jobs = 2
+        try:
+            assert [(x['speaker_name'], x['begin']) for x in q.all()] == expected
+            concurrent_path = str(tmpdir.join('concurrent.csv'))
+            q.to_csv(concurrent_path)
+        finally:
+            g.config.query_jobs = 1
+        with open(sequential_path) as f, open(concurrent_path) as f2:
+            assert f.read() == f2.read()
+
+
 def test_basic_query(timed_config):
     with CorpusContext(timed_config) as g:
         q = g.query_graph(g.word).filter(g.word.label == 'are')
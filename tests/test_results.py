@@ -2,6 +2,8 @@ import pytest
 import os
 
 from polyglotdb import CorpusContext
+from polyglotdb.query.base.results import BaseRecord, column_index
+from polyglotdb.query.annotations.results import AnnotationRecord
 
 
 def test_encode_class(acoustic_utt_config):
@@ -18,3 +20,120 @@ def test_encode_class(acoustic_utt_config):
         assert (second_twenty == results.previous(40))
 
         assert (len(results) == 203)
+
+
+def test_max_cache(acoustic_utt_config):
+    with CorpusContext(acoustic_utt_config) as g:
+        q = g.query_graph(g.phone).columns(g.phone.label)
+        results = q.all(max_cache=20)
+        assert len(results.next(20)) == 20
+        with pytest.raises(IndexError):
+            results[20]
+        with pytest.raises(TypeError):
+            len(results)
+        assert len(results.cache) == 20
+        assert len(list(results)) == 203
+        assert len(q.all(max_cache=500)) == 203
+
+
+def test_streaming_to_csv(acoustic_utt_config, export_test_dir):
+    path = os.path.join(export_test_dir, 'streamed_phones.csv')
+    with CorpusContext(acoustic_utt_config) as g:
+        q = g.query_graph(g.phone).columns(g.phone.label.column_name('label'))
+        q = q.order_by(g.phone.begin)
+        expected = [x['label'] for x in q.all()]
+        q.to_csv(path)
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert lines[0] == 'label'
+    assert lines[1:] == expected
+
+
+def test_records():
+    index = column_index(['label', 'begin'])
+    record = BaseRecord(('aa', 0.5), index)
+    other = BaseRecord(('b', 1.0), index)
+    assert record['label'] == 'aa'
+    assert other['begin'] == 1.0
+    assert record.columns == ['label', 'begin']
+    with pytest.raises(KeyError):
+        record['end']
+
+    index = column_index(['label', 'F0'])
+    record = AnnotationRecord(['aa', None], index)
+    record.add_acoustic('F0', 100)
+    assert record['F0'] == 100
+    assert record.track_columns == []
+    assert len(record.track) == 0
+
+
+def test_to_parquet(acoustic_utt_config, export_test_dir):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = os.path.join(export_test_dir, 'phones.parquet')
+    with CorpusContext(acoustic_utt_config) as g:
+        q = g.query_graph(g.phone).columns(g.phone.label.column_name('label'),
+                                           g.phone.begin.column_name('begin'))
+        q = q.order_by(g.phone.begin)
+        expected = [(x['label'], x['begin']) for x in q.all()]
+        q.all(max_cache=0, stream=True).to_parquet(path, batch_size=50)
+    table = pq.read_table(path)
+    assert table.schema.field('begin').type == 'double'
+    assert list(zip(table.column('label').to_pylist(), table.column('begin').to_pylist())) == expected
+
+
+def test_record_batches():
+    pa = pytest.importorskip('pyarrow')
+    from polyglotdb.io.exporters.arrow import record_batches, results_to_table
+    rows = [{'label': 'aa', 'begin': 0, 'F0': 100}, {'label': 'b', 'begin': 0.5, 'F0': None}]
+    batches = list(record_batches(rows, ['label', 'begin', 'F0'], {'begin': float}, batch_size=1))
+    assert len(batches) == 2
+    assert batches[0].schema == batches[1].schema
+    assert batches[0].schema.field('label').type == pa.dictionary(pa.int32(), pa.string())
+    assert batches[0].schema.field('F0').type == pa.float64()
+    assert results_to_table(rows, ['label', 'begin', 'F0']).column('F0').to_pylist() == [100.0, None]
+    assert results_to_table([], ['label']).num_rows == 0
+    table = results_to_table([{'x': None}] * 3 + [{'x': 1.5}], ['x'], batch_size=2)
+    assert table.column('x').to_pylist() == [None, None, None, 1.5]
+    assert table.schema.field('x').type == pa.float64()
+    with pytest.raises(ValueError):
+        results_to_table([{'x': 1}, {'x': 1.5}], ['x'], {'x': int})
+    with pytest.raises(ValueError):
+        results_to_table([{'x': 'a'}, {'x': 1}], ['x'])
+
+
+def test_record_batches_before_input_is_read():
+    pa = pytest.importorskip('pyarrow')
+    from polyglotdb.io.exporters.arrow import record_batches, results_to_table
+    read = []
+
+    def rows():
+        for i in range(50000):
+            read.append(i)
+            yield {'a': i, 'b': None}
+
+    batches = record_batches(rows(), ['a', 'b'], batch_size=1000)
+    batch = next(batches)
+    assert batch.num_rows == 1000
+    assert len(read) <= 2000
+    assert batch.schema.field('b').type == pa.dictionary(pa.int32(), pa.string())
+    with pytest.raises(ValueError):
+        results_to_table([{'x': None}] * 4 + [{'x': 1.5}], ['x'], batch_size=2)
+
+
+def test_column_type():
+    from polyglotdb.structure import Hierarchy
+    from polyglotdb.query.base.func import Count, Average, Max
+    from polyglotdb.query.base.results import column_type
+    h = Hierarchy({'phone': 'word', 'word': None}, corpus_name='test')
+    h.token_properties['phone'] = {('label', str), ('begin', float), ('end', float)}
+    h.type_properties['phone'] = {('label', str)}
+    h.token_properties['word'] = {('label', str), ('begin', float), ('end', float)}
+    h.type_properties['word'] = {('label', str), ('frequency', float)}
+    assert column_type(h.word.frequency) == float
+    assert column_type(h.word.phone.count) == int
+    assert column_type(h.word.phone.rate) == float
+    assert column_type(h.word.phone.label) == (list, str)
+    assert column_type(h.word.phone.duration) == (list, float)
+    assert column_type(Count()) == int
+    assert column_type(Average(h.word.frequency)) == float
+    assert column_type(Max(h.word.frequency)) == float
@@ -14,3 +14,16 @@ def test_generate_hierarchy_subannotations(subannotation_config):
         h = c.generate_hierarchy()
         assert (h._data == c.hierarchy._data)
         assert (h.subannotations['phone'] == c.hierarchy.subannotations['phone'])
+
+
+def test_hierarchy_merge():
+    from polyglotdb.structure import Hierarchy
+    h = Hierarchy({'phone': 'syllable', 'syllable': 'word', 'word': None})
+    h.type_properties['word'] = {('label', str), ('frequency', float)}
+    other = Hierarchy({'phone': 'word', 'word': None, 'utterance': None})
+    other.type_properties['word'] = {('label', str), ('transcription', str)}
+    other.token_properties['phone'] = {('label', str)}
+    h.merge(other)
+    assert h._data == {'phone': 'syllable', 'syllable': 'word', 'word': None, 'utterance': None}
+    assert h.type_properties['word'] == {('label', str), ('frequency', float), ('transcription', str)}
+    assert h.token_properties['phone'] == {('label', str)}